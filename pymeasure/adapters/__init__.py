@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 import logging
+from importlib import import_module
 
 from .adapter import Adapter, FakeAdapter
 
@@ -32,18 +33,25 @@ from pymeasure.adapters.telnet import TelnetAdapter
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-try:
-    from pymeasure.adapters.visa import VISAAdapter
-except ImportError:
-    log.warning("PyVISA library could not be loaded")
-
-try:
-    from pymeasure.adapters.serial import SerialAdapter
-    from pymeasure.adapters.prologix import PrologixAdapter
-except ImportError:
-    log.warning("PySerial library could not be loaded")
-
-try:
-    from pymeasure.adapters.vxi11 import VXI11Adapter
-except ImportError:
-    log.warning("VXI-11 library could not be loaded")
+# Adapters relying on third-party communication libraries (PyVISA, PySerial, python-vxi11) are
+# imported on first access, such that importing pymeasure does not pay for loading them.
+_lazy_adapters = {
+    "VISAAdapter": "visa",
+    "SerialAdapter": "serial",
+    "PrologixAdapter": "prologix",
+    "VXI11Adapter": "vxi11",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _lazy_adapters[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    adapter = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = adapter
+    return adapter
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_adapters))
@@ -23,11 +23,41 @@
 #
 
 import logging
+import time
+from functools import partial
 from warnings import warn
 
 import numpy as np
+from contextlib import nullcontext
 from copy import copy
-from pyvisa.util import to_ieee_block, to_hp_block, to_binary_block
+
+
+def wait_until(condition, timeout=25, delay=0.1, should_stop=None,
+               message="Waiting timed out."):
+    """Block until `condition` returns a true value, polling it at increasing intervals.
+
+    The first interval is 1 ms (or `delay`, if shorter) and it doubles with every poll up to
+    `delay`, such that short waits return quickly without long ones loading the connection.
+
+    :param condition: Callable without arguments, which is polled.
+    :param timeout: Timeout duration in seconds.
+    :param delay: Maximum time delay between two polls in seconds.
+    :param should_stop: Optional callable returning True to stop waiting early.
+    :param message: Message of the :code:`TimeoutError`.
+    :returns: True if the condition is met, False if `should_stop` returned True before.
+    :raises TimeoutError: If the condition is not met within the timeout.
+    """
+    stop = time.perf_counter() + timeout
+    interval = min(1e-3, delay)
+    while not condition():
+        if should_stop is not None and should_stop():
+            return False
+        remaining = stop - time.perf_counter()
+        if remaining <= 0:
+            raise TimeoutError(message)
+        time.sleep(min(interval, remaining))
+        interval = min(2 * interval, delay)
+    return True
 
 
 class Adapter:
@@ -46,8 +76,17 @@ class Adapter:
 
     :param log: Parent logger of the 'Adapter' logger.
     :param \\**kwargs: Keyword arguments just to be cooperative.
+
+    :ivar bus: :class:`~pymeasure.adapters.bus.Bus` arbitrating the access to a connection
+        shared by several adapters, or ``None``.
+
+    The blocking methods have awaitable counterparts (e.g. :meth:`read_async`), which run
+    them in a worker thread of the adapter, see :meth:`run_async`.
     """
 
+    bus = None
+    _executor = None
+
     def __init__(self, preprocess_reply=None, log=None, **kwargs):
         super().__init__(**kwargs)
         self.preprocess_reply = preprocess_reply
@@ -68,6 +107,9 @@ class Adapter:
 
     def close(self):
         """Close the connection."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         if self.connection is not None:
             self.connection.close()
 
@@ -84,7 +126,8 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         """
         self.log.debug("WRITE:%s", command)
-        self._write(command, **kwargs)
+        with self.transaction():
+            self._write(command, **kwargs)
 
     def write_bytes(self, content, **kwargs):
         """Write the bytes `content` to the instrument.
@@ -95,7 +138,8 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         """
         self.log.debug("WRITE:%s", content)
-        self._write_bytes(content, **kwargs)
+        with self.transaction():
+            self._write_bytes(content, **kwargs)
 
     def read(self, **kwargs):
         """Read up to (excluding) `read_termination` or the whole read buffer.
@@ -105,7 +149,8 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns str: ASCII response of the instrument (excluding read_termination).
         """
-        read = self._read(**kwargs)
+        with self.transaction():
+            read = self._read(**kwargs)
         self.log.debug("READ:%s", read)
         return read
 
@@ -120,10 +165,57 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns bytes: Bytes response of the instrument (including termination).
         """
-        read = self._read_bytes(count, break_on_termchar, **kwargs)
+        with self.transaction():
+            read = self._read_bytes(count, break_on_termchar, **kwargs)
         self.log.debug("READ:%s", read)
         return read
 
+    async def write_async(self, command, **kwargs):
+        """Write a string command to the instrument without blocking the event loop,
+        see :meth:`write`."""
+        await self.run_async(self.write, command, **kwargs)
+
+    async def write_bytes_async(self, content, **kwargs):
+        """Write the bytes `content` to the instrument without blocking the event loop,
+        see :meth:`write_bytes`."""
+        await self.run_async(self.write_bytes, content, **kwargs)
+
+    async def read_async(self, **kwargs):
+        """Read up to the termination character without blocking the event loop,
+        see :meth:`read`."""
+        return await self.run_async(self.read, **kwargs)
+
+    async def read_bytes_async(self, count=-1, break_on_termchar=False, **kwargs):
+        """Read a certain number of bytes without blocking the event loop,
+        see :meth:`read_bytes`."""
+        return await self.run_async(self.read_bytes, count, break_on_termchar, **kwargs)
+
+    def run_async(self, function, *args, **kwargs):
+        """Run a blocking `function` in the worker thread of the adapter and return an
+        awaitable (an :code:`asyncio.Future`) of its result.
+
+        Each adapter has a single worker thread, such that the messages of calls awaited
+        concurrently on the same connection do not interleave, while different adapters
+        communicate in parallel. Must be called from within a running event loop.
+        """
+        # The caller runs an event loop, so asyncio is loaded already
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix=self.__class__.__name__)
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(function, *args, **kwargs))
+
+    def transaction(self):
+        """Return a context manager reserving the connection for a sequence of messages.
+
+        If the connection is shared with other adapters, the :attr:`bus` is reserved for the
+        current thread, such that the messages of other threads cannot interleave.
+        """
+        return nullcontext() if self.bus is None else self.bus
+
     # Methods to implement in the subclasses.
     def _write(self, command, **kwargs):
         """Write string to the instrument. Implement in subclass."""
@@ -145,6 +237,17 @@ class Adapter:
         """Flush and discard the input buffer. Implement in subclass."""
         raise NotImplementedError("Adapter class has not implemented input flush.")
 
+    def wait_for_srq(self, timeout=25, delay=0.1, should_stop=None):
+        """Block until the device requests service (SRQ). Implement in subclass.
+
+        :param timeout: Timeout duration in seconds.
+        :param delay: Maximum time delay between checking SRQ (or `should_stop`) in seconds.
+        :param should_stop: Optional callable returning True to stop waiting early.
+        :returns: True if service has been requested, False if `should_stop` returned True.
+        :raises TimeoutError: If no service has been requested within the timeout.
+        """
+        raise NotImplementedError("Adapter class has not implemented waiting for SRQ.")
+
     # Deprecated methods.
     def ask(self, command):
         """ Write the command to the instrument and returns the resulting
@@ -223,13 +326,99 @@ class Adapter:
         :param int header_bytes: Number of bytes to ignore in header.
         :param int termination_bytes: Number of bytes to strip at end of message or None.
         :param dtype: The NumPy data type to format the values with.
-        :param \\**kwargs: Further arguments for the NumPy fromstring method.
-        :returns: NumPy array of values
+        :param \\**kwargs: Further arguments for the NumPy frombuffer method, or for the
+            fromstring method, if a text separator `sep` is given.
+        :returns: NumPy array of values.
         """
         binary = self.read_bytes(-1)
         # header = binary[:header_bytes]
-        data = binary[header_bytes:termination_bytes]
-        return np.fromstring(data, dtype=dtype, **kwargs)
+        if kwargs.get("sep"):
+            return np.fromstring(binary[header_bytes:termination_bytes], dtype=dtype, **kwargs)
+        # Copy the data once into a writable buffer, as users may modify the values in place
+        data = bytearray(memoryview(binary)[header_bytes:termination_bytes])
+        return np.frombuffer(data, dtype=dtype, **kwargs)
+
+    def read_binary_block(self, dtype=np.uint8, is_big_endian=False, out=None,
+                          termination_bytes=1, **kwargs):
+        """Read an IEEE 488.2 binary block and return its values as a NumPy array.
+
+        Of a definite length block (``#<number of digits><length><data>``, e.g. ``#15hello``)
+        exactly the announced number of bytes is read, directly into the array, without
+        waiting for a timeout or a termination character.
+        An indefinite length block (``#0<data>``) ends with the message, so it is read until a
+        timeout (or the end of a VISA message) and a trailing line feed is removed.
+        Bytes preceding the ``#`` (e.g. ``DAT1,``) are skipped.
+
+        :param dtype: The NumPy data type of the values.
+        :param bool is_big_endian: Whether the values are transmitted in big endian byte order.
+        :param out: Contiguous NumPy array of `dtype` to read the values into, e.g. to reuse
+            one buffer for many transfers. It has to be large enough for the block.
+        :param int termination_bytes: Number of bytes following a definite length block
+            (usually a line feed), which are read and discarded.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns: NumPy array of the values, a view into `out`, if given.
+        """
+        dtype = np.dtype(dtype).newbyteorder(">" if is_big_endian else "<")
+        with self.transaction():
+            length = self._read_block_header(**kwargs)
+            if length is None:
+                data = self._read_bytes(-1, False, **kwargs)
+                data = data[:-1] if data.endswith(b"\n") else data
+                values = np.frombuffer(data, dtype=dtype)
+                if out is not None:
+                    out[:values.size] = values
+                    values = out[:values.size]
+                else:
+                    values = values.copy()
+            else:
+                if length % dtype.itemsize:
+                    raise ValueError(f"Block length {length} is not a multiple of the size "
+                                     f"of {dtype}.")
+                count = length // dtype.itemsize
+                if out is None:
+                    values = np.empty(count, dtype=dtype)
+                elif out.dtype != dtype or out.size < count or not out.flags.c_contiguous:
+                    raise ValueError(f"`out` has to be a contiguous array of at least {count} "
+                                     f"values of {dtype}.")
+                else:
+                    values = out.reshape(-1)[:count]
+                self._read_bytes_into(values.view(np.uint8), **kwargs)
+                if termination_bytes:
+                    self._read_bytes(termination_bytes, False, **kwargs)
+        self.log.debug("READ:binary block of %d values", values.size)
+        return values
+
+    def _read_block_header(self, **kwargs):
+        """Read the header of an IEEE 488.2 binary block, skipping any preceding bytes.
+
+        :returns: Length of the data in bytes, or None for an indefinite length block.
+        """
+        while (char := self._read_bytes(1, False, **kwargs)) != b"#":
+            if not char:
+                raise TimeoutError("No binary block received.")
+        digits = bytearray(1)
+        self._read_bytes_into(digits, **kwargs)
+        if digits == b"0":
+            return None
+        length = bytearray(int(digits))
+        self._read_bytes_into(length, **kwargs)
+        return int(length)
+
+    def _read_bytes_into(self, buffer, **kwargs):
+        """Read exactly as many bytes as fit into the writable bytes-like `buffer`.
+
+        Subclasses may override it to read into the buffer without an intermediate copy.
+
+        :raises TimeoutError: If the connection does not deliver enough bytes.
+        """
+        with memoryview(buffer) as view:
+            filled = 0
+            while filled < len(view):
+                data = self._read_bytes(len(view) - filled, False, **kwargs)
+                if not data:
+                    raise TimeoutError(f"Received only {filled} of {len(view)} bytes.")
+                view[filled:filled + len(data)] = data
+                filled += len(data)
 
     def _format_binary_values(self, values, datatype='f', is_big_endian=False, header_fmt="ieee"):
         """Format values in binary format, used internally in :meth:`Adapter.write_binary_values`.
@@ -241,6 +430,8 @@ class Adapter:
         :return: binary string.
         :rtype: bytes
         """
+        from pyvisa.util import to_ieee_block, to_hp_block, to_binary_block
+
         if header_fmt == "ieee":
             block = to_ieee_block(values, datatype, is_big_endian)
         elif header_fmt == "hp":
@@ -0,0 +1,142 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+import threading
+from collections import deque
+from time import perf_counter
+
+
+class Bus:
+    """Arbitrate the access of several adapters to one shared connection.
+
+    Adapters sharing a connection (for example the siblings created by
+    :meth:`PrologixAdapter.gpib() <pymeasure.adapters.PrologixAdapter.gpib>`)
+    share one bus. A thread has to reserve the bus before communicating,
+    which prevents different threads from interleaving their messages.
+    Entering the bus as a context manager reserves it, leaving releases it.
+    The reservation is reentrant, such that a whole transaction (a write and
+    the corresponding read) can reserve the bus while the single messages
+    reserve it again.
+
+    Waiting threads are served in the order of their requests (first in,
+    first out), such that no instrument can starve the others.
+
+    .. code::
+
+        with adapter.bus:
+            adapter.write("VOLT?")
+            voltage = adapter.read()
+
+    :ivar address: Address of the device currently selected on the bus, used by
+        adapters to skip redundant address changes. ``None`` means unknown.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._waiting = deque()
+        self._owner = None
+        self._depth = 0
+        self.address = None
+        self.reset_metrics()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def acquire(self):
+        """Reserve the bus for the current thread, waiting for its turn if necessary."""
+        thread = threading.get_ident()
+        with self._condition:
+            if self._owner == thread:
+                self._depth += 1
+                return
+            start = perf_counter()
+            if self._owner is not None or self._waiting:
+                ticket = object()
+                self._waiting.append(ticket)
+                self._max_queue_depth = max(self._max_queue_depth, len(self._waiting))
+                while self._owner is not None or self._waiting[0] is not ticket:
+                    self._condition.wait()
+                self._waiting.popleft()
+            self._owner = thread
+            self._depth = 1
+            self._acquired_at = perf_counter()
+            self._wait_time += self._acquired_at - start
+            self._requests += 1
+
+    def release(self):
+        """Release the reservation of the bus by the current thread."""
+        with self._condition:
+            if self._owner != threading.get_ident():
+                raise RuntimeError("Cannot release a bus reserved by another thread.")
+            self._depth -= 1
+            if self._depth:
+                return
+            self._busy_time += perf_counter() - self._acquired_at
+            self._owner = None
+            self._condition.notify_all()
+
+    @property
+    def queue_depth(self):
+        """Get the number of threads waiting for the bus (int)."""
+        return len(self._waiting)
+
+    @property
+    def metrics(self):
+        """Get the usage statistics of the bus since the last :meth:`reset_metrics` (dict).
+
+        - ``requests``: number of reservations of the bus,
+        - ``queue_depth``: number of threads currently waiting for the bus,
+        - ``max_queue_depth``: maximum number of threads which waited at once,
+        - ``wait_time``: total time in s threads waited for the bus,
+        - ``busy_time``: total time in s the bus was reserved,
+        - ``utilisation``: fraction of the elapsed time the bus was reserved.
+        """
+        with self._condition:
+            now = perf_counter()
+            busy_time = self._busy_time
+            if self._owner is not None:
+                busy_time += now - self._acquired_at
+            elapsed = now - self._metrics_start
+            return {
+                "requests": self._requests,
+                "queue_depth": len(self._waiting),
+                "max_queue_depth": self._max_queue_depth,
+                "wait_time": self._wait_time,
+                "busy_time": busy_time,
+                "utilisation": busy_time / elapsed if elapsed > 0 else 0.,
+            }
+
+    def reset_metrics(self):
+        """Reset the usage statistics of the bus."""
+        with self._condition:
+            self._metrics_start = perf_counter()
+            if self._owner is not None:
+                self._acquired_at = self._metrics_start
+            self._requests = 0
+            self._max_queue_depth = 0
+            self._wait_time = 0.
+            self._busy_time = 0.
@@ -21,10 +21,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
-import time
 from warnings import warn
 
 from pymeasure.adapters import VISAAdapter
+from pymeasure.adapters.adapter import wait_until
 
 
 class PrologixAdapter(VISAAdapter):
@@ -36,6 +36,9 @@ class PrologixAdapter(VISAAdapter):
     itself and the GPIB address of the instrument to be communicated to.
     Connection sharing is achieved by using the :meth:`.gpib`
     method to spawn new PrologixAdapters for different GPIB addresses.
+    All these adapters share one :attr:`~pymeasure.adapters.Adapter.bus`, which
+    serializes the communication of different threads and remembers the currently
+    addressed instrument, such that ``++addr`` is only sent if the address changes.
 
     :param resource_name: A
         `VISA resource string <https://pyvisa.readthedocs.io/en/latest/introduction/names.html>`__
@@ -201,7 +204,9 @@ class PrologixAdapter(VISAAdapter):
         The process takes about 5 seconds. All input received during this time
         is ignored and the connection is closed.
         """
-        self.write('++rst')
+        with self.bus:
+            self.write('++rst')
+            self.bus.address = None
 
     def ask(self, command):
         """ Ask the Prologix controller.
@@ -218,16 +223,27 @@ class PrologixAdapter(VISAAdapter):
     def write(self, command, **kwargs):
         """Write a string command to the instrument appending `write_termination`.
 
-        If the GPIB address in :attr:`address` is defined, it is sent first.
+        If the GPIB address in :attr:`address` is defined and differs from the address
+        selected last on the bus, it is sent first.
 
         :param str command: Command string to be sent to the instrument
             (without termination).
         :param kwargs: Keyword arguments for the connection itself.
         """
         # Overrides write instead of _write in order to ensure proper logging
-        if self.address is not None and not command.startswith("++"):
+        with self.bus:
+            if command.startswith("++"):
+                if command.startswith("++addr"):
+                    self.bus.address = None  # selected manually, the new address is unknown
+            else:
+                self._select_address(**kwargs)
+            super().write(command, **kwargs)
+
+    def _select_address(self, **kwargs):
+        """Address the instrument at :attr:`address`, unless it is selected already."""
+        if self.address is not None and self.bus.address != self.address:
             super().write("++addr %d" % self.address, **kwargs)
-        super().write(command, **kwargs)
+            self.bus.address = self.address
 
     def _format_binary_values(self, values, datatype='f', is_big_endian=False, header_fmt="ieee"):
         """Format values in binary format, used internally in :meth:`.write_binary_values`.
@@ -266,10 +282,9 @@ class PrologixAdapter(VISAAdapter):
         :param kwargs: Key-word arguments to pass onto :meth:`._format_binary_values`
         :returns: number of bytes written
         """
-        if self.address is not None:
-            address_command = "++addr %d\n" % self.address
-            self.write(address_command)
-        super().write_binary_values(command, values, "\n", **kwargs)
+        with self.bus:
+            self._select_address()
+            super().write_binary_values(command, values, "\n", **kwargs)
 
     def _read(self, prologix=False, **kwargs):
         """Read up to (excluding) `read_termination` or the whole read buffer.
@@ -279,6 +294,7 @@ class PrologixAdapter(VISAAdapter):
         :returns str: ASCII response of the instrument (excluding read_termination).
         """
         if not prologix:
+            self._select_address()
             self.write("++read eoi")
         return super()._read()
 
@@ -294,22 +310,37 @@ class PrologixAdapter(VISAAdapter):
         return PrologixAdapter(self, address, **kwargs)
 
     def _check_for_srq(self):
-        # it was int(self.ask("++srq"))
-        self.write("++srq")
-        return int(self.read())
+        """Return True if service is requested by the device at :attr:`address`.
 
-    def wait_for_srq(self, timeout=25, delay=0.1):
-        """ Blocks until a SRQ, and leaves the bit high
+        ``++srq`` reports the SRQ line, which any device on the bus may assert. Therefore the
+        device at :attr:`address` (if defined) is serial polled with ``++spoll``, which clears
+        its request, to check that the request is its own.
+        """
+        with self.transaction():
+            self.write("++srq")
+            if not int(self.read(prologix=True)):
+                return False
+            if self.address is None:
+                return True
+            self.write(f"++spoll {self.address:d}")
+            return bool(int(self.read(prologix=True)) & 0x40)
+
+    def wait_for_srq(self, timeout=25, delay=0.1, should_stop=None):
+        """ Blocks until the device requests service (SRQ).
+
+        The SRQ line is polled with ``++srq`` at increasing intervals, starting
+        at 1 ms and doubling up to `delay`. If :attr:`address` is defined, requests of other
+        devices on the bus are ignored, and the request of this device is cleared by the
+        serial poll, otherwise the SRQ line is left high.
 
         :param timeout: Timeout duration in seconds.
-        :param delay: Time delay between checking SRQ in seconds.
+        :param delay: Maximum time delay between checking SRQ in seconds.
+        :param should_stop: Optional callable returning True to stop waiting early.
+        :returns: True if service has been requested, False if `should_stop` returned True.
         :raises TimeoutError: "Waiting for SRQ timed out."
         """
-        stop = time.perf_counter() + timeout
-        while self._check_for_srq() != 1:
-            if time.perf_counter() > stop:
-                raise TimeoutError("Waiting for SRQ timed out.")
-            time.sleep(delay)
+        return wait_until(self._check_for_srq, timeout=timeout, delay=delay,
+                          should_stop=should_stop, message="Waiting for SRQ timed out.")
 
     def __repr__(self):
         if self.address is not None:
@@ -44,13 +44,17 @@ class SerialAdapter(Adapter):
 
     :param write_termination: String appended to messages before writing them.
     :param read_termination: String expected at end of read message and removed.
+    :param idle_timeout: Time in s without new data, after which reading the whole read buffer
+        (:code:`read_bytes(-1)`) stops once data has been received. None uses the connection's
+        timeout.
     :param \\**kwargs: Any valid key-word argument for serial.Serial
     """
 
     def __init__(self, port, preprocess_reply=None,
-                 write_termination="", read_termination="",
+                 write_termination="", read_termination="", idle_timeout=None,
                  **kwargs):
         super().__init__(preprocess_reply=preprocess_reply)
+        self.idle_timeout = idle_timeout
         if isinstance(port, serial.SerialBase):
             self.connection = port
         else:
@@ -112,16 +116,44 @@ class SerialAdapter(Adapter):
     def _read_bytes_until_timeout(self, chunk_size=256, **kwargs):
         """Read from the serial until a timeout occurs, regardless of the number of bytes.
 
-        :chunk_size: The number of bytes attempted to in a single transaction.
-            Multiple of these transactions will occur.
+        The bytes are read into a preallocated buffer, which grows as needed. After the
+        first chunk the connection's timeout is replaced by :attr:`idle_timeout`.
+
+        :chunk_size: The minimum number of bytes attempted to read in a single transaction.
+            All the bytes waiting in the input buffer are read at once, if there are more.
         """
         # `Serial.readlines()` has an unpredictable timeout, see PR #866
-        data = bytes()
-        while True:
-            chunk = self.connection.read(chunk_size, **kwargs)
-            data += chunk
-            if len(chunk) < chunk_size:  # If fewer bytes got returned, we had a timeout
-                return data
+        buffer = bytearray(chunk_size)
+        size = 0
+        timeout = self.connection.timeout
+        try:
+            while True:
+                count = max(self.connection.in_waiting, chunk_size)
+                if size + count > len(buffer):
+                    buffer.extend(bytes(max(size + count - len(buffer), len(buffer))))
+                with memoryview(buffer) as view:
+                    received = self.connection.readinto(view[size:size + count])
+                size += received
+                if received < count:  # If fewer bytes got returned, we had a timeout
+                    del buffer[size:]
+                    return bytes(buffer)
+                if self.idle_timeout is not None:
+                    self.connection.timeout = self.idle_timeout
+        finally:
+            self.connection.timeout = timeout
+
+    def _read_bytes_into(self, buffer, **kwargs):
+        """Read exactly as many bytes as fit into the writable bytes-like `buffer`.
+
+        :raises TimeoutError: If the connection does not deliver enough bytes.
+        """
+        with memoryview(buffer) as view:
+            filled = 0
+            while filled < len(view):
+                received = self.connection.readinto(view[filled:], **kwargs)
+                if not received:
+                    raise TimeoutError(f"Received only {filled} of {len(view)} bytes.")
+                filled += received
 
     def flush_read_buffer(self):
         """Flush and discard the input buffer."""
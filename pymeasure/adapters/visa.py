@@ -23,12 +23,15 @@
 #
 
 import logging
+import time
+from contextlib import contextmanager
 from warnings import warn
 
 import pyvisa
 import numpy as np
 
 from .adapter import Adapter
+from .bus import Bus
 from .protocol import ProtocolAdapter
 
 log = logging.getLogger(__name__)
@@ -41,6 +44,9 @@ class VISAAdapter(Adapter):
 
     The workhorse of our library, used by most instruments.
 
+    If another VISAAdapter is given as `resource_name`, its connection is reused and both adapters
+    share the same :attr:`~pymeasure.adapters.Adapter.bus`, which serializes their communication.
+
     :param resource_name: A
         `VISA resource string <https://pyvisa.readthedocs.io/en/latest/introduction/names.html>`__
         or GPIB address integer that identifies the target of the connection
@@ -58,6 +64,9 @@ class VISAAdapter(Adapter):
             Implement it in the instrument's `wait_for` method instead.
 
     :param log: Parent logger of the 'Adapter' logger.
+    :param idle_timeout: Time in s without new data, after which reading the whole read buffer
+        (:code:`read_bytes(-1)`) stops once data has been received. None uses the connection's
+        timeout.
     :param \\**kwargs: Keyword arguments for configuring the PyVISA connection.
 
     :Kwargs:
@@ -84,24 +93,27 @@ class VISAAdapter(Adapter):
     """
 
     def __init__(self, resource_name, visa_library='', preprocess_reply=None,
-                 query_delay=0, log=None, **kwargs):
+                 query_delay=0, log=None, idle_timeout=None, **kwargs):
         super().__init__(preprocess_reply=preprocess_reply, log=log)
+        self.idle_timeout = idle_timeout
         if query_delay:
             warn(("Parameter `query_delay` is deprecated. "
                   "Implement in Instrument's `wait_for` instead."),
                  FutureWarning)
             kwargs.setdefault("query_delay", query_delay)
         self.query_delay = query_delay
+        self.bus = Bus()
         if isinstance(resource_name, ProtocolAdapter):
             self.connection = resource_name
             self.connection.write_raw = self.connection.write_bytes
             self.read_bytes = self.connection.read_bytes
             return
         elif isinstance(resource_name, VISAAdapter):
-            # Allow to reuse the connection.
+            # Allow to reuse the connection, arbitrated by the common bus.
             self.resource_name = getattr(resource_name, "resource_name", None)
             self.connection = resource_name.connection
-            self.manager = resource_name.manager
+            self.manager = getattr(resource_name, "manager", None)
+            self.bus = resource_name.bus
             self.query_delay = resource_name.query_delay
             return
         elif isinstance(resource_name, int):
@@ -188,14 +200,43 @@ class VISAAdapter(Adapter):
             # pyvisa's `read_raw` reads until newline, if no termination_character defined
             # and if not configured to stop at a termination lane etc.
             # see https://github.com/pyvisa/pyvisa/issues/728
-            result = bytearray()
+            return self._read_bytes_until_timeout(**kwargs)
+
+    def _read_bytes_until_timeout(self, **kwargs):
+        """Read from the connection until no new data arrives, regardless of the number of bytes.
+
+        The data is read in chunks into a growing buffer. The first chunk is awaited with the
+        connection's timeout, afterwards the reading stops if no new data arrives within
+        :attr:`idle_timeout`.
+        VISA discards the data of a read interrupted by a timeout, therefore a chunk must not
+        wait for more data than available: a VISA read returns early at the end of a message
+        (e.g. GPIB EOI, the end of a VXI-11, HiSLIP or USBTMC message), such that these
+        resources are read in chunks of the connection's `chunk_size`. Serial connections have
+        no such END indicator, but report the number of bytes waiting, which are read at once.
+        """
+        result = bytearray()
+        timeout = self.connection.timeout
+        visalib, session = self.connection.visalib, self.connection.session
+        try:
             while True:
                 try:
-                    result.extend(self.connection.read_bytes(1))
+                    count = max(self.connection.bytes_in_buffer, 1)
+                except (AttributeError, pyvisa.errors.VisaIOError):
+                    count = self.connection.chunk_size
+                try:
+                    chunk, _ = visalib.read(session, count)
                 except pyvisa.errors.VisaIOError as exc:
                     if exc.error_code == pyvisa.constants.StatusCode.error_timeout:
                         return bytes(result)
                     raise
+                result += chunk
+                if self.idle_timeout is not None:
+                    idle_timeout = self.idle_timeout * 1000  # VISA uses ms
+                    if self.connection.timeout != idle_timeout:
+                        self.connection.timeout = idle_timeout
+        finally:
+            if self.connection.timeout != timeout:
+                self.connection.timeout = timeout
 
     def ask(self, command):
         """ Writes the command to the instrument and returns the resulting
@@ -243,16 +284,67 @@ class VISAAdapter(Adapter):
         self.connection.write(command)
         binary = self.connection.read_raw()
         # header = binary[:header_bytes]
-        data = binary[header_bytes:]
-        return np.fromstring(data, dtype=dtype)
+        data = bytearray(memoryview(binary)[header_bytes:])
+        return np.frombuffer(data, dtype=dtype)
 
-    def wait_for_srq(self, timeout=25, delay=0.1):
+    def wait_for_srq(self, timeout=25, delay=0.1, should_stop=None):
         """ Block until a SRQ, and leave the bit high
 
+        The VISA service request event is awaited in slices of `delay`, after each of
+        which `should_stop` is checked. A service request of another device on the bus
+        does not end the wait, as the status byte of this device is checked. A service
+        request raised before the call is detected by checking the status byte first.
+
         :param timeout: Timeout duration in seconds
-        :param delay: Time delay between checking SRQ in seconds
+        :param delay: Time delay between checking `should_stop` in seconds
+        :param should_stop: Optional callable returning True to stop waiting early
+        :returns: True if service has been requested, False if `should_stop` returned True
+        :raises TimeoutError: "Waiting for SRQ timed out."
+        :raises NotImplementedError: If the resource does not support service request events
+            (e.g. ASRL or TCPIP SOCKET resources).
         """
-        self.connection.wait_for_srq(timeout * 1000)
+        event = pyvisa.constants.EventType.service_request
+        mechanism = pyvisa.constants.EventMechanism.queue
+        with self._srq_not_supported():
+            if self.connection.stb & 0x40:
+                return True
+            self.connection.enable_event(event, mechanism)
+        try:
+            stop = time.perf_counter() + timeout
+            while True:
+                remaining = max(0., min(delay, stop - time.perf_counter()))
+                with self._srq_not_supported():
+                    response = self.connection.wait_on_event(event, int(remaining * 1000),
+                                                             capture_timeout=True)
+                if not response.timed_out and self.connection.stb & 0x40:
+                    return True
+                if should_stop is not None and should_stop():
+                    return False
+                if time.perf_counter() >= stop:
+                    raise TimeoutError("Waiting for SRQ timed out.")
+        finally:
+            self.connection.discard_events(event, mechanism)
+            self.connection.disable_event(event, mechanism)
+
+    _SRQ_NOT_SUPPORTED = {
+        pyvisa.constants.StatusCode.error_nonsupported_operation,
+        pyvisa.constants.StatusCode.error_invalid_event,
+        pyvisa.constants.StatusCode.error_nonsupported_mechanism,
+        pyvisa.constants.StatusCode.error_invalid_mechanism,
+    }
+
+    @contextmanager
+    def _srq_not_supported(self):
+        """Turn VISA errors of resources without service request support into
+        NotImplementedError, such that the caller may poll the status byte instead."""
+        try:
+            yield
+        except pyvisa.errors.VisaIOError as exc:
+            if exc.error_code in self._SRQ_NOT_SUPPORTED:
+                raise NotImplementedError(
+                    f"{self.connection.resource_name} does not support service requests."
+                ) from exc
+            raise
 
     def flush_read_buffer(self):
         """ Flush and discard the input buffer
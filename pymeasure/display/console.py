@@ -40,7 +40,7 @@ from ..log import console_log
 from .browser import BaseBrowserItem
 from .manager import BaseManager, Experiment
 
-from ..experiment import Results, Procedure, unique_filename
+from ..experiment import Results, Procedure, Worker, unique_filename
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -162,12 +162,20 @@ class ManagedConsole(QtCore.QCoreApplication):
             (see :class:`~pymeasure.experiment.procedure.Procedure`)
     :param log_channel: :code:`logging.Logger` instance to use for logging output
     :param log_level: logging level
+    :param max_workers: maximum number of experiments run concurrently, provided their
+        procedures use disjoint resources (see
+        :attr:`~pymeasure.experiment.procedure.Procedure.RESOURCES`)
+    :param worker_class: class running the procedures, e.g.
+        :class:`~pymeasure.experiment.workers.ProcessWorker` to run them in a separate process
+        such that CPU-heavy procedures do not slow down the interface
     """
 
     def __init__(self,
                  procedure_class,
                  log_channel='',
                  log_level=logging.INFO,
+                 max_workers=1,
+                 worker_class=Worker,
                  ):
 
         super().__init__([])
@@ -231,6 +239,8 @@ class ManagedConsole(QtCore.QCoreApplication):
         # Setup Manager
         self.manager = BaseManager(
             log_level=self.log_level,
+            max_workers=max_workers,
+            worker_class=worker_class,
             parent=self)
         self.manager.abort_returned.connect(self._terminate)
         self.manager.failed.connect(self._terminate)
@@ -258,7 +268,7 @@ class ManagedConsole(QtCore.QCoreApplication):
         self.manager.queue(experiment)
 
     def _terminate(self):
-        if not self.manager.experiments.has_next():
+        if not self.manager.experiments.has_next() and not self.manager.is_running():
             self.quit()
 
     def abort(self):
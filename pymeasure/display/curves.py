@@ -32,10 +32,195 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
-class ResultsCurve(pg.PlotDataItem):
+class _GrowingArray:
+    """ Numpy array with a preallocated capacity, which doubles when it is exhausted. """
+
+    def __init__(self, dtype):
+        self.array = np.empty(64, dtype=dtype)
+        self.length = 0
+
+    def extend(self, values):
+        length = self.length + len(values)
+        if length > len(self.array):
+            array = np.empty(max(2 * len(self.array), length), dtype=self.array.dtype)
+            array[:self.length] = self.array[:self.length]
+            self.array = array
+        self.array[self.length:length] = values
+        self.length = length
+
+    @property
+    def values(self):
+        return self.array[:self.length]
+
+
+class MinMaxPyramid:
+    """ Minima and maxima of consecutive blocks of a data set, precomputed for block sizes
+    of 2, 4, 8, ... points, to decimate large data sets quickly for display.
+
+    Level-of-detail decimation replaces each block of points by its minimum and maximum,
+    which keeps the visual envelope of the curve, including single outliers.
+    Appended points only require to compute the blocks completed by them. The levels are
+    stored as floats, such that they stay valid if integer data is upcast to floats later on.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def __len__(self):
+        return len(self.y)
+
+    def clear(self):
+        """ Removes all data and precomputed levels. """
+        self.x = self.y = np.empty(0)
+        self._levels = []  # tuples of minima and maxima for block sizes 2, 4, 8, ...
+        self._monotonic = True
+
+    def update(self, x, y, appended=False):
+        """ Sets the data and updates the levels.
+
+        :param x: array of x values.
+        :param y: array of y values.
+        :param appended: whether the data starts with the data of the last update, such that
+            only the levels of the new points have to be computed.
+        """
+        x, y = self._numeric(x), self._numeric(y)
+        start = len(self.y)
+        if not appended or len(y) < start:
+            self.clear()
+            start = 0
+        if self._monotonic and len(x) > start:
+            self._monotonic = bool(np.all(np.diff(x[max(start - 1, 0):]) >= 0))
+        self.x, self.y = x, y
+
+        minima = maxima = y
+        level = 0
+        while len(minima) >= 2:
+            if level == len(self._levels):
+                self._levels.append((_GrowingArray(np.float64), _GrowingArray(np.float64)))
+            level_minima, level_maxima = self._levels[level]
+            done, count = level_minima.length, len(minima) // 2
+            if count > done:
+                level_minima.extend(
+                    np.fmin.reduce(minima[2 * done:2 * count].reshape(-1, 2), axis=1))
+                level_maxima.extend(
+                    np.fmax.reduce(maxima[2 * done:2 * count].reshape(-1, 2), axis=1))
+            minima, maxima = level_minima.values, level_maxima.values
+            level += 1
+
+    @staticmethod
+    def _numeric(values):
+        values = np.asarray(values)
+        if values.dtype.kind not in "iuf":
+            values = values.astype(np.float64)
+        return values
+
+    def decimate(self, points, x_range=None):
+        """ Returns x and y arrays with about `points` points representing the data.
+
+        :param points: number of points to return at most (approximately).
+        :param x_range: tuple of the visible x range. If the x values are sorted, only the
+            points inside this range (and the adjacent ones) are returned.
+        """
+        start, stop = 0, len(self.y)
+        if x_range is not None and self._monotonic and stop:
+            start = max(int(np.searchsorted(self.x, x_range[0], "left")) - 1, 0)
+            stop = min(int(np.searchsorted(self.x, x_range[1], "right")) + 1, stop)
+        count = stop - start
+        if count <= points or not self._levels:
+            return self.x[start:stop], self.y[start:stop]
+        # Two points (minimum and maximum) per block
+        level = min(int(np.ceil(np.log2(2 * count / max(points, 2)))), len(self._levels))
+        block = 2 ** level
+        first, last = -(-start // block), stop // block  # complete blocks in range
+        head_stop = min(first * block, stop)
+        tail_start = max(last * block, head_stop)
+        level_minima, level_maxima = self._levels[level - 1]
+
+        xs, ys = [], []
+        if head_stop > start:
+            self._append_block(xs, ys, start, head_stop)
+        if last > first:
+            x = np.empty(2 * (last - first), dtype=self.x.dtype)
+            x[0::2] = self.x[first * block:last * block:block]
+            x[1::2] = self.x[first * block + block - 1:last * block:block]
+            y = np.empty(2 * (last - first), dtype=np.float64)
+            y[0::2] = level_minima.values[first:last]
+            y[1::2] = level_maxima.values[first:last]
+            xs.append(x)
+            ys.append(y)
+        if stop > tail_start:
+            self._append_block(xs, ys, tail_start, stop)
+        return np.concatenate(xs), np.concatenate(ys)
+
+    def _append_block(self, xs, ys, start, stop):
+        """ Appends the first and last x value and the minimum and maximum of a block. """
+        y = self.y[start:stop]
+        xs.append(np.array([self.x[start], self.x[stop - 1]]))
+        ys.append(np.array([np.fmin.reduce(y), np.fmax.reduce(y)]))
+
+
+class DecimatingCurve(pg.PlotDataItem):
+    """ Curve, which can draw large data sets decimated to the resolution of the view.
+
+    If `decimate` is True, the data is stored in a :class:`MinMaxPyramid` and only about two
+    points per horizontal pixel of the visible range are drawn. Whenever the view range
+    changes, the points are selected anew from the pyramid.
+
+    :param decimate: whether to decimate the data.
+    """
+
+    def __init__(self, *args, decimate=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.decimate = decimate
+        self._pyramid = MinMaxPyramid()
+        self._drawing = False
+
+    def show_data(self, x, y, appended=False):
+        """ Shows the data, decimated if `decimate` is True.
+
+        :param x: array of x values.
+        :param y: array of y values.
+        :param appended: whether the data starts with the data shown before, such that only
+            the new points have to be added to the pyramid.
+        """
+        if self.decimate:
+            try:
+                self._pyramid.update(x, y, appended)
+            except (TypeError, ValueError):
+                pass  # Not numeric, draw the data as it is
+            else:
+                self._draw_decimated()
+                return
+        self._pyramid.clear()
+        self.setData(x, y)
+
+    def _draw_decimated(self):
+        view = self.getViewBox()
+        width, x_range = 1000, None
+        if isinstance(view, pg.ViewBox):
+            width = view.width() or width
+            if not view.autoRangeEnabled()[0]:
+                x_range = view.viewRange()[0]
+        self._drawing = True
+        try:
+            self.setData(*self._pyramid.decimate(int(2 * width), x_range))
+        finally:
+            self._drawing = False
+
+    def viewRangeChanged(self, vb=None, ranges=None, changed=None):
+        super().viewRangeChanged(vb, ranges, changed)
+        if (self.decimate and len(self._pyramid) and not self._drawing
+                and (changed is None or changed[0])):
+            self._draw_decimated()
+
+
+class ResultsCurve(DecimatingCurve):
     """ Creates a curve loaded dynamically from a file through the Results object. The data can
     be forced to fully reload on each update, useful for cases when the data is changing across
     the full file instead of just appending.
+
+    With `decimate=True` large data sets are decimated to the resolution of the view, see
+    :class:`DecimatingCurve`.
     """
 
     def __init__(self, results, x, y, force_reload=False, wdg=None, **kwargs):
@@ -46,6 +231,7 @@ class ResultsCurve(pg.PlotDataItem):
         self.x, self.y = x, y
         self.force_reload = force_reload
         self.color = self.opts['pen'].color()
+        self._shown_columns = None
 
     def update_data(self):
         """Updates the data by polling the results"""
@@ -54,7 +240,13 @@ class ResultsCurve(pg.PlotDataItem):
         data = self.results.data  # get the current snapshot
 
         # Set x-y data
-        self.setData(data[self.x], data[self.y])
+        if self.decimate:
+            appended = not self.force_reload and self._shown_columns == (self.x, self.y)
+            self._shown_columns = (self.x, self.y)
+            self.show_data(data[self.x].to_numpy(), data[self.y].to_numpy(), appended)
+        else:
+            self._shown_columns = None
+            self.setData(data[self.x], data[self.y])
 
     def set_color(self, color):
         self.pen.setColor(color)
@@ -66,7 +258,13 @@ class ResultsCurve(pg.PlotDataItem):
 
 class ResultsImage(pg.ImageItem):
     """ Creates an image loaded dynamically from a file through the Results
-    object."""
+    object.
+
+    The image holds the z values of the data points in `img_data` (in column-major order, as
+    pyqtgraph expects), which are mapped to colors by a lookup table. On each update only the
+    rows, which arrived since the last update, are painted and the color levels are rescaled
+    to the range of the z values.
+    """
 
     def __init__(self, results, x, y, z, force_reload=False, wdg=None, **kwargs):
         self.results = results
@@ -82,11 +280,15 @@ class ResultsImage(pg.ImageItem):
         self.yend = getattr(self.results.procedure, self.y + '_end')
         self.ystep = getattr(self.results.procedure, self.y + '_step')
         self.ysize = int(np.ceil((self.yend - self.ystart) / self.ystep)) + 1
-        self.img_data = np.zeros((self.ysize, self.xsize, 4))
+        self.img_data = np.full((self.xsize, self.ysize), np.nan)
         self.force_reload = force_reload
         self.cm = pg.colormap.get('viridis')
+        self._columns = None
+        self._row_count = 0
+        self._levels = None
 
-        super().__init__(image=self.img_data)
+        super().__init__(image=self.img_data, autoLevels=False, levels=(0, 1))
+        self.setLookupTable(self.cm.getLookupTable(nPts=256))
 
         # Scale and translate image so that the pixels are in the correct
         # position in "data coordinates"
@@ -101,38 +303,49 @@ class ResultsImage(pg.ImageItem):
             self.results.reload()
 
         data = self.results.data
-        zmin = data[self.z].min()
-        zmax = data[self.z].max()
+        columns = (self.x, self.y, self.z)
+        repaint = (self.force_reload or columns != self._columns
+                   or len(data) < self._row_count)
+        if repaint:
+            self.img_data[:] = np.nan
+            self._columns = columns
+            self._row_count = 0
+            self._levels = None
+
+        new_data = data.iloc[self._row_count:]
+        self._row_count = len(data)
+        if len(new_data) == 0 and not repaint:
+            return
 
         # populate the image array with the new data
-        for idx, row in data.iterrows():
-            xdat = row[self.x]
-            ydat = row[self.y]
-            xidx, yidx = self.find_img_index(xdat, ydat)
-            self.img_data[yidx, xidx, :] = self.colormap((row[self.z] - zmin) / (zmax - zmin))
-
-        # set image data, need to transpose since pyqtgraph assumes column-major order
-        self.setImage(image=np.transpose(self.img_data, axes=(1, 0, 2)))
+        xidx, yidx = self.find_img_index(new_data[self.x].to_numpy(dtype=float),
+                                         new_data[self.y].to_numpy(dtype=float))
+        z = new_data[self.z].to_numpy(dtype=float)
+        self.img_data[xidx, yidx] = z
+
+        if not np.isnan(z).all():
+            zmin, zmax = np.nanmin(z), np.nanmax(z)
+            if self._levels is not None:
+                zmin, zmax = min(zmin, self._levels[0]), max(zmax, self._levels[1])
+            self._levels = (zmin, zmax)
+        self.setImage(image=self.img_data, autoLevels=False, levels=self._levels or (0, 1))
 
     def find_img_index(self, x, y):
         """ Finds the integer image indices corresponding to the
-        closest x and y points of the data given some x and y data.
+        closest x and y points of the data given some x and y data
+        (scalars or arrays).
         """
-
-        indices = [self.xsize - 1, self.ysize - 1]  # default to the final pixel
-        if self.xstart <= x <= self.xend:  # only change if within reasonable range
-            indices[0] = self.round_up((x - self.xstart) / self.xstep)
-        if self.ystart <= y <= self.yend:
-            indices[1] = self.round_up((y - self.ystart) / self.ystep)
-
-        return indices
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        # default to the final pixel and only change if within reasonable range
+        xidx = np.where((self.xstart <= x) & (x <= self.xend),
+                        self.round_up((x - self.xstart) / self.xstep), self.xsize - 1)
+        yidx = np.where((self.ystart <= y) & (y <= self.yend),
+                        self.round_up((y - self.ystart) / self.ystep), self.ysize - 1)
+        return xidx, yidx
 
     def round_up(self, x):
         """Convenience function since numpy rounds to even"""
-        if x % 1 >= 0.5:
-            return int(x) + 1
-        else:
-            return int(x)
+        return np.floor(np.nan_to_num(x) + 0.5).astype(int)
 
     def colormap(self, x):
         """ Return mapped color as 0.0-1.0 floats RGBA """
@@ -141,33 +354,84 @@ class ResultsImage(pg.ImageItem):
     # TODO: colormap selection
 
 
-class BufferCurve(pg.PlotDataItem):
+class BufferCurve(DecimatingCurve):
     """ Creates a curve based on a predefined buffer size and allows data to be added dynamically.
+
+    Points can be appended one by one or in blocks. The curve is redrawn at most once per
+    `refresh_time` (in seconds), regardless of the number of appended points.
+
+    If the buffer is prepared as ring buffer, it wraps around when it is full, such that the
+    curve shows the last `size` points with constant memory. Every point is stored twice,
+    at its position in the ring and `size` positions later, such that the last `size`
+    points are always a contiguous slice of the buffer and can be drawn without copying.
+
+    With `decimate=True` large buffers are decimated to the resolution of the view, see
+    :class:`DecimatingCurve`. The decimation is updated incrementally, unless a ring buffer
+    has wrapped around.
     """
 
     data_updated = QtCore.Signal()
 
-    def __init__(self, **kwargs):
+    def __init__(self, refresh_time=1 / 60, **kwargs):
         super().__init__(**kwargs)
         self._buffer = None
-
-    def prepare(self, size, dtype=np.float32):
-        """ Prepares the buffer based on its size, data type """
-        self._buffer = np.empty((size, 2), dtype=dtype)
+        self._size = 0
+        self._ring = False
         self._ptr = 0
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(int(refresh_time * 1e3))
+        self._timer.timeout.connect(self.update_data)
+
+    def prepare(self, size, dtype=np.float32, ring=False):
+        """ Prepares the buffer based on its size, data type and whether it is a ring buffer """
+        self._size = size
+        self._ring = ring
+        self._buffer = np.empty((2 * size if ring else size, 2), dtype=dtype)
+        self._ptr = 0
+        self._pyramid.clear()
 
     def append(self, x, y):
-        """ Appends data to the curve with optional errors """
+        """ Appends a point or a block of points (arrays of x and y values) to the curve """
         if self._buffer is None:
             raise Exception("BufferCurve buffer must be prepared")
-        if len(self._buffer) <= self._ptr:
-            raise Exception("BufferCurve overflow")
-
-        # Set x-y data
-        self._buffer[self._ptr, :2] = [x, y]
-        self.setData(self._buffer[:self._ptr, :2])
+        x, y = np.atleast_1d(x), np.atleast_1d(y)
+        count = len(x)
+        if self._ring:
+            if count > self._size:  # only the last points fit into the ring
+                x, y = x[-self._size:], y[-self._size:]
+                self._ptr += count - self._size
+                count = self._size
+            index = (self._ptr + np.arange(count)) % self._size
+            for offset in (0, self._size):
+                self._buffer[index + offset, 0] = x
+                self._buffer[index + offset, 1] = y
+        else:
+            if self._size < self._ptr + count:
+                raise Exception("BufferCurve overflow")
+            self._buffer[self._ptr:self._ptr + count, 0] = x
+            self._buffer[self._ptr:self._ptr + count, 1] = y
+        self._ptr += count
+
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @property
+    def points(self):
+        """ View of the buffered points, the oldest first, as array of shape (n, 2) """
+        if self._buffer is None:
+            return np.empty((0, 2))
+        if self._ring and self._ptr > self._size:
+            start = self._ptr % self._size
+            return self._buffer[start:start + self._size]
+        return self._buffer[:min(self._ptr, self._size)]
 
-        self._ptr += 1
+    def update_data(self):
+        """ Sets the buffered points as curve data """
+        self._timer.stop()
+        points = self.points
+        wrapped = self._ring and self._ptr > self._size
+        self.show_data(points[:, 0], points[:, 1], appended=not wrapped)
         self.data_updated.emit()
 
 
@@ -24,6 +24,7 @@
 
 import logging
 
+from functools import partial
 from os.path import basename
 
 from .Qt import QtCore
@@ -120,6 +121,21 @@ class BaseManager(QtCore.QObject):
     """Controls the execution of :class:`.Experiment` classes by implementing
     a queue system in which Experiments are added, removed, executed, or
     aborted.
+
+    By default one experiment runs at a time. With :code:`max_workers` larger than one,
+    up to that many experiments are run concurrently, each by its own :class:`.Worker`,
+    as long as the resources of their procedures (see
+    :meth:`Procedure.resources() <pymeasure.experiment.procedure.Procedure.resources>`)
+    do not overlap. Queued experiments which conflict with a running one wait for it to
+    return, while later, non-conflicting experiments may start before them.
+
+    :param port: ZMQ port of the first worker, concurrent workers use the following ports
+    :param log_level: logging level of the workers
+    :param max_workers: maximum number of experiments running at the same time
+    :param worker_class: class running the procedures, either the :class:`.Worker` (default),
+        which runs them in a thread, or the :class:`.ProcessWorker`, which runs them in a
+        separate process
+    :param parent: parent :code:`QObject`
     """
     _is_continuous = True
     _start_on_add = True
@@ -131,36 +147,65 @@ class BaseManager(QtCore.QObject):
     abort_returned = QtCore.Signal(object)
     log = QtCore.Signal(object)
 
-    def __init__(self, port=5888, log_level=logging.INFO, parent=None):
+    def __init__(self, port=5888, log_level=logging.INFO, max_workers=1, worker_class=Worker,
+                 parent=None):
         super().__init__(parent)
 
+        if max_workers < 1:
+            raise ValueError("max_workers has to be at least 1")
+
         self.experiments = ExperimentQueue()
-        self._worker = None
-        self._running_experiment = None
-        self._monitor = None
+        self._runs = {}  # experiment -> (worker, monitor, slot)
         self.log_level = log_level
+        self.max_workers = max_workers
+        self.worker_class = worker_class
 
         self.port = port
 
+    @property
+    def _running_experiment(self):
+        """ The experiment which has been running the longest, or None. """
+        return next(iter(self._runs), None)
+
+    @property
+    def _worker(self):
+        """ The worker of :attr:`_running_experiment`, or None. """
+        experiment = self._running_experiment
+        return None if experiment is None else self._runs[experiment][0]
+
+    @property
+    def _monitor(self):
+        """ The monitor of :attr:`_running_experiment`, or None. """
+        experiment = self._running_experiment
+        return None if experiment is None else self._runs[experiment][1]
+
     def is_running(self):
         """ Returns True if a procedure is currently running
         """
-        return self._running_experiment is not None
+        return bool(self._runs)
 
     def running_experiment(self):
+        """ Returns the running Experiment, the one started first if several are running,
+        but raises an exception if there is no running experiment
+        """
         if self.is_running():
             return self._running_experiment
         else:
             raise Exception("There is no Experiment running")
 
-    def _update_progress(self, progress):
-        if self.is_running():
-            self._running_experiment.browser_item.setProgress(progress)
+    def running_experiments(self):
+        """ Returns a list of the running Experiments in the order they were started
+        """
+        return list(self._runs)
 
-    def _update_status(self, status):
-        if self.is_running():
-            self._running_experiment.procedure.status = status
-            self._running_experiment.browser_item.setStatus(status)
+    def _update_progress(self, experiment, progress):
+        if experiment in self._runs:
+            experiment.browser_item.setProgress(progress)
+
+    def _update_status(self, experiment, status):
+        if experiment in self._runs:
+            experiment.procedure.status = status
+            experiment.browser_item.setStatus(status)
 
     def _update_log(self, record):
         self.log.emit(record)
@@ -175,7 +220,7 @@ class BaseManager(QtCore.QObject):
         """
         self.load(experiment)
         self.queued.emit(experiment)
-        if self._start_on_add and not self.is_running():
+        if self._start_on_add and len(self._runs) < self.max_workers:
             self.next()
 
     def remove(self, experiment):
@@ -189,62 +234,86 @@ class BaseManager(QtCore.QObject):
         for experiment in self.experiments[:]:
             self.remove(experiment)
 
+    def _conflicts(self, experiment):
+        """ Returns True if the experiment uses a resource of a running experiment
+        """
+        resources = experiment.procedure.resources()
+        for running in self._runs:
+            other = running.procedure.resources()
+            if resources is None or other is None or resources & other:
+                return True
+        return False
+
+    def _startable(self):
+        """ Returns the first queued experiment which may start now, or None
+        """
+        for experiment in self.experiments:
+            if (experiment.procedure.status == Procedure.QUEUED
+                    and experiment not in self._runs
+                    and not self._conflicts(experiment)):
+                return experiment
+        return None
+
     def next(self):
-        """ Initiates the start of the next experiment in the queue as long
-        as no other experiments are currently running and there is a procedure
-        in the queue.
+        """ Initiates the start of the next experiments in the queue as long
+        as a worker is available and there are procedures in the queue which do
+        not conflict with the running ones.
         """
-        if self.is_running():
+        if len(self._runs) >= self.max_workers:
             raise Exception("Another procedure is already running")
-        else:
-            if self.experiments.has_next():
-                log.debug("Manager is initiating the next experiment")
-                experiment = self.experiments.next()
-                self._running_experiment = experiment
-
-                self._worker = Worker(experiment.results, port=self.port, log_level=self.log_level)
-
-                self._monitor = Monitor(self._worker.monitor_queue)
-                self._monitor.worker_running.connect(self._running)
-                self._monitor.worker_failed.connect(self._failed)
-                self._monitor.worker_abort_returned.connect(self._abort_returned)
-                self._monitor.worker_finished.connect(self._finish)
-                self._monitor.progress.connect(self._update_progress)
-                self._monitor.status.connect(self._update_status)
-                self._monitor.log.connect(self._update_log)
-
-                self._monitor.start()
-                self._worker.start()
-
-    def _running(self):
-        if self.is_running():
-            self.running.emit(self._running_experiment)
-
-    def _clean_up(self):
-        self._worker.join()
-        del self._worker
-        self._monitor.wait()
-        del self._monitor
-        self._worker = None
-        self._running_experiment = None
+        while len(self._runs) < self.max_workers:
+            experiment = self._startable()
+            if experiment is None:
+                break
+            self._start(experiment)
+
+    def _start(self, experiment):
+        log.debug("Manager is initiating the next experiment")
+        used = {slot for _, _, slot in self._runs.values()}
+        slot = min(set(range(self.max_workers)) - used)
+
+        port = None if self.port is None else self.port + slot
+        worker = self.worker_class(experiment.results, port=port, log_level=self.log_level)
+
+        monitor = Monitor(worker.monitor_queue)
+        monitor.worker_running.connect(partial(self._running, experiment))
+        monitor.worker_failed.connect(partial(self._failed, experiment))
+        monitor.worker_abort_returned.connect(partial(self._abort_returned, experiment))
+        monitor.worker_finished.connect(partial(self._finish, experiment))
+        monitor.progress.connect(partial(self._update_progress, experiment))
+        monitor.status.connect(partial(self._update_status, experiment))
+        monitor.log.connect(self._update_log)
+
+        self._runs[experiment] = (worker, monitor, slot)
+        monitor.start()
+        worker.start()
+
+    def _running(self, experiment):
+        if experiment in self._runs:
+            self.running.emit(experiment)
+
+    def _clean_up(self, experiment):
+        worker, monitor, _ = self._runs[experiment]
+        worker.join()
+        monitor.wait()
+        del self._runs[experiment]
         log.debug("Manager has cleaned up after the Worker")
 
-    def _failed(self):
+    def _failed(self, experiment):
         log.debug("Manager's running experiment has failed")
-        experiment = self._running_experiment
-        self._clean_up()
+        self._clean_up(experiment)
         self.failed.emit(experiment)
 
-    def _abort_returned(self):
+    def _abort_returned(self, experiment):
         log.debug("Manager's running experiment has returned after an abort")
-        experiment = self._running_experiment
-        self._clean_up()
+        self._clean_up(experiment)
         self.abort_returned.emit(experiment)
+        if self._is_continuous:  # Only this experiment was aborted
+            self.next()
 
-    def _finish(self):
+    def _finish(self, experiment):
         log.debug("Manager's running experiment has finished")
-        experiment = self._running_experiment
-        self._clean_up()
+        self._clean_up(experiment)
         experiment.browser_item.setProgress(100)
         self.finished.emit(experiment)
         if self._is_continuous:  # Continue running procedures
@@ -257,20 +326,29 @@ class BaseManager(QtCore.QObject):
         self._is_continuous = True
         self.next()
 
-    def abort(self):
-        """ Aborts the currently running Experiment, but raises an exception if
-        there is no running experiment
+    def abort(self, experiment=None):
+        """ Aborts the running Experiments and pauses the queue, but raises an
+        exception if there is no running experiment
+
+        :param experiment: if given, only this running Experiment is aborted and
+            the queue continues with the next experiments
         """
-        if not self.is_running():
-            raise Exception("Attempting to abort when no experiment "
-                            "is running")
-        else:
+        if experiment is None:
+            if not self.is_running():
+                raise Exception("Attempting to abort when no experiment "
+                                "is running")
             self._start_on_add = False
             self._is_continuous = False
+            experiments = self.running_experiments()
+        elif experiment not in self._runs:
+            raise Exception("Attempting to abort an experiment which "
+                            "is not running")
+        else:
+            experiments = [experiment]
 
-            self._worker.stop()
-
-            self.aborted.emit(self._running_experiment)
+        for experiment in experiments:
+            self._runs[experiment][0].stop()
+            self.aborted.emit(experiment)
 
 
 class Manager(BaseManager):
@@ -281,20 +359,14 @@ class Manager(BaseManager):
         in accordance with the execution status of the Experiments.
         """
 
-    def __init__(self, widget_list, browser, port=5888, log_level=logging.INFO, parent=None):
-        super().__init__(parent)
-
-        self.experiments = ExperimentQueue()
-        self._worker = None
-        self._running_experiment = None
-        self._monitor = None
-        self.log_level = log_level
+    def __init__(self, widget_list, browser, port=5888, log_level=logging.INFO, max_workers=1,
+                 worker_class=Worker, parent=None):
+        super().__init__(port=port, log_level=log_level, max_workers=max_workers,
+                         worker_class=worker_class, parent=parent)
 
         self.widget_list = widget_list
         self.browser = browser
 
-        self.port = port
-
     def load(self, experiment):
         """ Load a previously executed Experiment
         """
@@ -317,10 +389,9 @@ class Manager(BaseManager):
             if curve:
                 curve.wdg.remove(curve)
 
-    def _finish(self):
+    def _finish(self, experiment):
         log.debug("Manager's running experiment has finished")
-        experiment = self._running_experiment
-        self._clean_up()
+        self._clean_up(experiment)
         experiment.browser_item.setProgress(100)
         for curve in experiment.curve_list:
             if curve:
@@ -41,7 +41,7 @@ class FileInputWidget(QtWidgets.QWidget):
     directory (:class:`~pymeasure.display.widgets.directory_widget.DirectoryLineEdit`), and a
     checkbox to control whether the measurement is stored.
     """
-    _extensions = ["csv", "txt"]
+    _extensions = ["csv", "txt", "pmb"]
     _filename_fixed = False
 
     def __init__(self, parent=None):
@@ -38,15 +38,19 @@ log.addHandler(logging.NullHandler())
 class PlotWidget(TabWidget, QtWidgets.QWidget):
     """ Extends :class:`PlotFrame<pymeasure.display.widgets.plot_frame.PlotFrame>`
     to allow different columns of the data to be dynamically chosen
+
+    If `decimate` is True, the curves draw large data sets decimated to the resolution
+    of the view, see :class:`~pymeasure.display.curves.DecimatingCurve`.
     """
 
     def __init__(self, name, columns, x_axis=None, y_axis=None, refresh_time=0.2,
-                 check_status=True, linewidth=1, parent=None):
+                 check_status=True, linewidth=1, decimate=False, parent=None):
         super().__init__(name, parent)
         self.columns = columns
         self.refresh_time = refresh_time
         self.check_status = check_status
         self.linewidth = linewidth
+        self.decimate = decimate
         self._setup_ui()
         self._layout()
         if x_axis is not None:
@@ -108,6 +112,7 @@ class PlotWidget(TabWidget, QtWidgets.QWidget):
             kwargs['pen'] = pg.mkPen(color=color, width=self.linewidth)
         if 'antialias' not in kwargs:
             kwargs['antialias'] = False
+        kwargs.setdefault('decimate', self.decimate)
         curve = ResultsCurve(results,
                              wdg=self,
                              x=self.plot_frame.x_axis,
@@ -139,12 +144,21 @@ class PlotWidget(TabWidget, QtWidgets.QWidget):
         """ Change the color of the pen of the curve """
         curve.set_color(color)
 
+    def set_decimation(self, decimate):
+        """ Enable or disable the decimation of all curves and of the curves created later """
+        self.decimate = decimate
+        for item in self.plot.items:
+            if isinstance(item, ResultsCurve):
+                item.decimate = decimate
+                item.update_data()
+
     def preview_widget(self, parent=None):
         """ Return a widget suitable for preview during loading """
         return PlotWidget("Plot preview",
                           self.columns,
                           self.plot_frame.x_axis,
                           self.plot_frame.y_axis,
+                          decimate=self.decimate,
                           parent=parent,
                           )
 
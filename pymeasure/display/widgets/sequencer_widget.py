@@ -26,8 +26,10 @@ import os
 from functools import partial
 from inspect import signature
 from collections import ChainMap
+from itertools import islice
 
 from ..Qt import QtCore, QtWidgets, QtGui
+from ...experiment.procedure import Procedure
 from ...experiment.sequencer import SequenceHandler, SequenceEvaluationError
 
 log = logging.getLogger(__name__)
@@ -383,11 +385,15 @@ class SequencerWidget(QtWidgets.QWidget):
     "procedure" argument.
 
     :param inputs: List of strings representing the parameters name
+    :param queue_ahead: Number of procedures of the sequence to keep queued. More procedures
+        are queued whenever an experiment ends. If None (default), all of them are queued at once.
     """
 
-    def __init__(self, inputs=None, sequence_file=None, parent=None):
+    def __init__(self, inputs=None, sequence_file=None, parent=None, queue_ahead=None):
         super().__init__(parent)
         self._parent = parent
+        self.queue_ahead = queue_ahead
+        self._pending = None
 
         self._check_queue_signature()
 
@@ -406,6 +412,12 @@ class SequencerWidget(QtWidgets.QWidget):
         if sequence_file is not None:
             self.load_sequence(filename=sequence_file)
 
+        manager = getattr(self._parent, "manager", None)
+        if queue_ahead is not None and manager is not None:
+            manager.finished.connect(self._schedule_pending)
+            manager.failed.connect(self._schedule_pending)
+            manager.abort_returned.connect(self._schedule_pending)
+
     def _check_queue_signature(self):
         """
         Check if the call signature of the implementation of the`ManagedWindow.queue`
@@ -534,8 +546,12 @@ class SequencerWidget(QtWidgets.QWidget):
 
     def queue_sequence(self):
         """
-        Obtain a list of parameters from the sequence tree, enter these into
+        Obtain the sequence of parameters from the sequence tree, enter these into
         procedures, and queue these procedures.
+
+        The procedures are created while iterating over the sequence. If :attr:`queue_ahead`
+        is set, only that many of them are queued and the remaining ones are queued whenever
+        an experiment ends.
         """
 
         self.queue_button.setEnabled(False)
@@ -548,18 +564,45 @@ class SequencerWidget(QtWidgets.QWidget):
             log.info(
                 "Queuing %d measurements based on the entered sequences." % len(sequence)
             )
-
-            for entry in sequence:
-                QtWidgets.QApplication.processEvents()
-                parameters = dict(ChainMap(*entry[::-1]))
-
-                procedure = self._parent.make_procedure()
-                procedure.set_parameters(parameters)
-                self._parent.queue(procedure=procedure)
+            self._pending = iter(sequence)
+            self._queue_pending()
 
         finally:
             self.queue_button.setEnabled(True)
 
+    def _schedule_pending(self, *args):
+        """
+        Queue pending procedures once the manager has finished handling the ended experiment,
+        such that the manager starts the next experiments itself.
+        """
+        QtCore.QTimer.singleShot(0, self._queue_pending)
+
+    def _queue_pending(self, *args):
+        """
+        Queue procedures of the pending sequence, up to :attr:`queue_ahead` waiting ones.
+        """
+        if self._pending is None:
+            return
+
+        count = None
+        if self.queue_ahead is not None:
+            waiting = sum(experiment.procedure.status == Procedure.QUEUED
+                          for experiment in self._parent.manager.experiments.queue)
+            count = max(self.queue_ahead - waiting, 0)
+
+        queued = 0
+        for entry in islice(self._pending, count):
+            QtWidgets.QApplication.processEvents()
+            parameters = dict(ChainMap(*entry[::-1]))
+
+            procedure = self._parent.make_procedure()
+            procedure.set_parameters(parameters)
+            self._parent.queue(procedure=procedure)
+            queued += 1
+
+        if count is None or queued < count:
+            self._pending = None  # sequence exhausted
+
     def save_sequence(self):
         dialog = SequenceDialog(save=True)
         if dialog.exec():
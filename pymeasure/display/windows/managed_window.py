@@ -45,7 +45,7 @@ from ..widgets import (
     FileInputWidget,
     EstimatorWidget,
 )
-from ...experiment import Results, Procedure, unique_filename
+from ...experiment import Results, Procedure, Worker, unique_filename
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -107,6 +107,9 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         are used.
     :param sequence_file: simple text file to quickly load a pre-defined sequence with the
         :code:`Load sequence` button
+    :param sequencer_queue_ahead: either :code:`None` to queue all the experiments of a sequence
+        at once, or the number of experiments of the sequence to keep queued. The remaining ones
+        are created and queued one by one, whenever an experiment ends.
     :param inputs_in_scrollarea: boolean that display or hide a scrollbar to the input area
     :param enable_file_input: a boolean controlling whether a
         :class:`~pymeasure.display.widgets.fileinput_widget.FileInputWidget` to specify where the
@@ -118,6 +121,12 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         should be saved to the selected file, or not (i.e., to a temporary file instead).
     :param hide_groups: a boolean controlling whether parameter groups are hidden (True, default)
         or disabled/grayed-out (False) when the group conditions are not met.
+    :param max_workers: maximum number of experiments run concurrently, provided their
+        procedures use disjoint resources (see
+        :attr:`~pymeasure.experiment.procedure.Procedure.RESOURCES`)
+    :param worker_class: class running the procedures, e.g.
+        :class:`~pymeasure.experiment.workers.ProcessWorker` to run them in a separate process
+        such that CPU-heavy procedures do not slow down the interface
 
     """
 
@@ -132,9 +141,12 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
                  sequencer=False,
                  sequencer_inputs=None,
                  sequence_file=None,
+                 sequencer_queue_ahead=None,
                  inputs_in_scrollarea=False,
                  enable_file_input=True,
                  hide_groups=True,
+                 max_workers=1,
+                 worker_class=Worker,
                  ):
 
         super().__init__(parent)
@@ -147,8 +159,11 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.use_sequencer = sequencer
         self.sequencer_inputs = sequencer_inputs
         self.sequence_file = sequence_file
+        self.sequencer_queue_ahead = sequencer_queue_ahead
         self.inputs_in_scrollarea = inputs_in_scrollarea
         self.enable_file_input = enable_file_input
+        self.max_workers = max_workers
+        self.worker_class = worker_class
         self.log = logging.getLogger(log_channel)
         self.log_level = log_level
         log.setLevel(log_level)
@@ -202,6 +217,8 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.manager = Manager(self.widget_list,
                                self.browser,
                                log_level=self.log_level,
+                               max_workers=self.max_workers,
+                               worker_class=self.worker_class,
                                parent=self)
         self.manager.abort_returned.connect(self.abort_returned)
         self.manager.queued.connect(self.queued)
@@ -213,7 +230,8 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
             self.sequencer = SequencerWidget(
                 self.sequencer_inputs,
                 self.sequence_file,
-                parent=self
+                parent=self,
+                queue_ahead=self.sequencer_queue_ahead,
             )
 
         if self.use_estimator:
@@ -327,21 +345,26 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
                 lambda: self.change_color(experiment))
             menu.addAction(action_change_color)
 
+            running = experiment in self.manager.running_experiments()
+
+            # Abort
+            if running:
+                action_abort = QtGui.QAction(menu)
+                action_abort.setText("Abort Experiment")
+                action_abort.triggered.connect(lambda: self.manager.abort(experiment))
+                menu.addAction(action_abort)
+
             # Remove
             action_remove = QtGui.QAction(menu)
             action_remove.setText("Remove Graph")
-            if self.manager.is_running():
-                if self.manager.running_experiment() == experiment:  # Experiment running
-                    action_remove.setEnabled(False)
+            action_remove.setEnabled(not running)
             action_remove.triggered.connect(lambda: self.remove_experiment(experiment))
             menu.addAction(action_remove)
 
             # Delete
             action_delete = QtGui.QAction(menu)
             action_delete.setText("Delete Data File")
-            if self.manager.is_running():
-                if self.manager.running_experiment() == experiment:  # Experiment running
-                    action_delete.setEnabled(False)
+            action_delete.setEnabled(not running)
             action_delete.triggered.connect(lambda: self.delete_experiment_data(experiment))
             menu.addAction(action_delete)
 
@@ -600,14 +623,20 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self.browser_widget.clear_button.setEnabled(False)
 
     def abort_returned(self, experiment):
+        if self.manager._is_continuous:  # Only this experiment was aborted, the queue continues
+            self.finished(experiment)
+            return
+        if self.manager.is_running():  # Other experiments are still running
+            return
         if self.manager.experiments.has_next():
             self.abort_button.setText("Resume")
             self.abort_button.setEnabled(True)
         else:
+            self.abort_button.setEnabled(False)
             self.browser_widget.clear_button.setEnabled(True)
 
     def finished(self, experiment):
-        if not self.manager.experiments.has_next():
+        if not self.manager.experiments.has_next() and not self.manager.is_running():
             self.abort_button.setEnabled(False)
             self.browser_widget.clear_button.setEnabled(True)
 
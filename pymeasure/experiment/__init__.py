@@ -22,12 +22,48 @@
 # THE SOFTWARE.
 #
 
-from .parameters import (Parameter, IntegerParameter, FloatParameter,
-                         VectorParameter, ListParameter, BooleanParameter,
-                         Measurable, Metadata)
-from .procedure import Procedure, UnknownProcedure
-from .results import Results, unique_filename, replace_placeholders
-from .workers import Worker
-from .listeners import Listener, Recorder
-from .config import get_config
-from .experiment import Experiment, get_array, get_array_steps, get_array_zero
+from importlib import import_module
+
+# The public names are imported from their submodules on first access, such that e.g. defining a
+# procedure does not load pandas, pint or ZMQ before results are recorded.
+_lazy_names = {
+    "Parameter": "parameters",
+    "IntegerParameter": "parameters",
+    "FloatParameter": "parameters",
+    "VectorParameter": "parameters",
+    "ListParameter": "parameters",
+    "BooleanParameter": "parameters",
+    "Measurable": "parameters",
+    "Metadata": "parameters",
+    "Procedure": "procedure",
+    "UnknownProcedure": "procedure",
+    "Results": "results",
+    "unique_filename": "results",
+    "replace_placeholders": "results",
+    "convert_data_file": "results",
+    "Worker": "workers",
+    "ProcessWorker": "workers",
+    "Listener": "listeners",
+    "Recorder": "listeners",
+    "get_config": "config",
+    "Experiment": "experiment",
+    "get_array": "experiment",
+    "get_array_steps": "experiment",
+    "get_array_zero": "experiment",
+}
+
+__all__ = list(_lazy_names)
+
+
+def __getattr__(name):
+    try:
+        module = _lazy_names[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
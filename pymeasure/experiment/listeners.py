@@ -23,9 +23,10 @@
 #
 
 import logging
-from logging import StreamHandler, FileHandler
+from logging import StreamHandler
 
 from ..log import QueueListener
+from .results import get_storage
 from ..thread import StoppableThread
 
 log = logging.getLogger(__name__)
@@ -105,8 +106,7 @@ class Recorder(QueueListener):
         """
         handlers = []
         for filename in results.data_filenames:
-            fh = FileHandler(filename=filename, **kwargs)
-            fh.setFormatter(results.formatter)
+            fh = get_storage(filename).handler(filename, results.formatter, **kwargs)
             fh.setLevel(logging.NOTSET)
             handlers.append(fh)
 
@@ -28,10 +28,8 @@ import inspect
 from copy import deepcopy
 from importlib.machinery import SourceFileLoader
 import re
-from pint import UndefinedUnitError
 
 from .parameters import Parameter, Measurable, Metadata
-from pymeasure.units import ureg
 
 log = logging.getLogger()
 log.addHandler(logging.NullHandler())
@@ -59,6 +57,10 @@ class Procedure:
 
     DATA_COLUMNS = []
     MEASURE = {}
+    #: Keys of the resources (e.g. instrument addresses) used by the procedure. A manager
+    #: running several workers starts procedures concurrently only if their resources are
+    #: disjoint. :code:`None` claims all resources, i.e. the procedure runs exclusively.
+    RESOURCES = None
     FINISHED, FAILED, ABORTED, QUEUED, RUNNING = 0, 1, 2, 3, 4
     STATUS_STRINGS = {
         FINISHED: 'Finished', FAILED: 'Failed',
@@ -96,6 +98,9 @@ class Procedure:
         for column in columns:
             match = re.search(units_pattern, column)
             if match:
+                # Pint is only imported if units are used at all
+                from pint import UndefinedUnitError
+                from pymeasure.units import ureg
                 try:
                     units[column] = ureg.Quantity(match.groupdict()['units']).units
                 except UndefinedUnitError:
@@ -105,6 +110,18 @@ class Procedure:
                         "DATA_COLUMNS contains valid Pint units.")
         return units
 
+    def resources(self):
+        """ Returns the set of resource keys used by the procedure, or :code:`None`
+        if it requires exclusive use of all resources. Defaults to :attr:`RESOURCES`;
+        override it to derive the resources from parameter values, for example
+        the address of the instrument to use.
+        """
+        if self.RESOURCES is None:
+            return None
+        if isinstance(self.RESOURCES, str):
+            return frozenset((self.RESOURCES,))
+        return frozenset(self.RESOURCES)
+
     def gen_measurement(self):
         """Create MEASURE and DATA_COLUMNS variables for get_datapoint method."""
         # TODO: Refactor measurable-s implementation to be consistent with parameters
@@ -279,6 +296,12 @@ class Procedure:
         pass
 
     def emit(self, topic, record):
+        """ Emits a record of some topic, e.g. data with the topic 'results'.
+
+        A 'results' record is either a dict with the values of one row or a block of rows,
+        i.e. a :class:`pandas.DataFrame` or a dict of arrays (for example a whole instrument
+        buffer). A block is formatted, written and published at once.
+        """
         raise NotImplementedError('should be monkey patched by a worker')
 
     def should_stop(self):
@@ -23,15 +23,19 @@
 #
 
 from decimal import Decimal
+import io
 import logging
+from logging import FileHandler
 import os
 import re
 import sys
+import threading
 from importlib import import_module
 from importlib.machinery import SourceFileLoader
 from datetime import datetime
 from string import Formatter
 
+import numpy as np
 import pandas as pd
 import pint
 
@@ -118,8 +122,32 @@ def unique_filename(directory, prefix='DATA', suffix='', ext='csv',
     return filename
 
 
+def is_data_block(record):
+    """ Returns whether a results record is a block of rows instead of a single row.
+
+    A block is either a :class:`pandas.DataFrame` or a dict, in which at least one value is
+    an array (e.g. a numpy array, a list or a :class:`pint.Quantity` with an array
+    magnitude). Scalar values of a block dict apply to all of its rows.
+    """
+    if isinstance(record, pd.DataFrame):
+        return True
+    if isinstance(record, dict):
+        return any(_is_array(value) for value in record.values())
+    return False
+
+
+def _is_array(value):
+    if isinstance(value, pint.Quantity):
+        return np.ndim(value.magnitude) > 0
+    return isinstance(value, (np.ndarray, pd.Series, list, tuple))
+
+
 class CSVFormatter(logging.Formatter):
-    """ Formatter of data results """
+    """ Formatter of data results
+
+    Records are either a dict with the values of a single row or a block of rows, see
+    :func:`is_data_block`. Blocks are converted and formatted column-wise.
+    """
 
     def __init__(self, columns, delimiter=','):
         """Creates a csv formatter for a given list of columns (=header).
@@ -141,54 +169,500 @@ class CSVFormatter(logging.Formatter):
         :type record: dict
         :return: a string
         """
+        if is_data_block(record):
+            return self.format_block(record)
         line = []
         for x in self.columns:
-            value = record.get(x, float("nan"))
-            if isinstance(value, (float, int, Decimal)) and type(value) is not bool:
-                line.append(f"{value}")
-            else:
-                units = self.units.get(x, None)
-                if units is not None:
-                    if isinstance(value, str):
-                        try:
-                            value = ureg.Quantity(value)
-                        except pint.UndefinedUnitError:
-                            log.warning(
-                                f"Value {value} for column {x} cannot be parsed to"
-                                f" unit {units}.")
-                    if isinstance(value, pint.Quantity):
-                        try:
-                            line.append(f"{value.m_as(units)}")
-                        except pint.DimensionalityError:
-                            line.append("nan")
-                            log.warning(
-                                f"Value {value} for column {x} does not have the "
-                                f"right unit {units}.")
-                    elif isinstance(value, bool):
-                        line.append("nan")
-                        log.warning(
-                            f"Boolean for column {x} does not have unit {units}.")
-                    else:
-                        line.append("nan")
-                        log.warning(
-                            f"Value {value} for column {x} does not have the right"
-                            f" type for unit {units}.")
-                else:
-                    if isinstance(value, pint.Quantity):
-                        if value.units == ureg.dimensionless:
-                            line.append(f"{value.magnitude}")
-                        else:
-                            self.units[x] = value.to_base_units().units
-                            line.append(f"{value.m_as(self.units[x])}")
-                            log.info(f"Column {x} units was set to {self.units[x]}")
-                    else:
-                        line.append(f"{value}")
+            value = self.convert(x, record.get(x, float("nan")))
+            line.append(f"{value}")
         return self.delimiter.join(line)
 
+    def format_block(self, block):
+        """Formats a block of rows as csv lines.
+
+        :param block: DataFrame or dict of arrays.
+        :return: a string with one line per row.
+        """
+        frame = self.convert_block(block)
+        lines = None
+        for x in self.columns:
+            strings = frame[x].astype(str)
+            lines = strings if lines is None else lines + self.delimiter + strings
+        return "\n".join(lines)
+
+    def convert_block(self, block):
+        """Converts a block of rows to the column units.
+
+        Numeric arrays are assumed to be in the column units already and are used as they are,
+        all other values are converted as in :meth:`convert`.
+
+        :param block: DataFrame or dict of arrays.
+        :return: :class:`pandas.DataFrame` with the converted columns.
+        """
+        if isinstance(block, pd.DataFrame):
+            length = len(block)
+        else:
+            length = max(len(value) for value in block.values() if _is_array(value))
+        columns = {}
+        for x in self.columns:
+            value = block[x] if x in block else float("nan")
+            if isinstance(value, (pd.Series, list, tuple)):
+                value = np.asarray(value)
+            if isinstance(value, np.ndarray):
+                if value.dtype.kind not in "iuf":
+                    value = np.array([self.convert(x, v) for v in value.tolist()], dtype=object)
+                columns[x] = value
+            else:
+                columns[x] = self.convert(x, value)
+        return pd.DataFrame(columns, columns=self.columns, index=pd.RangeIndex(length))
+
+    def convert(self, column, value):
+        """Converts a value of a column to the column units, if present.
+
+        :param column: name of the column.
+        :param value: value to convert.
+        :return: the magnitude in the column units, NaN, if the value cannot be converted,
+            or the unchanged value, if the column has no units.
+        """
+        if isinstance(value, (float, int, Decimal)) and type(value) is not bool:
+            return value
+        units = self.units.get(column, None)
+        if units is not None:
+            if isinstance(value, str):
+                try:
+                    value = ureg.Quantity(value)
+                except pint.UndefinedUnitError:
+                    log.warning(
+                        f"Value {value} for column {column} cannot be parsed to"
+                        f" unit {units}.")
+            if isinstance(value, pint.Quantity):
+                try:
+                    return value.m_as(units)
+                except pint.DimensionalityError:
+                    log.warning(
+                        f"Value {value} for column {column} does not have the "
+                        f"right unit {units}.")
+            elif isinstance(value, bool):
+                log.warning(
+                    f"Boolean for column {column} does not have unit {units}.")
+            else:
+                log.warning(
+                    f"Value {value} for column {column} does not have the right"
+                    f" type for unit {units}.")
+            return float("nan")
+        if isinstance(value, pint.Quantity):
+            if value.units == ureg.dimensionless:
+                return value.magnitude
+            self.units[column] = value.to_base_units().units
+            log.info(f"Column {column} units was set to {self.units[column]}")
+            return value.m_as(self.units[column])
+        return value
+
     def format_header(self):
         return self.delimiter.join(self.columns)
 
 
+class BinaryFormatter(CSVFormatter):
+    """ Formatter of data results into binary records.
+
+    Each record consists of one little-endian 64-bit float per column, therefore only numeric
+    data can be stored. Booleans are stored as 1 and 0 and are read back as floats, like
+    integers. Values, which cannot be represented as a float (e.g. strings), raise a
+    :code:`ValueError`; use the csv format for such data.
+    """
+
+    dtype = np.dtype("<f8")
+
+    def format(self, record):
+        """Formats a record as binary record.
+
+        :param record: record to format.
+        :type record: dict
+        :return: bytes
+        :raises ValueError: If a value cannot be stored as a number.
+        """
+        if is_data_block(record):
+            return self.format_block(record)
+        return self.numeric_row(
+            {x: self.convert(x, record.get(x, float("nan"))) for x in self.columns}).tobytes()
+
+    def format_block(self, block):
+        """Formats a block of rows as consecutive binary records.
+
+        :param block: DataFrame or dict of arrays.
+        :return: bytes
+        :raises ValueError: If a column holds values, which cannot be stored as numbers.
+        """
+        return self.numeric_block(self.convert_block(block)).tobytes()
+
+    @classmethod
+    def numeric_row(cls, record):
+        """ Returns the values of a record as an array of :attr:`dtype`.
+
+        :param record: dict of the values of a row. None is stored as NaN.
+        :raises ValueError: If a value cannot be stored as a number.
+        """
+        row = np.empty(len(record), dtype=cls.dtype)
+        for i, (column, value) in enumerate(record.items()):
+            try:
+                row[i] = np.nan if value is None else value
+            except (TypeError, ValueError):
+                raise ValueError(f"Value {value!r} of column '{column}' cannot be stored in a "
+                                 "binary data file, which holds numbers only.") from None
+        return row
+
+    @classmethod
+    def numeric_block(cls, frame):
+        """ Returns the rows of a DataFrame as a 2D array of :attr:`dtype`.
+
+        :raises ValueError: If a column holds values, which cannot be stored as numbers.
+        """
+        if not isinstance(frame, pd.DataFrame):
+            frame = pd.DataFrame(frame)
+        columns = {}
+        for column in frame.columns:
+            values = frame[column]
+            if not pd.api.types.is_numeric_dtype(values):
+                try:
+                    values = pd.to_numeric(values)
+                except (TypeError, ValueError):
+                    raise ValueError(f"Column '{column}' holds values, which cannot be stored "
+                                     "in a binary data file, which holds numbers only.") from None
+            columns[column] = values.to_numpy(dtype=cls.dtype)
+        if not columns:
+            return np.empty((len(frame), 0), dtype=cls.dtype)
+        return np.column_stack(list(columns.values()))
+
+
+class BinaryFileHandler(logging.Handler):
+    """ Handler, which appends the binary records of a :class:`BinaryFormatter` to a file.
+
+    :param filename: name of the file to append to.
+    :param mode: mode in which the file is opened.
+    """
+
+    def __init__(self, filename, mode="ab"):
+        super().__init__()
+        self.filename = os.path.abspath(filename)
+        self.stream = open(self.filename, mode)
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record))
+            self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+        super().close()
+
+
+class CSVStorage:
+    """ Storage of the data as comma separated values in a text file.
+
+    The file starts with the commented header of the :class:`Results`, followed by a line with
+    the column labels and one line per data row.
+    """
+
+    extensions = ["csv", "txt"]
+
+    def handler(self, filename, formatter, **kwargs):
+        """ Returns a logging handler, which writes the records to the file.
+
+        :param filename: name of the data file.
+        :param formatter: :class:`CSVFormatter` of the results.
+        :param kwargs: keyword arguments for the handler.
+        """
+        handler = FileHandler(filename=filename, **kwargs)
+        handler.setFormatter(formatter)
+        return handler
+
+    def validate(self, record):
+        """ Checks that a converted record (a row or a block of rows) can be stored.
+
+        :raises ValueError: If the record cannot be stored.
+        """
+
+    def insert_metadata(self, filename, index, text):
+        """ Inserts the metadata text after the line `index` of the header. """
+        with open(filename, 'r+', encoding=Results.ENCODING) as f:
+            contents = f.readlines()
+            contents.insert(index, text)
+
+            f.seek(0)
+            f.writelines(contents)
+
+    def read(self, filename, offset=0, columns=None):
+        """ Reads the data rows starting at the byte offset.
+
+        :param filename: name of the data file.
+        :param offset: byte offset of the first row to read. If 0, the header is skipped
+            and the columns are read from the file.
+        :param columns: list of column names, if already known.
+        :return: tuple of a :class:`pandas.DataFrame` (or None if there is no complete
+            line) and the byte offset after the last complete line read.
+        """
+        with open(filename, "rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+        # Only consume complete lines, the last one might still be written
+        end = chunk.rfind(Results.LINE_BREAK.encode(Results.ENCODING)) + 1
+        if end == 0:
+            return None, offset
+        if offset == 0 or columns is None:
+            # The column labels follow the commented header
+            frame = pd.read_csv(
+                io.BytesIO(chunk[:end]),
+                comment=Results.COMMENT,
+                encoding=Results.ENCODING,
+            )
+        else:
+            frame = pd.read_csv(
+                io.BytesIO(chunk[:end]),
+                comment=Results.COMMENT,
+                header=None,
+                names=columns,
+                encoding=Results.ENCODING,
+            )
+        return frame, offset + end
+
+    def append(self, filename, frame):
+        """ Appends the rows of a DataFrame to the file. """
+        frame.to_csv(filename, mode="a", header=False, index=False,
+                     encoding=Results.ENCODING)
+
+
+class BinaryStorage(CSVStorage):
+    """ Storage of the data as binary records, see :class:`BinaryFormatter`.
+
+    The file starts with the same text header and column labels as a csv file, such that the
+    procedure and the parameters can be read in the same way. The header is followed by the
+    data as fixed-size records, which are only ever appended. Therefore reading
+    new data only requires to interpret the new bytes as a numpy array.
+
+    As the records hold floats only, non-numeric values (e.g. strings) cannot be stored and
+    raise a :code:`ValueError`, and booleans and integers are read back as floats.
+    """
+
+    extensions = ["pmb"]
+    dtype = BinaryFormatter.dtype
+
+    def handler(self, filename, formatter, **kwargs):
+        handler = BinaryFileHandler(filename, **kwargs)
+        handler.setFormatter(BinaryFormatter(formatter.columns, formatter.delimiter))
+        return handler
+
+    def validate(self, record):
+        if is_data_block(record):
+            BinaryFormatter.numeric_block(record)
+        else:
+            BinaryFormatter.numeric_row(record)
+
+    def insert_metadata(self, filename, index, text):
+        with open(filename, "rb+") as f:
+            for _ in range(index):
+                f.readline()
+            position = f.tell()
+            contents = f.read()
+            f.seek(position)
+            f.write(text.encode(Results.ENCODING))
+            f.write(contents)
+
+    def read(self, filename, offset=0, columns=None):
+        with open(filename, "rb") as f:
+            if offset == 0 or columns is None:
+                comment = Results.COMMENT.encode(Results.ENCODING)
+                line = f.readline()
+                while line.startswith(comment):
+                    line = f.readline()
+                if not line.endswith(Results.LINE_BREAK.encode(Results.ENCODING)):
+                    return None, 0  # Column labels are not yet written
+                columns = line.decode(Results.ENCODING).strip().split(Results.DELIMITER)
+                offset = f.tell()
+            else:
+                f.seek(offset)
+            chunk = f.read()
+        # Only consume complete records, the last one might still be written
+        count = len(chunk) // (len(columns) * self.dtype.itemsize)
+        values = np.frombuffer(chunk, dtype=self.dtype, count=count * len(columns))
+        frame = pd.DataFrame(values.reshape(count, len(columns)), columns=columns)
+        return frame, offset + values.nbytes
+
+    def append(self, filename, frame):
+        values = BinaryFormatter.numeric_block(frame)
+        with open(filename, "ab") as f:
+            f.write(values.tobytes())
+
+
+def get_storage(filename):
+    """ Returns the storage for a data file based on its extension.
+
+    Files with the extension of the :class:`BinaryStorage` are stored in binary format, all
+    other files as comma separated values.
+    """
+    extension = os.path.splitext(filename)[1].lstrip(".").lower()
+    if extension in BinaryStorage.extensions:
+        return BinaryStorage()
+    return CSVStorage()
+
+
+def convert_data_file(source_filename, target_filename):
+    """ Converts a data file into another storage format, e.g. a csv file into a binary file or
+    vice versa. The storage formats are determined by the file extensions, see
+    :func:`get_storage`. The header of the source file is copied unchanged.
+
+    :param source_filename: name of the existing data file.
+    :param target_filename: name of the data file to create.
+    :raises ValueError: If the data cannot be stored in the target format, e.g. strings in a
+        binary data file.
+    """
+    comment = Results.COMMENT.encode(Results.ENCODING)
+    header = []
+    with open(source_filename, "rb") as f:
+        line = f.readline()
+        while line.startswith(comment):
+            header.append(line.decode(Results.ENCODING).rstrip("\r\n"))
+            line = f.readline()
+    frame, _ = get_storage(source_filename).read(source_filename)
+    if frame is None:
+        raise ValueError(f"Data file '{source_filename}' does not contain column labels.")
+    storage = get_storage(target_filename)
+    storage.validate(frame)
+    with open(target_filename, "w", encoding=Results.ENCODING) as f:
+        f.write(Results.LINE_BREAK.join(header) + Results.LINE_BREAK)
+        f.write(Results.DELIMITER.join(frame.columns) + Results.LINE_BREAK)
+    storage.append(target_filename, frame)
+
+
+class DataBuffer:
+    """ Growable columnar buffer, which holds the data of a :class:`Results` object.
+
+    Each column is stored in its own preallocated numpy array. Whenever the capacity is
+    exhausted, it is doubled, such that appending rows has an amortized cost which only
+    depends on the number of appended rows and not on the number of rows already stored.
+
+    :param columns: list of column names. If None, the columns of the first appended
+        frame are used.
+    :param capacity: initial number of rows to allocate.
+    """
+
+    def __init__(self, columns=None, capacity=1000):
+        self.columns = None if columns is None else list(columns)
+        self.capacity = capacity
+        self._arrays = {}
+        self._length = 0
+        self._frame = None
+
+    def __len__(self):
+        return self._length
+
+    def clear(self):
+        """ Removes all rows from the buffer. """
+        self._arrays = {}
+        self._length = 0
+        self._frame = None
+
+    def append(self, frame):
+        """ Appends the rows of a DataFrame to the buffer.
+
+        Columns of the buffer, which are missing in the frame, are filled with NaN. If the
+        data type of a column does not fit into the buffer, the buffer column is upcast.
+
+        :param frame: :class:`pandas.DataFrame` (or dict of equal-length arrays) with the
+            new rows.
+        """
+        if not isinstance(frame, pd.DataFrame):
+            frame = pd.DataFrame(frame)
+        if self.columns is None:
+            self.columns = list(frame.columns)
+        count = len(frame)
+        if count == 0:
+            return
+        self._reserve(self._length + count)
+        start, stop = self._length, self._length + count
+        for column in self.columns:
+            if column in frame:
+                values = frame[column].to_numpy()
+            else:
+                values = np.full(count, np.nan)
+            array = self._arrays.get(column)
+            if array is None:
+                array = np.empty(self.capacity, dtype=values.dtype)
+                self._arrays[column] = array
+            elif not np.can_cast(values.dtype, array.dtype, casting="safe"):
+                array = array.astype(np.result_type(array.dtype, values.dtype))
+                self._arrays[column] = array
+            array[start:stop] = values
+        self._length = stop
+        self._frame = None
+
+    def append_row(self, row):
+        """ Appends a single row to the buffer.
+
+        The data type of a column is inferred from its first value like the CSV reader does:
+        booleans, integers and floats keep their numeric type, all other values are stored as
+        objects. If a later value does not fit into the column, the column is upcast.
+
+        :param row: dict with the values of the row. Missing columns are filled with NaN.
+        """
+        if self.columns is None:
+            self.columns = list(row)
+        self._reserve(self._length + 1)
+        for column in self.columns:
+            value = row.get(column, np.nan)
+            dtype = np.asarray(value).dtype
+            if dtype.kind not in "biufc":
+                dtype = np.dtype(object)
+            array = self._arrays.get(column)
+            if array is None:
+                array = np.empty(self.capacity, dtype=dtype)
+                self._arrays[column] = array
+            elif not np.can_cast(dtype, array.dtype, casting="safe"):
+                if dtype.kind == "O":
+                    array = array.astype(object)
+                else:
+                    array = array.astype(np.result_type(array.dtype, dtype))
+                self._arrays[column] = array
+            array[self._length] = value
+        self._length += 1
+        self._frame = None
+
+    def _reserve(self, length):
+        """ Ensures that the buffer can hold at least `length` rows. """
+        if length <= self.capacity:
+            return
+        capacity = max(2 * self.capacity, length)
+        for column, array in self._arrays.items():
+            new_array = np.empty(capacity, dtype=array.dtype)
+            new_array[:self._length] = array[:self._length]
+            self._arrays[column] = new_array
+        self.capacity = capacity
+
+    @property
+    def frame(self):
+        """ The buffered rows as a :class:`pandas.DataFrame`.
+
+        The frame is a view of the buffer memory and is cached until new rows are appended.
+        """
+        if self._frame is None:
+            if self.columns is None or not self._arrays:
+                self._frame = pd.DataFrame(columns=self.columns)
+            else:
+                self._frame = pd.DataFrame(
+                    {column: self._arrays[column][:self._length] for column in self.columns},
+                    columns=self.columns,
+                    copy=False,
+                )
+        return self._frame
+
+
 class Results:
     """ The Results class provides a convenient interface to reading and
     writing data in connection with a :class:`.Procedure` object.
@@ -196,11 +670,15 @@ class Results:
     :cvar COMMENT: The character used to identify a comment (default: #)
     :cvar DELIMITER: The character used to delimit the data (default: ,)
     :cvar LINE_BREAK: The character used for line breaks (default \\n)
-    :cvar CHUNK_SIZE: The length of the data chuck that is read
+    :cvar CHUNK_SIZE: The number of rows initially allocated for the data buffer
 
     :param procedure: Procedure object
     :param data_filename: The data filename where the data is or should be
                           stored
+
+    While a :class:`~pymeasure.experiment.workers.Worker` runs the procedure, the emitted
+    results are pushed into an in-memory buffer (see :meth:`start_live`), from which
+    :attr:`data` is served without reading the data file.
     """
 
     COMMENT = '#'
@@ -217,6 +695,10 @@ class Results:
         self.parameters = procedure.parameter_objects()
         self._header_count = -1
         self._metadata_count = -1
+        self._offset = 0
+        self._buffer = DataBuffer(capacity=Results.CHUNK_SIZE)
+        self._live = None
+        self._lock = threading.RLock()
 
         self.formatter = CSVFormatter(columns=self.procedure.DATA_COLUMNS)
 
@@ -227,6 +709,7 @@ class Results:
 
         self.data_filename = data_filename
         self.data_filenames = data_filenames
+        self.storage = get_storage(data_filename)
 
         if os.path.exists(data_filename):  # Assume header is already written
             self.reload()
@@ -237,7 +720,6 @@ class Results:
                 with open(filename, 'w', encoding=Results.ENCODING) as f:
                     f.write(self.header())
                     f.write(self.labels())
-            self._data = None
 
     def __getstate__(self):
         # Get all information needed to reconstruct procedure
@@ -251,10 +733,13 @@ class Results:
         state = self.__dict__.copy()
         del state['procedure']
         del state['procedure_class']
+        del state['_lock']
         return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
+        self.__dict__.setdefault('_live', None)
+        self._lock = threading.RLock()
 
         # Restore the procedure
         module = SourceFileLoader(self._module, self._file).load_module()
@@ -330,14 +815,12 @@ class Results:
             return
 
         for filename in self.data_filenames:
-            with open(filename, 'r+', encoding=Results.ENCODING) as f:
-                contents = f.readlines()
-                contents.insert(self._header_count - 1, c_header)
-
-                f.seek(0)
-                f.writelines(contents)
+            get_storage(filename).insert_metadata(filename, self._header_count - 1, c_header)
 
         self._header_count += self._metadata_count
+        # The inserted lines shift the byte offsets of the data, so read the file anew
+        with self._lock:
+            self._reset_reader()
 
     @staticmethod
     def parse_header(header, procedure_class=None):
@@ -415,9 +898,10 @@ class Results:
         header = ""
         header_read = False
         header_count = 0
-        with open(data_filename, "r", encoding=Results.ENCODING) as f:
+        # Binary mode, as the header may be followed by binary data
+        with open(data_filename, "rb") as f:
             while not header_read:
-                line = f.readline()
+                line = f.readline().decode(Results.ENCODING)
                 if line.startswith(Results.COMMENT):
                     header += line.strip('\t\v\n\r\f') + Results.LINE_BREAK
                     header_count += 1
@@ -430,57 +914,103 @@ class Results:
 
     @property
     def data(self):
-        # Need to update header count for correct referencing
-        if self._header_count == -1:
-            self._header_count = len(
-                self.header()[-1].split(Results.LINE_BREAK))
-        if self._data is None or len(self._data) == 0:
-            # Data has not been read
-            try:
-                self.reload()
-            except Exception:
-                # Empty dataframe
-                self._data = pd.DataFrame(columns=self.procedure.DATA_COLUMNS)
-        else:  # Concatenate additional data, if any, to already loaded data
-            skiprows = len(self._data) + self._header_count
-            chunks = pd.read_csv(
-                self.data_filename,
-                comment=Results.COMMENT,
-                header=0,
-                names=self._data.columns,
-                chunksize=Results.CHUNK_SIZE,
-                skiprows=skiprows,
-                iterator=True,
-                encoding=Results.ENCODING,
-            )
+        """ The data of the file as a :class:`pandas.DataFrame`.
+
+        Only the lines, which were appended to the file since the last access, are parsed.
+        While the results are live (see :meth:`start_live`), the data is served from memory.
+        """
+        with self._lock:
+            if self._live is not None:
+                return self._live.frame
             try:
-                tmp_frame = pd.concat(chunks, ignore_index=True)
-                # only append new data if there is any
-                # if no new data, tmp_frame dtype is object, which override's
-                # self._data's original dtype - this can cause problems plotting
-                # (e.g. if trying to plot int data on a log axis)
-                if len(tmp_frame) > 0:
-                    self._data = pd.concat([self._data, tmp_frame],
-                                           ignore_index=True)
-            except Exception:
-                pass  # All data is up to date
-        return self._data
+                self._read_new_rows()
+            except (OSError, ValueError):
+                pass  # No new data available or file not (yet) readable
+            frame = self._buffer.frame
+        if self._buffer.columns is None:
+            frame = pd.DataFrame(columns=self.procedure.DATA_COLUMNS)
+        return frame
 
     def reload(self):
         """ Preforms a full reloading of the file data, neglecting
         any changes in the comments
+
+        Does nothing while the results are live, as the live data is complete anyway.
         """
-        chunks = pd.read_csv(
-            self.data_filename,
-            comment=Results.COMMENT,
-            chunksize=Results.CHUNK_SIZE,
-            iterator=True,
-            encoding=Results.ENCODING,
-        )
-        try:
-            self._data = pd.concat(chunks, ignore_index=True)
-        except Exception:
-            self._data = chunks.read()
+        with self._lock:
+            if self._live is not None:
+                return
+            self._reset_reader()
+            self._read_new_rows()
+
+    @property
+    def live(self):
+        """ Whether :attr:`data` is served from the in-memory buffer filled by :meth:`push`. """
+        return self._live is not None
+
+    def start_live(self):
+        """ Serves :attr:`data` from an in-memory buffer, which is filled by :meth:`push`,
+        instead of reading the data file.
+
+        The :class:`~pymeasure.experiment.workers.Worker` calls it before running the
+        procedure, such that plots and tables do not have to read back the written data.
+        """
+        with self._lock:
+            self._live = DataBuffer(self.procedure.DATA_COLUMNS, capacity=Results.CHUNK_SIZE)
+
+    def push(self, record):
+        """ Appends an emitted record (a row or a block of rows, see :func:`is_data_block`)
+        to the live buffer, converted to the column units.
+
+        :return: the converted record, which can be written without further conversion.
+        :raises ValueError: If the record cannot be stored in the data file, e.g. strings in a
+            binary data file (see :class:`BinaryStorage`).
+        """
+        if self._live is None:
+            return record
+        if is_data_block(record):
+            record = self.formatter.convert_block(record)
+            self.storage.validate(record)
+            with self._lock:
+                self._live.append(record)
+        else:
+            record = {column: self.formatter.convert(column, record.get(column, float("nan")))
+                      for column in self.formatter.columns}
+            self.storage.validate(record)
+            with self._lock:
+                self._live.append_row(record)
+        return record
+
+    def stop_live(self):
+        """ Serves :attr:`data` from the data file again.
+
+        Call it once all pushed records are written to the file. The pushed rows are kept,
+        such that the file is not read again, and only rows appended later are read from it.
+        """
+        with self._lock:
+            live, self._live = self._live, None
+            if live is None:
+                return
+            try:
+                self._offset = os.path.getsize(self.data_filename)
+            except OSError:
+                self._reset_reader()
+            else:
+                self._buffer = live
+
+    def _reset_reader(self):
+        """ Forgets all data read so far, such that the next read starts at the beginning. """
+        self._offset = 0
+        self._buffer = DataBuffer(capacity=Results.CHUNK_SIZE)
+
+    def _read_new_rows(self):
+        """ Reads the rows appended to the data file since the last read
+        and appends them to the data buffer.
+        """
+        frame, self._offset = self.storage.read(
+            self.data_filename, self._offset, self._buffer.columns)
+        if frame is not None:
+            self._buffer.append(frame)
 
     def __repr__(self):
         return "<{}(filename='{}',procedure={},shape={})>".format(
@@ -24,7 +24,9 @@
 
 import logging
 import re
-from itertools import product
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate
 
 import numpy as np
 
@@ -50,6 +52,14 @@ class SequenceItem(object):
         self.parameter = parameter
         self.expression = expression
         self.parent = parent
+        self._values = None
+
+    def values(self):
+        """ Return the evaluated expression, which is cached until the expression changes """
+        if self._values is None or self._values[0] != self.expression:
+            values = SequenceHandler.eval_string(self.expression, self.parameter, self.level)
+            self._values = (self.expression, values)
+        return self._values[1]
 
     def __getitem__(self, idx):
         if idx in self.column_map:
@@ -67,6 +77,72 @@ class SequenceItem(object):
         return "{} \"{}\", \"{}\"".format("-" * (self.level + 1), self.parameter, self.expression)
 
 
+class ParametersSequence(Sequence):
+    """ Lazy sequence of the parameters settings of a sequence tree.
+
+    Each item is a tuple of dictionaries, one ``{parameter: value}`` per level, like
+    ``({"P1": 1}, {"P2": 3})``. The items are generated on demand: the length is
+    calculated from the number of values of each node and an item is computed from its
+    index, without expanding the tree.
+
+    :param nodes: list of the root nodes, each node is a tuple of the parameter name,
+        the values and a list of its children nodes
+    """
+
+    def __init__(self, nodes):
+        self._nodes = [self._node(*node) for node in nodes]
+        self._offsets = list(accumulate(node[3] for node in self._nodes))
+
+    @classmethod
+    def _node(cls, parameter, values, children):
+        """ Return a node as tuple (parameter, values, children, length, children_offsets) """
+        children = [cls._node(*child) for child in children]
+        offsets = list(accumulate(child[3] for child in children))
+        length = len(values) * (offsets[-1] if children else 1)
+        return parameter, values, children, length, offsets
+
+    def __len__(self):
+        return self._offsets[-1] if self._offsets else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("sequence index out of range")
+        return self._item(self._nodes, self._offsets, index)
+
+    @classmethod
+    def _item(cls, nodes, offsets, index):
+        """ Return the item of given index of the concatenated sequences of `nodes` """
+        position = bisect_right(offsets, index)
+        index -= offsets[position - 1] if position else 0
+        parameter, values, children, _, children_offsets = nodes[position]
+        if not children:
+            return ({parameter: values[index]},)
+        value_index, index = divmod(index, children_offsets[-1])
+        return ({parameter: values[value_index]},
+                *cls._item(children, children_offsets, index))
+
+    def __iter__(self):
+        for node in self._nodes:
+            yield from self._iter_node(node)
+
+    @classmethod
+    def _iter_node(cls, node):
+        parameter, values, children = node[:3]
+        for value in values:
+            entry = {parameter: value}
+            if children:
+                for child in children:
+                    for item in cls._iter_node(child):
+                        yield (entry, *item)
+            else:
+                yield (entry,)
+
+
 class SequenceHandler:
     """ It represents a sequence, that is a tree of parameter sweep.
 
@@ -354,72 +430,28 @@ class SequenceHandler:
 
     def parameters_sequence(self, names_map=None):
         """
-        Generate a list of parameters from the sequence tree.
+        Generate the sequence of parameters settings from the sequence tree.
+
+        The expression of each node is evaluated (and cached) when calling this method, but
+        the items are generated only when they are accessed, see :class:`ParametersSequence`.
 
         :param names_map: an optional dict to map parameter name
-        :return: A list of dictionaries. Each dictionary represents a parameters setting
-        for running an experiment.
+        :return: A lazy sequence of tuples of dictionaries. Each tuple represents a
+            parameters setting for running an experiment.
         """
 
-        sequences = []
-        current_sequence = [[] for i in range(self.MAXDEPTH)]
-        temp_sequence = [[] for i in range(self.MAXDEPTH)]
-
-        idx = 0
-        while (idx < len(self._sequences)):
-            depth, parameter, seq = self._sequences[idx].level, \
-                self._sequences[idx].parameter, \
-                self._sequences[idx].expression
-            values = self.eval_string(seq, parameter, depth)
-            if names_map is not None:
-                parameter = names_map[parameter]
-
+        def node(seq_item):
+            values = seq_item.values()
             try:
-                sequence_entry = [{parameter: value} for value in values]
+                len(values)
             except TypeError:
                 log.error(
                     "TypeError, likely no sequence for one of the parameters"
                 )
-            else:
-                current_sequence[depth].extend(sequence_entry)
+                values = ()
+            parameter = seq_item.parameter
+            if names_map is not None:
+                parameter = names_map[parameter]
+            return parameter, values, [node(child) for child in self.children(seq_item)]
 
-            idx += 1
-            next_depth = -1 if idx >= len(self._sequences) else self._sequences[idx].level
-
-            for depth_idx in range(depth, next_depth, -1):
-                temp_sequence[depth_idx].extend(current_sequence[depth_idx])
-
-                if depth_idx != 0:
-                    sequence_products = list(product(
-                        current_sequence[depth_idx - 1],
-                        temp_sequence[depth_idx]
-                    ))
-
-                    for i in range(len(sequence_products)):
-                        try:
-                            element = sequence_products[i][1]
-                        except IndexError:
-                            log.error(
-                                "IndexError, likely empty nested parameter"
-                            )
-                        else:
-                            if isinstance(element, tuple):
-                                sequence_products[i] = (
-                                    sequence_products[i][0], *element)
-
-                    temp_sequence[depth_idx - 1].extend(sequence_products)
-                    temp_sequence[depth_idx] = []
-
-                current_sequence[depth_idx] = []
-                current_sequence[depth_idx - 1] = []
-
-            if depth == next_depth:
-                temp_sequence[depth].extend(current_sequence[depth])
-                current_sequence[depth] = []
-
-        sequences = temp_sequence[0]
-
-        for idx in range(len(sequences)):
-            if not isinstance(sequences[idx], tuple):
-                sequences[idx] = (sequences[idx],)
-        return sequences
+        return ParametersSequence([node(seq_item) for seq_item in self.children(None)])
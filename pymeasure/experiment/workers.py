@@ -25,11 +25,15 @@
 import logging
 import time
 import traceback
-from queue import Queue
+from logging.handlers import QueueHandler
+from queue import Empty, Queue
+from threading import Thread
 
 from .listeners import Recorder
 from .procedure import Procedure
 from .results import Results
+from ..log import TopicQueueHandler
+from ..process import StoppableProcess, context as process_context
 from ..thread import StoppableThread
 
 log = logging.getLogger(__name__)
@@ -44,10 +48,55 @@ except ImportError:
     log.warning("ZMQ and cloudpickle are required for TCP communication")
 
 
+def _open_publisher(port):
+    """ Returns a ZMQ context and a PUB socket bound to the port, or two
+    :code:`None` if no port is given or the socket cannot be set up.
+    """
+    if port is None or zmq is None:
+        return None, None
+    try:
+        context = zmq.Context()
+        log.debug("Worker ZMQ Context: %r" % context)
+        publisher = context.socket(zmq.PUB)
+        publisher.bind('tcp://*:%d' % port)
+        log.info("Worker connected to tcp://*:%d" % port)
+        # wait so that the socket will be ready before starting to emit messages
+        time.sleep(0.3)
+    except Exception:
+        log.exception("Couldn't establish ZMQ publisher!")
+        return None, None
+    return context, publisher
+
+
+def _publish(publisher, topic, record):
+    """ Sends a record of some topic over the ZMQ publisher, if there is one. """
+    try:
+        publisher.send_serialized(
+            record,
+            serialize=lambda rec: (topic.encode(), cloudpickle.dumps(rec)),
+        )
+    except (NameError, AttributeError):
+        pass  # No dumps defined
+
+
+def _close_publisher(context, publisher):
+    if context is not None:
+        # Cleanly close down ZMQ context and associated socket
+        # For some reason, we need to close the socket before the
+        # context, otherwise context termination hangs.
+        publisher.close()
+        context.term()
+
+
 class Worker(StoppableThread):
     """ Worker runs the procedure and emits information about
     the procedure and its status over a ZMQ TCP port. In a child
     thread, a Recorder is run to write the results to
+
+    While the procedure runs, the emitted results are also pushed into the in-memory live
+    buffer of the :class:`~pymeasure.experiment.results.Results` (see
+    :meth:`~pymeasure.experiment.results.Results.start_live`), from which the plots and
+    tables read them instead of parsing the data file.
     """
 
     def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None):
@@ -79,21 +128,7 @@ class Worker(StoppableThread):
         # log.addHandler(TopicQueueHandler(self.monitor_queue))
         # log.addHandler(QueueHandler(self.log_queue))
 
-        self.context = None
-        self.publisher = None
-        if self.port is not None and zmq is not None:
-            try:
-                self.context = zmq.Context()
-                log.debug("Worker ZMQ Context: %r" % self.context)
-                self.publisher = self.context.socket(zmq.PUB)
-                self.publisher.bind('tcp://*:%d' % self.port)
-                log.info("Worker connected to tcp://*:%d" % self.port)
-                # wait so that the socket will be ready before starting to emit messages
-                time.sleep(0.3)
-            except Exception:
-                log.exception("Couldn't establish ZMQ publisher!")
-                self.context = None
-                self.publisher = None
+        self.context, self.publisher = _open_publisher(self.port)
 
     def join(self, timeout=0):
         try:
@@ -107,15 +142,9 @@ class Worker(StoppableThread):
         """ Emits data of some topic over TCP """
         log.debug("Emitting message: %s %s", topic, record)
 
-        try:
-            self.publisher.send_serialized(
-                record,
-                serialize=lambda rec: (topic.encode(), cloudpickle.dumps(rec)),
-            )
-        except (NameError, AttributeError):
-            pass  # No dumps defined
+        _publish(self.publisher, topic, record)
         if topic == 'results':
-            self.recorder.handle(record)
+            self.recorder.handle(self.results.push(record))
         elif topic == 'status' or topic == 'progress':
             self.monitor_queue.put((topic, record))
 
@@ -143,13 +172,9 @@ class Worker(StoppableThread):
             self.emit('progress', 100.)
 
         self.recorder.stop()
+        self.results.stop_live()
         self.monitor_queue.put(None)
-        if self.context is not None:
-            # Cleanly close down ZMQ context and associated socket
-            # For some reason, we need to close the socket before the
-            # context, otherwise context termination hangs.
-            self.publisher.close()
-            self.context.term()
+        _close_publisher(self.context, self.publisher)
 
     def run(self):
         log.info("Worker thread started")
@@ -158,6 +183,7 @@ class Worker(StoppableThread):
 
         self.recorder = Recorder(self.results, self.recorder_queue)
         self.recorder.start()
+        self.results.start_live()
 
         # locals()[self.procedures_file] = __import__(self.procedures_file)
 
@@ -188,3 +214,203 @@ class Worker(StoppableThread):
             self.procedure.__class__.__name__,
             self.should_stop()
         )
+
+
+class _ChannelLogHandler(TopicQueueHandler):
+    """ Sends log records of the worker process through the channel to the parent,
+    prepared such that they can be pickled.
+    """
+
+    def prepare(self, record):
+        return self.topic, QueueHandler.prepare(self, record)
+
+
+class ProcessWorker(StoppableProcess):
+    """ ProcessWorker runs the procedure in a separate process, such that CPU-heavy
+    procedures neither hold the GIL of the graphical interface nor slow down its plots.
+    It is a drop-in replacement for the :class:`Worker`, e.g. as :code:`worker_class`
+    of the :class:`~pymeasure.display.manager.BaseManager`.
+
+    Within the process, :meth:`Procedure.emit <pymeasure.experiment.procedure.Procedure.emit>`
+    sends the results, status and progress through a queue back to the parent process.
+    There, a relay thread hands the results to the :class:`Recorder` and the live buffer
+    of the :class:`~pymeasure.experiment.results.Results`, puts status and progress into
+    the :attr:`monitor_queue`, forwards the log records to the loggers of the parent and
+    publishes everything over the ZMQ TCP port. :meth:`stop` aborts the procedure across
+    the process boundary, as :code:`Procedure.should_stop` returns True afterwards.
+
+    The procedure is transferred to the new process when the worker starts, so it has to
+    be picklable if the processes are spawned (the default on Windows and macOS), which
+    requires that its class can be imported. Instruments should be connected within
+    :meth:`Procedure.startup <pymeasure.experiment.procedure.Procedure.startup>`.
+    """
+
+    #: Attributes which stay in the parent process
+    _parent_attributes = ('results', 'recorder', 'recorder_queue', 'monitor_queue',
+                          'log_queue', 'context', 'publisher', '_relay')
+
+    def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None):
+        super().__init__()
+
+        self.port = port
+        if not isinstance(results, Results):
+            raise ValueError("Invalid Results object during Worker construction")
+        self.results = results
+        self.procedure = results.procedure
+        self.procedure.check_parameters()
+        self.procedure.status = Procedure.QUEUED
+
+        self.recorder = None
+        self.recorder_queue = Queue()
+
+        self.monitor_queue = Queue()
+        if log_queue is None:
+            log_queue = Queue()
+        self.log_queue = log_queue
+        self.log_level = log_level
+
+        self._channel = process_context.Queue()
+        self._relay = None
+        self.context, self.publisher = _open_publisher(self.port)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self._parent_attributes:
+            state.pop(name, None)
+        return state
+
+    def start(self):
+        super().start()
+
+        self.recorder = Recorder(self.results, self.recorder_queue)
+        self.recorder.start()
+        self.results.start_live()
+
+        self._relay = Thread(target=self._relay_messages, daemon=True)
+        self._relay.start()
+
+    def join(self, timeout=0):
+        try:
+            super().join(timeout)
+            if self._relay is not None:
+                self._relay.join(timeout)
+            # The process ends shortly after its procedure, wait for it to exit as well
+            super(StoppableProcess, self).join(timeout)
+        except (KeyboardInterrupt, SystemExit):
+            log.warning("User stopped Worker join prematurely")
+            self.stop()
+            super().join(0)
+
+    # Parent process
+
+    def _relay_messages(self):
+        """ Dispatches the messages of the process until it shuts down or dies. """
+        status = Procedure.QUEUED
+        while True:
+            try:
+                message = self._channel.get(timeout=0.1)
+            except Empty:
+                if self.exitcode is None:
+                    continue
+                log.error("Worker process exited unexpectedly with code %s", self.exitcode)
+                if status in (Procedure.QUEUED, Procedure.RUNNING):
+                    self._dispatch('status', Procedure.FAILED)
+                break
+            if message is None:
+                break
+            topic, record = message
+            if topic == 'status':
+                status = record
+            self._dispatch(topic, record)
+
+        self.recorder.stop()
+        self.results.stop_live()
+        self.monitor_queue.put(None)
+        _close_publisher(self.context, self.publisher)
+
+    def _dispatch(self, topic, record):
+        if topic == 'log':
+            logging.getLogger(record.name).handle(record)
+            return
+        if topic == 'metadata':
+            procedure = self.results.procedure
+            procedure._metadata = record
+            for name, metadata in record.items():
+                setattr(procedure, name, metadata.value)
+            self.results.store_metadata()
+            return
+
+        _publish(self.publisher, topic, record)
+        if topic == 'results':
+            self.recorder.handle(self.results.push(record))
+        elif topic == 'status' or topic == 'progress':
+            if topic == 'status':
+                self.results.procedure.status = record
+            self.monitor_queue.put((topic, record))
+
+    # Worker process
+
+    def emit(self, topic, record):
+        """ Emits data of some topic to the parent process """
+        self._channel.put((topic, record))
+
+    def handle_abort(self):
+        log.exception("User stopped Worker execution prematurely")
+        self.update_status(Procedure.ABORTED)
+
+    def handle_error(self):
+        log.exception("Worker caught an error on %r", self.procedure)
+        traceback_str = traceback.format_exc()
+        self.emit('error', traceback_str)
+        self.update_status(Procedure.FAILED)
+
+    def update_status(self, status):
+        self.procedure.status = status
+        self.emit('status', status)
+
+    def shutdown(self):
+        self.procedure.shutdown()
+
+        if self.should_stop() and self.procedure.status == Procedure.RUNNING:
+            self.update_status(Procedure.ABORTED)
+        elif self.procedure.status == Procedure.RUNNING:
+            self.update_status(Procedure.FINISHED)
+            self.emit('progress', 100.)
+
+        self._channel.put(None)
+        self._channel.close()
+        self._channel.join_thread()
+
+    def run(self):
+        root = logging.getLogger()
+        root.handlers = [_ChannelLogHandler(self._channel)]
+        root.setLevel(self.log_level)
+        log.info("Worker process started")
+
+        # route Procedure methods & log
+        self.procedure.should_stop = self.should_stop
+        self.procedure.emit = self.emit
+
+        log.info("Worker started running an instance of %r", self.procedure.__class__.__name__)
+        self.update_status(Procedure.RUNNING)
+        self.emit('progress', 0.)
+
+        try:
+            self.procedure.startup()
+            self.procedure.evaluate_metadata()
+            self.emit('metadata', self.procedure.metadata_objects())
+            self.procedure.execute()
+        except (KeyboardInterrupt, SystemExit):
+            self.handle_abort()
+        except Exception:
+            self.handle_error()
+        finally:
+            self.shutdown()
+            self.stop()
+
+    def __repr__(self):
+        return "<{}(port={},procedure={},should_stop={})>".format(
+            self.__class__.__name__, self.port,
+            self.procedure.__class__.__name__,
+            self.should_stop()
+        )
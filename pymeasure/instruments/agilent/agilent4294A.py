@@ -147,6 +147,16 @@ class Agilent4294A(SCPIMixin, Instrument):
 
         return path
 
+    def _float_values(self, command):
+        """Return the comma separated reply to `command` as a numpy array of floats.
+
+        :raises ValueError: If the reply contains non-numeric values.
+        """
+        values = self.values(command, as_array=True)
+        if values.dtype == object:
+            raise ValueError(f"Reply to '{command}' contains non-numeric values.")
+        return values
+
     def get_data(self, path=None):
         """
         Get the measurement data from the instrument after completion.
@@ -157,12 +167,12 @@ class Agilent4294A(SCPIMixin, Instrument):
         prev_active_trace = self.active_trace
 
         num_points = self.num_points
-        freqs = np.array(self.ask("OUTPSWPRM?").split(","), dtype=float)
+        freqs = self._float_values("OUTPSWPRM?")
         self.active_trace = "A"
-        adata = np.array(self.ask("OUTPDTRC?").split(","), dtype=float).reshape(num_points, 2)
+        adata = self._float_values("OUTPDTRC?").reshape(num_points, 2)
 
         self.active_trace = "B"
-        bdata = np.array(self.ask("OUTPDTRC?").split(","), dtype=float).reshape(num_points, 2)
+        bdata = self._float_values("OUTPDTRC?").reshape(num_points, 2)
 
         # restore the previous state
         self.active_trace = prev_active_trace
@@ -390,6 +390,20 @@ class AgilentB1500(SCPIUnknownMixin, Instrument):
             else:
                 log_failed()
 
+        def channel_number(self, channel_string):
+            """Returns channel number (or GNDU/MISC) for given channel letter.
+
+            :param channel_string: Channel string returned by the instrument
+            :type channel_string: str
+            :return: Channel number
+            :rtype: int or str
+            """
+            channel = self.channels[channel_string]
+            if isinstance(channel, int):
+                channel = int(str(channel)[0:-2])
+                # subchannels not relevant for SMU/CMU
+            return channel
+
         def format_channel_check_status(self, status_string, channel_string):
             """Returns channel number for given channel letter.
             Checks for not null status of the channel and writes according
@@ -403,10 +417,7 @@ class AgilentB1500(SCPIUnknownMixin, Instrument):
             :return: Channel name
             :rtype: str
             """
-            channel = self.channels[channel_string]
-            if isinstance(channel, int):
-                channel = int(str(channel)[0:-2])
-                # subchannels not relevant for SMU/CMU
+            channel = self.channel_number(channel_string)
             try:
                 smu_name = self.smu_names[channel]
                 if 'SMU' in smu_name:
@@ -418,10 +429,66 @@ class AgilentB1500(SCPIUnknownMixin, Instrument):
                 self.check_status(status_string)
                 return channel
 
+        def format_columns(self, data, number_of_points, checked=None):
+            """ Format many measurement values at once, column by column.
+
+            The fixed width values are decoded with NumPy instead of one by
+            one with :meth:`format_single`. The status is checked (and
+            logged) only once per distinct status of each channel.
+
+            :param data: Measurement values read from the instrument,
+                         separated by commas
+            :type data: str or bytes
+            :param number_of_points: Number of measurement points in data
+            :type number_of_points: int
+            :param checked: Set of (channel, status) pairs which were already
+                            checked. It is updated in place, defaults to None
+            :type checked: set, optional
+            :return: Channel, data name, statuses and values of each column
+            :rtype: list of (str, str, numpy.ndarray, numpy.ndarray)
+            """
+            if isinstance(data, str):
+                data = data.encode("ASCII")
+            data = np.frombuffer(data.rstrip(b'\r\n,') + b',', dtype="S1")
+            # ',' separates values, the last value gets one to fit the size
+            if data.size % (self.size * number_of_points):
+                raise ValueError(
+                    f"{data.size} bytes of data do not split into "
+                    f"{number_of_points} points of {self.format} values.")
+            data = data.reshape(number_of_points, -1, self.size)
+            if checked is None:
+                checked = set()
+            width = self.status_width
+            statuses = np.ascontiguousarray(data[:, :, :width])
+            statuses = statuses.view(f"S{width}")[:, :, 0].astype(str)
+            values = np.ascontiguousarray(data[:, :, width + 2:-1])
+            values = values.view(f"S{self.size - width - 3}")[:, :, 0]
+            values = values.astype(np.float64)
+            columns = []
+            for index in range(data.shape[1]):
+                channel_string = data[0, index, width].decode("ASCII")
+                data_name = data[0, index, width + 1].decode("ASCII")
+                data_name = self.data_names[data_name]
+                for status in np.unique(statuses[:, index]):
+                    if (channel_string, status) not in checked:
+                        checked.add((channel_string, status))
+                        self.format_channel_check_status(
+                            str(status), channel_string)
+                channel = self.channel_number(channel_string)
+                channel = self.smu_names.get(channel, channel)
+                value = values[:, index]
+                if data_name in self.data_names_int:
+                    value = value.astype(int)
+                columns.append(
+                    (channel, data_name, statuses[:, index], value))
+            return columns
+
     class _data_formatting_FMT1(_data_formatting_generic):
         """ Data formatting for FMT1 format
         """
 
+        status_width = 1  # one character
+
         def __init__(self, smu_names={}, output_format_string="FMT1"):
             super().__init__(smu_names, output_format_string)
 
@@ -456,6 +523,8 @@ class AgilentB1500(SCPIUnknownMixin, Instrument):
         """ Data formatting for FMT21 format
         """
 
+        status_width = 3  # three digits
+
         def __init__(self, smu_names={}):
             super().__init__(smu_names, "FMT21")
 
@@ -857,18 +926,13 @@ class AgilentB1500(SCPIUnknownMixin, Instrument):
         :return: Measurement Data
         :rtype: pd.DataFrame
         """
-        data = self.read()
-        data = data.split(',')
-        data = np.array(data)
-        data = np.split(data, number_of_points)
-        data = pd.DataFrame(data=data)
-        data = data.applymap(self._data_format.format_single)
-        heads = data.iloc[[0]].applymap(lambda x: ' '.join(x[1:3]))
+        columns = self._data_format.format_columns(
+            self.read(), number_of_points)
+        data = pd.DataFrame(
+            {index: column[3] for index, column in enumerate(columns)})
+        data.columns = [f"{channel} {data_name}"
+                        for channel, data_name, *_ in columns]
         # channel & data_type
-        heads = heads.to_numpy().tolist()  # 2D List
-        heads = heads[0]  # first row
-        data = data.applymap(lambda x: x[3])
-        data.columns = heads
         return data
 
     def read_channels(self, nchannels):
@@ -890,6 +954,31 @@ class AgilentB1500(SCPIUnknownMixin, Instrument):
         data = tuple(data)
         return data
 
+    def iter_channels(self, nchannels, number_of_points=None):
+        """ Yields the data of one measurement point after the other as soon
+        as the instrument returns it, like repeated calls of
+        :meth:`read_channels`. The status of each channel is logged only once
+        per distinct status instead of for every point.
+
+        :param nchannels: Number of channels which return data
+        :type nchannels: int
+        :param number_of_points: Number of measurement points to read,
+                                 defaults to None (up to the last data point)
+        :type number_of_points: int, optional
+        :return: Measurement data of each point
+        :rtype: generator of tuple
+        """
+        checked = set()
+        count = 0
+        while number_of_points is None or count < number_of_points:
+            data = self.read_bytes(self._data_format.size * nchannels)
+            columns = self._data_format.format_columns(data, 1, checked)
+            yield tuple((status.item(0), channel, data_name, value.item(0))
+                        for channel, data_name, status, value in columns)
+            count += 1
+            if data.endswith(b'\r'):
+                break  # ',' if more data in buffer, '\r' if last data point
+
     ######################################
     # Queries on all SMUs
     ######################################
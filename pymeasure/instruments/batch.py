@@ -0,0 +1,209 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class _ReadRequested(Exception):
+    """Raised while recording a batch item, once the item wants to read the reply."""
+
+
+class _NotBatchable(Exception):
+    """Raised while recording a batch item, if the item uses communication not batchable."""
+
+
+class _Recording:
+    """Batch state of an instrument, which records the written commands instead of sending."""
+
+    def __init__(self):
+        self.commands = []
+
+    def write(self, instrument, command):
+        self.commands.append(command)
+
+    def read(self, instrument):
+        raise _ReadRequested
+
+    def communicate(self, instrument):
+        raise _NotBatchable
+
+
+class _Replay:
+    """Batch state of an instrument, which returns an already received reply."""
+
+    def __init__(self, reply):
+        self.reply = reply
+
+    def write(self, instrument, command):
+        pass  # Already sent in the compound command
+
+    def read(self, instrument):
+        # Any further communication of the item goes directly to the device
+        instrument._batch_state = None
+        return self.reply
+
+    def communicate(self, instrument):
+        raise _NotBatchable
+
+
+class BatchItem:
+    """A property read or write of a :class:`Batch`.
+
+    After the batch has been executed, :attr:`value` contains the value read (None for writes).
+    """
+
+    def __init__(self, obj, name, value=None, write=False):
+        self.obj = obj
+        self.name = name
+        self.value = value
+        self.write = write
+        self.command = None
+
+    def run(self):
+        """Read or write the property as usual."""
+        if self.write:
+            setattr(self.obj, self.name, self.value)
+        else:
+            self.value = getattr(self.obj, self.name)
+
+    def __repr__(self):
+        return f"<BatchItem({self.name!r}, value={self.value!r}, write={self.write})>"
+
+
+class Batch:
+    """Collect property reads and writes of an instrument (and its channels) and send them
+    in one compound command, such that several properties cost only one round trip.
+
+    Use it via :meth:`~pymeasure.instruments.Instrument.batch`:
+
+    .. code::
+
+        with instrument.batch() as batch:
+            voltage = batch.get("voltage")
+            current = batch.get("current")
+            batch.set("source_enabled", True)
+        print(voltage.value, current.value)
+
+    Each property is first executed in a recording mode to find its command without
+    communicating. The commands are joined with
+    :meth:`~pymeasure.instruments.Instrument.join_batch_commands`, the reply is split at
+    :attr:`~pymeasure.instruments.Instrument.batch_separator` and each part is processed by the
+    property itself, i.e. by its `get_process` and `map_values`. Properties requiring more than
+    one command (e.g. with `check_set_errors`) or binary communication are executed sequentially,
+    in order. If the instrument does not support compound commands, all items are executed
+    sequentially.
+
+    :param instrument: The :class:`~pymeasure.instruments.Instrument` to communicate with.
+    :param separator: Separator of the commands and replies, defaults to the
+        `batch_separator` of the instrument. None executes the items sequentially.
+    """
+
+    def __init__(self, instrument, separator=None):
+        self.instrument = instrument
+        self.separator = instrument.batch_separator if separator is None else separator
+        self.items = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
+
+    def get(self, name, obj=None):
+        """Add reading the property `name` of `obj` (default the instrument).
+
+        :return: :class:`BatchItem`, whose `value` is set upon execution.
+        """
+        item = BatchItem(self.instrument if obj is None else obj, name)
+        self.items.append(item)
+        return item
+
+    def set(self, name, value, obj=None):
+        """Add setting the property `name` of `obj` (default the instrument) to `value`.
+
+        :return: :class:`BatchItem`.
+        """
+        item = BatchItem(self.instrument if obj is None else obj, name, value, write=True)
+        self.items.append(item)
+        return item
+
+    def execute(self):
+        """Communicate with the instrument and fill in the values of the items."""
+        items, self.items = self.items, []
+        segment = []
+        with self.instrument.transaction():
+            for item in items:
+                if self.separator is not None and self._record(item):
+                    segment.append(item)
+                else:
+                    self._send(segment)
+                    segment = []
+                    item.run()
+            self._send(segment)
+
+    def _record(self, item):
+        """Find the command of an item and return whether it can be part of a compound."""
+        state = _Recording()
+        self.instrument._batch_state = state
+        try:
+            item.run()
+        except _ReadRequested:
+            query = True
+        except _NotBatchable:
+            return False
+        else:
+            query = False
+        finally:
+            self.instrument._batch_state = None
+        if len(state.commands) != 1 or query == item.write:
+            return False
+        item.command = state.commands[0]
+        return True
+
+    def _send(self, items):
+        """Send the items as one compound command and process the replies."""
+        if len(items) < 2:
+            for item in items:
+                item.run()
+            return
+        self.instrument.write(self.instrument.join_batch_commands(
+            [item.command for item in items], self.separator))
+        queries = [item for item in items if not item.write]
+        if not queries:
+            return
+        self.instrument.wait_for()
+        replies = self.instrument.read().split(self.separator)
+        if len(replies) != len(queries):
+            raise ValueError(f"Received {len(replies)} replies for {len(queries)} queries "
+                             f"of a batch: {replies}.")
+        for item, reply in zip(queries, replies):
+            self.instrument._batch_state = _Replay(reply)
+            try:
+                item.run()
+            finally:
+                self.instrument._batch_state = None
@@ -61,6 +61,15 @@ class Channel(CommonBase):
         return command.format_map({self.placeholder: self.id})
 
     # Calls to the instrument
+    def transaction(self):
+        """Return a context manager reserving the parent's connection for a sequence of
+        messages."""
+        return self.parent.transaction()
+
+    def run_async(self, function, *args, **kwargs):
+        """Run a blocking `function` in the worker thread of the parent's adapter."""
+        return self.parent.run_async(function, *args, **kwargs)
+
     def write(self, command, **kwargs):
         """Write a string command to the instrument appending `write_termination`.
 
@@ -102,6 +111,10 @@ class Channel(CommonBase):
         """Read binary values from the instrument."""
         return self.parent.read_binary_values(**kwargs)
 
+    def read_binary_block(self, **kwargs):
+        """Read an IEEE 488.2 binary block from the instrument."""
+        return self.parent.read_binary_block(**kwargs)
+
     def check_errors(self):
         """Read all errors from the instrument and log them.
 
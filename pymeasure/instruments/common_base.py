@@ -22,14 +22,65 @@
 # THE SOFTWARE.
 #
 
+from contextlib import nullcontext
+from functools import partial
 from inspect import getmembers
 import logging
-from warnings import warn
+from warnings import catch_warnings, simplefilter, warn
+
+import numpy as np
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+def _cast_bool(value):
+    """Cast a string to bool via float, as bool of a non-empty string is always True."""
+    return bool(float(value))
+
+
+# Types, which numpy can parse from a string directly, and the dtype to use.
+_ARRAY_DTYPES = {float: np.float64, int: np.int64, bool: np.float64}
+
+
+def _parse_array(string, separator, cast):
+    """Parse a string of numbers separated by `separator` into a numpy array in one go.
+
+    Return None if `cast` is not a numeric type or if not every token is a number.
+    """
+    try:
+        dtype = _ARRAY_DTYPES[cast]
+    except (KeyError, TypeError):
+        if isinstance(cast, type) and issubclass(cast, np.number):
+            dtype = cast
+        else:
+            return None
+    with catch_warnings():
+        # numpy warns (future versions raise) if the string could not be read to its end
+        simplefilter("ignore", DeprecationWarning)
+        try:
+            array = np.fromstring(string, dtype=dtype, sep=separator)
+        except ValueError:
+            return None
+    if array.size != string.count(separator) + 1:
+        return None
+    return array != 0 if cast is bool else array
+
+
+def _reverse_map(values):
+    """Return a dictionary mapping the values of `values` to their (first) keys.
+
+    Return None if the values cannot be used as keys.
+    """
+    reverse = {}
+    try:
+        for k, v in values.items():
+            reverse.setdefault(v, k)
+    except TypeError:
+        return None
+    return reverse
+
+
 class DynamicProperty(property):
     """ Class that allows managing python property behaviour in a "dynamic" fashion
 
@@ -61,8 +112,35 @@ class DynamicProperty(property):
         super().__init__(fget, fset, fdel, doc)
         self.fget_params_list = () if fget_params_list is None else fget_params_list
         self.fset_params_list = () if fset_params_list is None else fset_params_list
-        self.name = ""
         self.prefix = prefix
+        self.name = ""
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        # Precompute the names of the instance variables holding the parameters
+        self._fget_params_names = self._params_names(self.fget_params_list)
+        self._fset_params_names = self._params_names(self.fset_params_list)
+
+    def _params_names(self, params_list):
+        return tuple((attr, self.prefix + "_".join([self.name, attr])) for attr in params_list)
+
+    @staticmethod
+    def _get_params(obj, params_names):
+        """Collect the parameters, which are defined for the instance or its class."""
+        kwargs = {}
+        obj_dict = obj.__dict__
+        cls = type(obj)
+        for attr, attr_instance_name in params_names:
+            if attr_instance_name in obj_dict:
+                kwargs[attr] = obj_dict[attr_instance_name]
+            elif hasattr(cls, attr_instance_name):
+                kwargs[attr] = getattr(cls, attr_instance_name)
+        return kwargs
 
     def __get__(self, obj, objtype=None):
         if obj is None:
@@ -70,23 +148,12 @@ class DynamicProperty(property):
             return self
         if self.fget is None:
             raise AttributeError(f"Unreadable attribute {self.name}")
-
-        kwargs = {}
-        for attr in self.fget_params_list:
-            attr_instance_name = self.prefix + "_".join([self.name, attr])
-            if hasattr(obj, attr_instance_name):
-                kwargs[attr] = getattr(obj, attr_instance_name)
-        return self.fget(obj, **kwargs)
+        return self.fget(obj, **self._get_params(obj, self._fget_params_names))
 
     def __set__(self, obj, value):
         if self.fset is None:
             raise AttributeError(f"Can't set attribute {self.name}")
-        kwargs = {}
-        for attr in self.fset_params_list:
-            attr_instance_name = self.prefix + "_".join([self.name, attr])
-            if hasattr(obj, attr_instance_name):
-                kwargs[attr] = getattr(obj, attr_instance_name)
-        self.fset(obj, value, **kwargs)
+        self.fset(obj, value, **self._get_params(obj, self._fset_params_names))
 
     def __set_name__(self, owner, name):
         self.name = name
@@ -126,6 +193,9 @@ class CommonBase:
     # Prefix used to store reserved variables
     __reserved_prefix = "___"
 
+    # Names of the variables reserved for dynamic properties, replaced by a set in an instance
+    _special_names = frozenset()
+
     def __init__(self, preprocess_reply=None, **kwargs):
         self._special_names = self._setup_special_names()
         self._create_channels()
@@ -223,36 +293,50 @@ class CommonBase:
                 raise ValueError("Invalid definition of classes '{cls}' and ids '{id}'.")
             self.kwargs.setdefault("prefix", prefix)
 
+    @staticmethod
+    def _get_class_metadata(cls):
+        """Return the special names, the class level values of special names and the channel
+        creators of the class `cls`.
+
+        They are collected with :func:`inspect.getmembers` once per class, when the first
+        instance is created, and cached in the class. Later changes of the class attributes
+        are not noticed.
+        Internal method, not intended to be accessed at user level."""
+        try:
+            return cls.__dict__["_CommonBase__class_metadata"]
+        except KeyError:
+            pass
+        members = getmembers(cls)
+        dynamic_params = set(CommonBase._fget_params_list + CommonBase._fset_params_list)
+        special_names = frozenset(
+            attr_name + "_" + key
+            for attr_name, attr in members if isinstance(attr, DynamicProperty)
+            for key in dynamic_params)
+        special_values = tuple((attr_name, value) for attr_name, value in members
+                               if attr_name in special_names)
+        channels = tuple((attr_name, member) for attr_name, member in members
+                         if isinstance(member, CommonBase.BaseChannelCreator))
+        metadata = special_names, special_values, channels
+        cls.__class_metadata = metadata
+        return metadata
+
     def _setup_special_names(self):
-        """ Return list of class/instance special names.
+        """ Return set of class/instance special names.
 
         Compute the list of special names based on the list of
         class attributes that are a DynamicProperty. Check also for class variables
         with special name and copy them at instance level
         Internal method, not intended to be accessed at user level."""
-        special_names = []
-        dynamic_params = tuple(set(self._fget_params_list + self._fset_params_list))
-        # Check whether class variables of DynamicProperty type are present
-        for attr_name, attr in getmembers(self.__class__):
-            if isinstance(attr, DynamicProperty):
-                special_names += [attr_name + "_" + key for key in dynamic_params]
-        # Check if special variables are defined at class level
-        for attr, value in getmembers(self.__class__):
-            if attr in special_names:
-                # Copy class special variable at instance level, prefixing reserved_prefix
-                setattr(self, self.__reserved_prefix + attr, value)
+        special_names, special_values, _ = CommonBase._get_class_metadata(self.__class__)
+        for attr, value in special_values:
+            # Copy class special variable at instance level, prefixing reserved_prefix
+            setattr(self, self.__reserved_prefix + attr, value)
         return special_names
 
     @staticmethod
     def get_channels(cls):
         """Return a list of all the Instrument's ChannelCreator and MultiChannelCreator instances"""
-        class_members = getmembers(cls)
-
-        channels = []
-        for name, member in class_members:
-            if isinstance(member, CommonBase.BaseChannelCreator):
-                channels.append((name, member))
-        return channels
+        return list(CommonBase._get_class_metadata(cls)[2])
 
     @staticmethod
     def get_channel_pairs(cls):
@@ -281,20 +365,17 @@ class CommonBase:
 
     def __setattr__(self, name, value):
         """ Add reserved_prefix in front of special variables."""
-        if hasattr(self, '_special_names'):
-            if name in self._special_names:
-                name = self.__reserved_prefix + name
+        if name in self._special_names:
+            name = self.__reserved_prefix + name
         super().__setattr__(name, value)
 
     def __getattribute__(self, name):
         """ Prevent read access to variables with special names used to
         support dynamic property behaviour."""
-        if name in ('_special_names', '__dict__'):
-            return super().__getattribute__(name)
-        if hasattr(self, '_special_names'):
-            if name in self._special_names:
-                raise AttributeError(
-                    f"{name} is a reserved variable name and it cannot be read")
+        # Fetch the names directly from the object, as this method is called for every attribute
+        if name in object.__getattribute__(self, '_special_names'):
+            raise AttributeError(
+                f"{name} is a reserved variable name and it cannot be read")
         return super().__getattribute__(name)
 
     # Channel management
@@ -375,6 +456,14 @@ class CommonBase:
         """
         raise NotImplementedError("Implement in subclass!")
 
+    def transaction(self):
+        """Return a context manager reserving the communication for a sequence of messages.
+
+        While the current thread is inside the context, other threads sharing the same
+        connection (e.g. instruments on the same GPIB bus) cannot interleave their messages.
+        """
+        return nullcontext()
+
     def ask(self, command, query_delay=None):
         """Write a command to the instrument and return the read response.
 
@@ -382,12 +471,13 @@ class CommonBase:
         :param query_delay: Delay between writing and reading in seconds.
         :returns: String returned by the device without read_termination.
         """
-        self.write(command)
-        self.wait_for(query_delay)
-        return self.read()
+        with self.transaction():
+            self.write(command)
+            self.wait_for(query_delay)
+            return self.read()
 
     def values(self, command, separator=',', cast=float, preprocess_reply=None, maxsplit=-1,
-               **kwargs):
+               as_array=False, **kwargs):
         """Write a command to the instrument and return a list of formatted
         values from the result.
 
@@ -400,25 +490,36 @@ class CommonBase:
         :param maxsplit: The string returned by the device is splitted at most `maxsplit` times.
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the splitted string.
+        :param as_array: If True, return a numpy array. Numeric replies (`cast` being float,
+            int, bool, or a numpy number type) are parsed in one vectorized step, which is
+            much faster for long replies like buffer contents.
+            If some element cannot be cast, the elements are parsed one by one as usual and
+            returned as an array of dtype object, keeping the failed elements as strings.
         :param \\**kwargs: Keyword arguments to be passed to the :meth:`ask` method.
-        :returns: A list of the desired type, or strings where the casting fails.
+        :returns: A list (or numpy array) of the desired type, or strings where the casting fails.
         """
         results = self.ask(command, **kwargs).strip()
         if callable(preprocess_reply):
             results = preprocess_reply(results)
         elif callable(self.preprocess_reply):
             results = self.preprocess_reply(results)
+        if as_array and maxsplit == -1:
+            array = _parse_array(results, separator, cast)
+            if array is not None:
+                return array
         results = results.split(separator, maxsplit=maxsplit)
+        if cast == bool:
+            # Need to cast to float first since results are usually
+            # strings and bool of a non-empty string is always True
+            cast = _cast_bool
+        converted = True
         for i, result in enumerate(results):
             try:
-                if cast == bool:
-                    # Need to cast to float first since results are usually
-                    # strings and bool of a non-empty string is always True
-                    results[i] = bool(float(result))
-                else:
-                    results[i] = cast(result)
+                results[i] = cast(result)
             except Exception:
-                pass  # Keep as string
+                converted = False  # Keep as string
+        if as_array:
+            return np.array(results, dtype=None if converted else object)
         return results
 
     def binary_values(self, command, query_delay=None, **kwargs):
@@ -429,9 +530,88 @@ class CommonBase:
         :param kwargs: Arguments for :meth:`~pymeasure.Adapter.read_binary_values`.
         :returns: NumPy array of values.
         """
-        self.write(command)
-        self.wait_for(query_delay)
-        return self.read_binary_values(**kwargs)
+        with self.transaction():
+            self.write(command)
+            self.wait_for(query_delay)
+            return self.read_binary_values(**kwargs)
+
+    def binary_block(self, command, query_delay=None, **kwargs):
+        """Write a command to the instrument and return the values of the IEEE 488.2 binary
+        block it answers as a numpy array.
+
+        :param command: Command to be sent to the instrument.
+        :param query_delay: Delay between writing and reading in seconds.
+        :param kwargs: Arguments for :meth:`~pymeasure.adapters.Adapter.read_binary_block`,
+            e.g. `dtype`, `is_big_endian` or `out`.
+        :returns: NumPy array of values.
+        """
+        with self.transaction():
+            self.write(command)
+            self.wait_for(query_delay)
+            return self.read_binary_block(**kwargs)
+
+    # Asynchronous communication
+    def run_async(self, function, *args, **kwargs):
+        """Run a blocking `function` in a worker thread and return an awaitable of its result.
+
+        Implementations hand it to the worker thread of their adapter (see
+        :meth:`~pymeasure.adapters.Adapter.run_async`), this default uses the executor of the
+        running event loop.
+        """
+        import asyncio  # loaded already by the running event loop
+
+        return asyncio.get_running_loop().run_in_executor(None, partial(function, *args,
+                                                                        **kwargs))
+
+    async def write_async(self, command, **kwargs):
+        """Write a string command to the instrument without blocking the event loop,
+        see :meth:`write`."""
+        return await self.run_async(self.write, command, **kwargs)
+
+    async def read_async(self, **kwargs):
+        """Read up to the termination character without blocking the event loop,
+        see :meth:`read`."""
+        return await self.run_async(self.read, **kwargs)
+
+    async def ask_async(self, command, query_delay=None):
+        """Write a command to the instrument and return the read response without
+        blocking the event loop, see :meth:`ask`.
+
+        Awaiting queries of several instruments concurrently, e.g. with
+        :code:`asyncio.gather`, takes about as long as the slowest of them.
+        """
+        return await self.run_async(self.ask, command, query_delay)
+
+    async def values_async(self, command, **kwargs):
+        """Write a command to the instrument and return a list of formatted values
+        without blocking the event loop, see :meth:`values`."""
+        return await self.run_async(self.values, command, **kwargs)
+
+    async def binary_values_async(self, command, **kwargs):
+        """Write a command to the instrument and return a numpy array of the binary data
+        without blocking the event loop, see :meth:`binary_values`."""
+        return await self.run_async(self.binary_values, command, **kwargs)
+
+    async def binary_block_async(self, command, **kwargs):
+        """Write a command to the instrument and return the values of the binary block it
+        answers without blocking the event loop, see :meth:`binary_block`."""
+        return await self.run_async(self.binary_block, command, **kwargs)
+
+    async def get_async(self, name):
+        """Return the value of the property `name` (e.g. a :meth:`control` or
+        :meth:`measurement`) without blocking the event loop.
+
+        .. code-block:: python
+
+            voltage, current = await asyncio.gather(
+                voltmeter.get_async("voltage"), ammeter.get_async("current"))
+        """
+        return await self.run_async(getattr, self, name)
+
+    async def set_async(self, name, value):
+        """Set the property `name` (e.g. a :meth:`control` or :meth:`setting`) to `value`
+        without blocking the event loop."""
+        return await self.run_async(setattr, self, name, value)
 
     # Property creators
     @staticmethod
@@ -542,6 +722,22 @@ class CommonBase:
         else:
             warn("Do not use `command_process`, use a dynamic property instead.", FutureWarning)
 
+        # Precompute the lookup table for mapping a value back to its key
+        default_values = values
+        reverse_values = _reverse_map(values) if isinstance(values, dict) else None
+
+        def map_dict_key(value, values):
+            """Return the key of `values` for a value read from the instrument."""
+            if values is default_values and reverse_values is not None:
+                try:
+                    return reverse_values[value]
+                except (KeyError, TypeError):
+                    pass  # Compare with each value, e.g. for unhashable values
+            for k, v in values.items():
+                if v == value:
+                    return k
+            raise KeyError(f"Value {value} not found in mapped values")
+
         def fget(self,
                  get_command=get_command,
                  values=values,
@@ -576,10 +772,7 @@ class CommonBase:
                 elif isinstance(values, (list, tuple, range)):
                     return values[int(value)]
                 elif isinstance(values, dict):
-                    for k, v in values.items():
-                        if v == value:
-                            return k
-                    raise KeyError(f"Value {value} not found in mapped values")
+                    return map_dict_key(value, values)
                 else:
                     raise ValueError(
                         'Values of type `{}` are not allowed '
@@ -34,10 +34,23 @@ log.addHandler(logging.NullHandler())
 class SCPIMixin:
     """Mixin class for SCPI instruments with the default implementation of base SCPI commands."""
 
+    # SCPI allows to send several commands separated by a semicolon
+    batch_separator = ";"
+
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("includeSCPI", False)  # in order not to trigger the deprecation warning
         super().__init__(*args, **kwargs)
 
+    def join_batch_commands(self, commands, separator=None):
+        """Join several commands into one compound command for :meth:`batch`.
+
+        A colon is prepended to all but common commands, such that each command starts
+        at the root of the SCPI command tree.
+        """
+        separator = self.batch_separator if separator is None else separator
+        return separator.join(
+            command if command.startswith((":", "*")) else ":" + command for command in commands)
+
     # SCPI default properties
     complete = Instrument.measurement(
         "*OPC?",
@@ -23,11 +23,16 @@
 #
 
 import logging
+import threading
 import time
+from contextlib import nullcontext
 from warnings import warn
 
+import numpy as np
+
+from .batch import Batch
 from .common_base import CommonBase
-from ..adapters.visa import VISAAdapter
+from ..adapters.adapter import wait_until
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -76,6 +81,10 @@ class Instrument(CommonBase):
         Discarded otherwise.
     """
 
+    #: Separator for joining several commands into one message and splitting the reply,
+    #: see :meth:`batch`. None, if the instrument does not accept compound commands.
+    batch_separator = None
+
     # noinspection PyPep8Naming
     def __init__(self, adapter, name, includeSCPI=None,
                  preprocess_reply=None,
@@ -83,6 +92,7 @@ class Instrument(CommonBase):
         # Setup communication before possible children require the adapter.
         if isinstance(adapter, (int, str)):
             try:
+                from ..adapters.visa import VISAAdapter
                 adapter = VISAAdapter(adapter, **kwargs)
             except ImportError:
                 raise Exception("Invalid Adapter provided for Instrument since"
@@ -103,6 +113,23 @@ class Instrument(CommonBase):
 
         log.info("Initializing %s." % self.name)
 
+    @property
+    def _batch_state(self):
+        """Control the state of the batch executed by the current thread, if any.
+
+        It is thread local, such that other threads communicate as usual (waiting for the
+        adapter's transaction) instead of being recorded or discarded.
+        """
+        local = self.__dict__.get("_batch_local")
+        return None if local is None else getattr(local, "state", None)
+
+    @_batch_state.setter
+    def _batch_state(self, state):
+        local = self.__dict__.get("_batch_local")
+        if local is None:
+            local = self.__dict__.setdefault("_batch_local", threading.local())
+        local.state = state
+
     def __enter__(self):
         return self
 
@@ -162,14 +189,21 @@ class Instrument(CommonBase):
         :param command: command string to be sent to the instrument
         :param kwargs: Keyword arguments for the adapter.
         """
+        if self._batch_state is not None:
+            self._batch_state.write(self, command)
+            return
         self.adapter.write(command, **kwargs)
 
     def write_bytes(self, content, **kwargs):
         """Write the bytes `content` to the instrument."""
+        if self._batch_state is not None:
+            self._batch_state.communicate(self)
         self.adapter.write_bytes(content, **kwargs)
 
     def read(self, **kwargs):
         """Read up to (excluding) `read_termination` or the whole read buffer."""
+        if self._batch_state is not None:
+            return self._batch_state.read(self)
         return self.adapter.read(**kwargs)
 
     def read_bytes(self, count, **kwargs):
@@ -180,6 +214,8 @@ class Instrument(CommonBase):
         :param kwargs: Keyword arguments for the adapter.
         :returns bytes: Bytes response of the instrument (including termination).
         """
+        if self._batch_state is not None:
+            self._batch_state.communicate(self)
         return self.adapter.read_bytes(count, **kwargs)
 
     def write_binary_values(self, command, values, *args, **kwargs):
@@ -189,13 +225,38 @@ class Instrument(CommonBase):
         :param values: The values to transmit.
         :param \\*args, \\**kwargs: Further arguments to hand to the Adapter.
         """
+        if self._batch_state is not None:
+            self._batch_state.communicate(self)
         self.adapter.write_binary_values(command, values, *args, **kwargs)
 
     def read_binary_values(self, **kwargs):
         """Read binary values from the device."""
+        if self._batch_state is not None:
+            self._batch_state.communicate(self)
         return self.adapter.read_binary_values(**kwargs)
 
+    def read_binary_block(self, **kwargs):
+        """Read an IEEE 488.2 binary block from the device, see
+        :meth:`~pymeasure.adapters.Adapter.read_binary_block`."""
+        if self._batch_state is not None:
+            self._batch_state.communicate(self)
+        return self.adapter.read_binary_block(**kwargs)
+
     # Communication functions
+    def transaction(self):
+        """Return a context manager reserving the adapter's connection for a sequence of
+        messages, see :meth:`~pymeasure.adapters.Adapter.transaction`."""
+        transaction = getattr(self.adapter, "transaction", None)
+        return nullcontext() if transaction is None else transaction()
+
+    def run_async(self, function, *args, **kwargs):
+        """Run a blocking `function` in the worker thread of the adapter and return an
+        awaitable of its result, see :meth:`~pymeasure.adapters.Adapter.run_async`."""
+        run_async = getattr(self.adapter, "run_async", None)
+        if run_async is None:
+            return super().run_async(function, *args, **kwargs)
+        return run_async(function, *args, **kwargs)
+
     def wait_for(self, query_delay=None):
         """Wait for some time. Used by 'ask' to wait before reading.
 
@@ -204,6 +265,115 @@ class Instrument(CommonBase):
         if query_delay:
             time.sleep(query_delay)
 
+    def wait_for_srq(self, timeout=25, delay=0.1, should_stop=None):
+        """Block until the instrument requests service (SRQ).
+
+        The service request mechanism of the adapter is used, e.g. the VISA service request
+        event or the ``++srq`` command of a Prologix adapter (see
+        :meth:`~pymeasure.adapters.Adapter.wait_for_srq`). If the adapter has none, the
+        status byte (``*STB?``) is polled at increasing intervals up to `delay` until its
+        master summary bit (64) is set.
+
+        :param timeout: Timeout duration in seconds.
+        :param delay: Maximum time delay between two checks in seconds.
+        :param should_stop: Optional callable returning True to stop waiting early, e.g.
+            :code:`Procedure.should_stop`.
+        :returns: True if service has been requested, False if `should_stop` returned True.
+        :raises TimeoutError: If no service has been requested within the timeout.
+        """
+        wait = getattr(self.adapter, "wait_for_srq", None)
+        if wait is not None:
+            try:
+                return wait(timeout=timeout, delay=delay, should_stop=should_stop)
+            except NotImplementedError:
+                pass
+        return wait_until(lambda: int(self.ask("*STB?")) & 64, timeout=timeout, delay=delay,
+                          should_stop=should_stop, message="Waiting for SRQ timed out.")
+
+    def read_chunked(self, read_chunk, count, chunk_size, dtype=np.uint8, out=None, start=0,
+                     retries=0, progress=None, should_stop=None):
+        """Transfer `count` values, e.g. a long waveform, chunk by chunk into one array.
+
+        For each chunk ``read_chunk(first, values)`` is called. It has to fill the array
+        `values` with the values starting at index `first` of the transfer, e.g. by setting
+        the first point and the number of points of the instrument and reading the data with
+        :meth:`read_binary_block` (``out=values``). A failing chunk is requested again, after
+        flushing the read buffer, up to `retries` times, without restarting the transfer.
+
+        To resume a cancelled transfer, pass the same `out` array and the number of values
+        already transferred as `start`.
+
+        :param read_chunk: Callable ``read_chunk(first, values)`` reading one chunk.
+        :param int count: Total number of values.
+        :param int chunk_size: Maximum number of values per chunk.
+        :param dtype: NumPy data type of the values, if `out` is not given.
+        :param out: Array of at least `count` values to write the values into.
+        :param int start: Index of the first value to transfer.
+        :param int retries: How often a failing chunk is requested again.
+        :param progress: Optional callable receiving the progress in percent after each chunk,
+            e.g. :code:`lambda percent: procedure.emit("progress", percent)`.
+        :param should_stop: Optional callable returning True to cancel the transfer, e.g.
+            :code:`Procedure.should_stop`.
+        :returns: Array of the values transferred so far, a view into `out`, if given. It is
+            shorter than `count`, if the transfer has been cancelled.
+        """
+        if out is None:
+            out = np.empty(count, dtype=dtype)
+        done = start
+        while done < count:
+            if should_stop is not None and should_stop():
+                log.info(f"Transfer of {count} values cancelled after {done} values.")
+                break
+            values = out[done:min(done + chunk_size, count)]
+            attempt = 0
+            while True:
+                try:
+                    read_chunk(done, values)
+                    break
+                except Exception as exc:
+                    if attempt >= retries:
+                        raise
+                    attempt += 1
+                    log.warning(f"Reading values {done} to {done + len(values)} failed "
+                                f"({exc!r}), retrying ({attempt} of {retries}).")
+                    try:
+                        self.adapter.flush_read_buffer()
+                    except NotImplementedError:
+                        pass
+            done += len(values)
+            if progress is not None:
+                progress(100 * done / count)
+        return out[:done]
+
+    def batch(self, separator=None):
+        """Return a :class:`~pymeasure.instruments.batch.Batch` context manager, which collects
+        property reads and writes and sends them as one compound command upon exit.
+
+        .. code::
+
+            with instrument.batch() as batch:
+                voltage = batch.get("voltage")
+                current = batch.get("current", obj=instrument.ch_1)
+            print(voltage.value, current.value)
+
+        Only properties created with :meth:`control`, :meth:`measurement`, and
+        :meth:`setting` (or properties communicating via the instrument's `write` and `read`
+        methods) may be batched.
+
+        :param separator: Separator of commands and replies, defaults to
+            :attr:`batch_separator`. If it is None, the items are executed sequentially.
+        """
+        return Batch(self, separator=separator)
+
+    def join_batch_commands(self, commands, separator=None):
+        """Join several commands into one compound command for :meth:`batch`.
+
+        :param commands: List of command strings.
+        :param separator: Separator, defaults to :attr:`batch_separator`.
+        :return: Compound command string.
+        """
+        return (self.batch_separator if separator is None else separator).join(commands)
+
     # SCPI default methods
     def clear(self):
         """ Clears the instrument status byte
@@ -23,13 +23,12 @@
 #
 
 import logging
-from time import sleep, time
+from time import time
 
 import numpy as np
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import truncated_range
-from pymeasure.adapters import PrologixAdapter
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -37,7 +36,22 @@ log.addHandler(logging.NullHandler())
 
 class KeithleyBuffer:
     """ Implements the basic buffering capability found in
-    many Keithley instruments. """
+    many Keithley instruments.
+
+    :attr:`buffer_data` is transferred as ASCII text by default. Setting :attr:`buffer_format`
+    to a binary format transfers it about three times faster, if the instrument supports it.
+    """
+
+    #: Binary transfer formats of :attr:`buffer_data` and their NumPy data types.
+    BUFFER_FORMATS = {"SREAL": np.float32, "REAL,32": np.float32,
+                      "DREAL": np.float64, "REAL,64": np.float64}
+
+    #: Format of the :attr:`buffer_data` transfer, ``"ASCII"`` or one of :attr:`BUFFER_FORMATS`.
+    buffer_format = "ASCII"
+
+    #: Whether binary data is transferred in big endian (``NORMal``) instead of little endian
+    #: (``SWAPped``) byte order.
+    buffer_big_endian = False
 
     buffer_points = Instrument.control(
         ":TRAC:POIN?", ":TRAC:POIN %d",
@@ -76,25 +90,41 @@ class KeithleyBuffer:
         returns early if the :code:`should_stop` function returns True or
         the timeout is reached before the buffer is full.
 
+        The buffer full event raises a service request (SRQ), see :meth:`config_buffer`,
+        for which is waited with :meth:`~pymeasure.instruments.Instrument.wait_for_srq`.
+
         :param should_stop: A function that returns True when this function should return early
         :param timeout: A time in seconds after which this function should return early
-        :param interval: A time in seconds for how often to check if the buffer is full
+        :param interval: The maximum time in seconds between two checks if the buffer is full
         """
-        # TODO: Use SRQ initially instead of constant polling
-        # self.adapter.wait_for_srq()
-        t = time()
+        stop = time() + timeout
         while not self.is_buffer_full():
-            sleep(interval)
-            if should_stop():
-                return
-            if (time() - t) > timeout:
-                raise Exception("Timed out waiting for Keithley buffer to fill.")
+            try:
+                if not self.wait_for_srq(timeout=max(stop - time(), 0), delay=interval,
+                                         should_stop=should_stop):
+                    return
+            except TimeoutError:
+                raise TimeoutError("Timed out waiting for Keithley buffer to fill.") from None
 
     @property
     def buffer_data(self):
-        """ Get a numpy array of values from the buffer. """
-        self.write(":FORM:DATA ASCII")
-        return np.array(self.values(":TRAC:DATA?"), dtype=np.float64)
+        """ Get a numpy array of values from the buffer, transferred in :attr:`buffer_format`. """
+        if self.buffer_format == "ASCII":
+            self.write(":FORM:DATA ASCII")
+            return np.asarray(self.values(":TRAC:DATA?", as_array=True), dtype=np.float64)
+        try:
+            dtype = self.BUFFER_FORMATS[self.buffer_format]
+        except KeyError:
+            raise ValueError(f"Invalid buffer format {self.buffer_format!r}.") from None
+        self.write(f":FORM:DATA {self.buffer_format};"
+                   f":FORM:BORD {'NORM' if self.buffer_big_endian else 'SWAP'}")
+        try:
+            data = self.binary_block(":TRAC:DATA?", dtype=dtype,
+                                     is_big_endian=self.buffer_big_endian)
+        finally:
+            # Other measurements expect ASCII replies
+            self.write(":FORM:DATA ASCII")
+        return data.astype(np.float64, copy=False)
 
     def start_buffer(self):
         """ Starts the buffer. """
@@ -108,6 +138,7 @@ class KeithleyBuffer:
         """ Aborts the buffering measurement, by stopping the measurement
         arming and triggering sequence. If possible, a Selected Device
         Clear (SDC) is used. """
+        from pymeasure.adapters import PrologixAdapter
         if type(self.adapter) is PrologixAdapter:
             self.write("++clr")
         else:
@@ -24,6 +24,8 @@
 
 import logging
 
+import numpy as np
+
 from pymeasure.instruments import Instrument, Channel, SCPIMixin
 from pymeasure.instruments.validators import (
     truncated_range,
@@ -1223,29 +1225,46 @@ class KeithleyDMM6500(SCPIMixin, Instrument):
         cast=int,
     )
 
-    def scanned_data(self, start_idx=None, end_idx=None, raw=False):
-        """Return a list of scanning values from the buffer.
+    def scanned_data(self, start_idx=None, end_idx=None, raw=False, binary=False,
+                     big_endian=False):
+        """Return the scanned values from the buffer.
 
-        :param start_idx: A bool value which controls communication state while scanning.
-            Default is ``True`` and the communication waits until the commands are complete
-            to accept new commands
-        :param end_idx: An alternative way to set :attr:`scan_count`
-        :param raw: An alternative way to set :attr:`scan_interval` in second
-        :return: A list of scan channels' measured
-        :rtype: A list of channels' list
+        :param start_idx: Index of the first reading, by default the first one in the buffer.
+        :param end_idx: Index of the last reading, by default the last one in the buffer.
+        :param raw: If True, return the readings in the order of their acquisition.
+        :param binary: If True, transfer the readings in binary (double precision) format,
+            which is about three times faster than ASCII, and return NumPy arrays.
+        :param big_endian: Whether binary data is transferred in big endian byte order.
+        :return: A list of readings (``raw=True``) or a list of the readings of each scan
+            channel. With ``binary=True`` a NumPy array, whose rows are the scan channels;
+            readings of an incomplete last scan are left out.
         """
-        self.write(":FORM:DATA ASCII")
+        if not binary:
+            self.write(":FORM:DATA ASCII")
         if start_idx is None:
             start_idx = self.ask(":TRAC:ACT:STAR?")
         if end_idx is None:
             end_idx = self.ask(":TRAC:ACT:END?")
-        data = self.values(f":TRAC:DATA? {start_idx}, {end_idx}")
+        if not binary:
+            data = self.values(f":TRAC:DATA? {start_idx}, {end_idx}")
+            if raw:
+                return data
+            else:
+                nums = len(self.scan_channels_list)
+                # re-organize data to 2D list
+                return [data[i::nums] for i in range(nums)]
+        self.write(f":FORM:DATA REAL;:FORM:BORD {'NORM' if big_endian else 'SWAP'}")
+        try:
+            data = self.binary_block(f":TRAC:DATA? {start_idx}, {end_idx}",
+                                     dtype=np.float64, is_big_endian=big_endian)
+        finally:
+            # Other measurements expect ASCII replies
+            self.write(":FORM:DATA ASCII")
         if raw:
             return data
-        else:
-            nums = len(self.scan_channels_list)
-            # re-organize data to 2D list
-            return [data[i::nums] for i in range(nums)]
+        # Readings are stored scan after scan, so the rows of the transpose are the channels
+        nums = len(self.scan_channels_list)
+        return data[:len(data) - len(data) % nums].reshape(-1, nums).T
 
     @property
     def scan_modes(self):
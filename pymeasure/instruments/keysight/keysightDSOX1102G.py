@@ -480,8 +480,7 @@ class KeysightDSOX1102G(SCPIUnknownMixin, Instrument):
         :param color_palette: "color" or "grayscale"
         """
         query = f":DISPlay:DATA? {format_}, {color_palette}"
-        # Using binary_values query because default interface does not support binary transfer
-        img = self.binary_values(query, header_bytes=10, dtype=np.uint8)
+        img = self.binary_block(query, dtype=np.uint8)
         return bytearray(img)
 
     def download_data(self, source, points=62500):
@@ -506,6 +505,9 @@ class KeysightDSOX1102G(SCPIUnknownMixin, Instrument):
         self.waveform_points = points
 
         preamble = self.waveform_preamble
+        # Not transferred with `read_chunked`: the scope has no command to select a range of
+        # points, so the record cannot be split into chunks, and the ASCII format, which yields
+        # the voltages, is not a binary block.
         data_bytes = self.waveform_data
         return np.array(data_bytes), preamble
 
@@ -23,9 +23,11 @@
 #
 
 import logging
-from time import sleep
 from warnings import warn
 
+import numpy as np
+
+from pymeasure.adapters.adapter import wait_until
 from pymeasure.instruments import Instrument, SCPIUnknownMixin
 from pymeasure.instruments.validators import (
     strict_discrete_set,
@@ -135,19 +137,31 @@ class CNT91(SCPIUnknownMixin, Instrument):
         map_values=True,
     )
 
-    def read_buffer(self, n=MAX_BUFFER_SIZE):
+    def read_buffer(self, n=MAX_BUFFER_SIZE, binary=False, timeout=24 * 60 * 60):
         """
         Read out `n` samples from the buffer.
 
         :param n: Number of samples that should be read from the buffer. The maximum number of
             10000 samples is read out by default.
+        :param binary: If True, transfer the samples in the binary ``REAL`` :attr:`format`
+            (big endian doubles), which is faster than ASCII, and return a NumPy array.
+            The format is reset to ASCII afterwards.
+        :param timeout: Maximum time in s to wait for the buffer to be filled.
         :return: Frequency values from the buffer.
+        :raises TimeoutError: If the buffer is not filled within the timeout.
         """
         n = truncated_range(n, [MIN_BUFFER_SIZE, MAX_BUFFER_SIZE])  # Programmer's guide 8-39
-        while not self.complete:
-            # Wait until the buffer is filled.
-            sleep(0.01)
-        return self.values(f":FETC:ARR? {'MAX' if n == MAX_BUFFER_SIZE else n}")
+        # Wait until the buffer is filled, *OPC? itself blocks until the measurement completes.
+        wait_until(lambda: self.complete == "1", timeout=timeout,
+                   message="Waiting for the buffer to be filled timed out.")
+        query = f":FETC:ARR? {'MAX' if n == MAX_BUFFER_SIZE else n}"
+        if not binary:
+            return self.values(query)
+        self.format = "REAL"
+        try:
+            return self.binary_block(query, dtype=np.float64, is_big_endian=True)
+        finally:
+            self.format = "ASCII"
 
     def configure_frequency_array_measurement(self, n_samples, channel, back_to_back=True):
         """
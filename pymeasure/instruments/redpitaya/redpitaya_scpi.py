@@ -145,11 +145,7 @@ class AnalogInputFastChannel(Channel):
     def _read_from_binary(self) -> np.ndarray:
         """ Read data from the buffer from binary format, see :meth:acq_format
         """
-        self.read_bytes(1)
-        nint = int(self.read_bytes(1).decode())
-        length = int(self.read_bytes(nint).decode())
-        data = np.frombuffer(self.read_bytes(length), dtype=int)
-        self.read_bytes(2)
+        data = self.read_binary_block(dtype=int, termination_bytes=2)
         if self.gain == 'LV':
             max_range = 2 * RedPitayaScpi.LV_MAX
         else:
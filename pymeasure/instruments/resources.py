@@ -22,9 +22,6 @@
 # THE SOFTWARE.
 #
 
-import pyvisa
-from serial.tools import list_ports
-
 
 def list_resources():
     """
@@ -39,6 +36,8 @@ def list_resources():
         dmm = Agilent34410(resources[0])
 
     """
+    import pyvisa
+
     rm = pyvisa.ResourceManager()
     instrs = rm.list_resources()
     for n, instr in enumerate(instrs):
@@ -76,6 +75,8 @@ def find_serial_port(vendor_id=None, product_id=None, serial_number=None):
     :param str sn: Serial number.
     :return str: Port as a VISA string for a serial device (e.g. "ASRL5" or "ASRL/dev/ttyACM5").
     """
+    from serial.tools import list_ports
+
     for port in sorted(list_ports.comports()):
         if ((vendor_id is None or port.vid == vendor_id)
                 and (product_id is None or port.pid == product_id)
@@ -139,7 +139,7 @@ class FSL(SCPIMixin, Instrument):
         :param n_trace: The trace number (1-6). Default is 1.
         :return: 2d numpy array of the trace data, [[frequency], [amplitude]].
         """
-        y = np.array(self.values(f"TRAC{n_trace}? TRACE{n_trace}"))
+        y = self.values(f"TRAC{n_trace}? TRACE{n_trace}", as_array=True)
         x = np.linspace(self.freq_start, self.freq_stop, len(y))
         return np.array([x, y])
 
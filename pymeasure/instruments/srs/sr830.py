@@ -22,14 +22,19 @@
 # THE SOFTWARE.
 #
 
+import logging
 import re
 import time
 import numpy as np
 from enum import IntFlag
+from pymeasure.adapters.adapter import wait_until
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import strict_discrete_set, \
     truncated_discrete_set, truncated_range, discreteTruncate
 
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
 
 class LIAStatus(IntFlag):
     """ IntFlag type that is returned by the lia_status property.
@@ -58,6 +63,8 @@ class ERRStatus(IntFlag):
 
 
 class SR830(Instrument):
+    #: Longest time in seconds between two queries of the buffer count while waiting
+    BUFFER_POLL_INTERVAL = 0.1
     SAMPLE_FREQUENCIES = [
         62.5e-3, 125e-3, 250e-3, 500e-3, 1, 2, 4, 8, 16,
         32, 64, 128, 256, 512
@@ -512,12 +519,16 @@ class SR830(Instrument):
         ch2 = np.empty(count, np.float32)
         currentCount = self.buffer_count
         index = 0
+        interval = delay
         while currentCount < count:
             if currentCount > index:
                 ch1[index:currentCount] = self.get_buffer(1, index, currentCount)
                 ch2[index:currentCount] = self.get_buffer(2, index, currentCount)
                 index = currentCount
-                time.sleep(delay)
+                interval = delay
+            else:  # back off while no new points arrive
+                interval = min(2 * interval, max(delay, self.BUFFER_POLL_INTERVAL))
+            time.sleep(interval)
             currentCount = self.buffer_count
             if has_aborted():
                 self.pause_buffer()
@@ -538,12 +549,16 @@ class SR830(Instrument):
         ch2 = np.empty(count, np.float64)
         currentCount = self.buffer_count
         index = 0
+        interval = delay
         while currentCount < count:
             if currentCount > index:
                 ch1[index:currentCount] = self.get_buffer(1, index, currentCount)
                 ch2[index:currentCount] = self.get_buffer(2, index, currentCount)
                 index = currentCount
-                time.sleep(delay)
+                interval = delay
+            else:  # back off while no new points arrive
+                interval = min(2 * interval, max(delay, self.BUFFER_POLL_INTERVAL))
+            time.sleep(interval)
             currentCount = self.buffer_count
             if stopRequest is not None and stopRequest.isSet():
                 self.pause_buffer()
@@ -565,13 +580,19 @@ class SR830(Instrument):
     def wait_for_buffer(self, count, has_aborted=lambda: False,
                         timeout=60, timestep=0.01):
         """ Wait for the buffer to fill a certain count
+
+        The buffer count is polled at increasing intervals, up to
+        :attr:`BUFFER_POLL_INTERVAL` (or `timestep`, if longer).
+
+        :return: False if `has_aborted` returned True, None otherwise.
         """
-        i = 0
-        while not self.buffer_count >= count and i < (timeout / timestep):
-            time.sleep(timestep)
-            i += 1
-            if has_aborted():
+        try:
+            if not wait_until(lambda: self.buffer_count >= count, timeout=timeout,
+                              delay=max(timestep, self.BUFFER_POLL_INTERVAL),
+                              should_stop=has_aborted):
                 return False
+        except TimeoutError:
+            log.warning("Timed out waiting for the buffer to reach %d points.", count)
         self.pause_buffer()
 
     def get_buffer(self, channel=1, start=0, end=None):
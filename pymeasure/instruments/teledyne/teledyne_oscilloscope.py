@@ -26,7 +26,6 @@ from abc import ABCMeta
 import re
 import sys
 import time
-from decimal import Decimal
 import numpy as np
 
 from pymeasure.instruments import Instrument, Channel, SCPIUnknownMixin
@@ -744,54 +743,33 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
             preamble["yoffset"] = self.ch(self.waveform_source).offset
         return preamble
 
-    def _digitize(self, src, num_bytes=None):
+    def _digitize(self, src, out=None):
         """Acquire waveforms according to the settings of the acquire commands.
-        Note.
-        If the requested number of bytes is not specified, the default chunk size is used,
-        but in such a case it cannot be quaranteed that the message is received in its entirety.
+
+        The scope answers with the binary block ``DAT2,#9<number of points><data points>``
+        followed by the footer ``\\n\\n``. The data points are read directly into `out`, if
+        given.
 
         :param src: source of data: "C1", "C2", "C3", "C4", "MATH".
-        :param: num_bytes: number of bytes expected from the scope (including the header and
-        footer).
-        :return: bytearray with raw data.
+        :param out: numpy array of uint8 to read the data points into.
+        :return: numpy array with the raw data points (a view into `out`, if given).
         """
-        with _ChunkResizer(self.adapter, num_bytes):
-            binary_values = self.binary_values(f"{src}:WF? DAT2", dtype=np.uint8)
-        if num_bytes is not None and len(binary_values) != num_bytes:
-            raise BufferError(f"read bytes ({len(binary_values)}) != requested bytes ({num_bytes})")
-        return binary_values
-
-    def _header_footer_sanity_checks(self, message):
-        """Check that the header follows the predefined format.
-        The format of the header is DAT2,#9XXXXXXX where XXXXXXX is the number of acquired
-        points, and it is zero padded.
-        Then check that the footer is present. The footer is a double line-carriage \n\n
-        :param message: raw bytes received from the scope """
-        message_header = bytes(message[0:self._header_size]).decode("ascii")
-        # Sanity check on header and footer
-        if message_header[0:7] != "DAT2,#9":
-            raise ValueError(f"Waveform data in invalid : header is {message_header}")
-        message_footer = bytes(message[-self._footer_size:]).decode("ascii")
-        if message_footer != "\n\n":
-            raise ValueError(f"Waveform data in invalid : footer is {message_footer}")
-
-    def _npoints_sanity_checks(self, message):
-        """Check that the number of transmitted points is consistent with the message length.
-        :param message: raw bytes received from the scope """
-        message_header = bytes(message[0:self._header_size]).decode("ascii")
-        transmitted_points = int(message_header[-9:])
-        received_points = len(message) - self._header_size - self._footer_size
-        if transmitted_points != received_points:
-            raise ValueError(f"Number of transmitted points ({transmitted_points}) != "
-                             f"number of received points ({received_points})")
-
-    def _acquire_data(self, requested_points=0, sparsing=1):
-        """Acquire raw data points from the scope. The header, footer and number of points are
+        with self.transaction():
+            data = self.binary_block(f"{src}:WF? DAT2", dtype=np.uint8, out=out,
+                                     termination_bytes=0)
+            footer = self.read_bytes(self._footer_size)
+        if footer != b"\n\n":
+            raise ValueError(f"Waveform data in invalid : footer is {footer}")
+        return data
+
+    def _acquire_data(self, requested_points=0, sparsing=1, **kwargs):
+        """Acquire raw data points from the scope. The footer and number of points are
         sanity-checked, but they are not processed otherwise. For a description of the input
         arguments refer to the download_waveform method.
         If the number of expected points is big enough, the transmission is split in smaller
         chunks of 20k points and read one chunk at a time. I do not know the reason why,
         but if the chunk size is big enough the transmission does not complete successfully.
+        :param kwargs: keyword arguments of :meth:`~pymeasure.instruments.Instrument.read_chunked`
         :return: raw data points as numpy array and waveform preamble
         """
         # Setup waveform acquisition parameters
@@ -806,35 +784,23 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
         else:
             expected_points = int(sample_points / sparsing)
 
+        def read_chunk(first, values):
+            # number of points requested in a single chunk
+            self.waveform_points = len(values)
+            # read the next chunk starting from this point
+            self.waveform_first_point = first * sparsing
+            # read the points directly into the output array
+            received_points = len(self._digitize(src=self.waveform_source, out=values))
+            if received_points != len(values):
+                raise ValueError(f"Number of requested points ({len(values)}) != "
+                                 f"number of received points ({received_points})")
+
         # If the number of points is big enough, split the data in small chunks and read it one
         # chunk at a time. For less than a certain amount of points we do not bother splitting them.
         chunk_bytes = 20000
         chunk_points = chunk_bytes - self._header_size - self._footer_size
-        iterations = -(expected_points // -chunk_points)
-        i = 0
-        data = []
-        while i < iterations:
-            # number of points already read
-            read_points = i * chunk_points
-            # number of points still to read
-            remaining_points = expected_points - read_points
-            # number of points requested in a single chunk
-            requested_points = chunk_points if remaining_points > chunk_points else remaining_points
-            self.waveform_points = requested_points
-            # number of bytes requested in a single chunk
-            requested_bytes = requested_points + self._header_size + self._footer_size
-            # read the next chunk starting from this points
-            first_point = read_points * sparsing
-            self.waveform_first_point = first_point
-            # read chunk of points
-            values = self._digitize(src=self.waveform_source, num_bytes=requested_bytes)
-            # perform many sanity checks on the received data
-            self._header_footer_sanity_checks(values)
-            self._npoints_sanity_checks(values)
-            # append the points without the header and footer
-            data.append(values[self._header_size:-self._footer_size])
-            i += 1
-        data = np.concatenate(data)
+        data = self.read_chunked(read_chunk, expected_points, chunk_points, dtype=np.uint8,
+                                 **kwargs)
         preamble = self.waveform_preamble
         return data, preamble
 
@@ -860,25 +826,22 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
 
         :return: tuple of (numpy array of Y points, numpy array of X points, waveform preamble) """
 
-        def _scale_data(y):
-            if preamble["source"] == "MATH":
-                value = int.from_bytes([y], byteorder='big', signed=False) * preamble["ydiv"] / 25.
-                value -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
-            else:
-                value = int.from_bytes([y], byteorder='big', signed=True) * preamble["ydiv"] / 25.
-                value -= preamble["yoffset"]
-            return value
-
-        def _scale_time(x):
-            return float(Decimal(-preamble["xdiv"] * self._grid_number / 2.) +
-                         Decimal(float(x * preamble["sparsing"])) /
-                         Decimal(preamble["sampling_rate"]))
-
-        data_points = np.vectorize(_scale_data)(ydata)
-        time_points = np.vectorize(_scale_time)(np.arange(len(data_points)))
+        # The scope sends signed bytes, except for the MATH source which sends unsigned ones
+        ydata = np.asarray(ydata, dtype=np.uint8)
+        if preamble["source"] == "MATH":
+            data_points = ydata * preamble["ydiv"] / 25.
+            data_points -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
+        else:
+            data_points = ydata.view(np.int8) * preamble["ydiv"] / 25.
+            data_points -= preamble["yoffset"]
+
+        time_points = np.arange(len(data_points), dtype=np.float64) * preamble["sparsing"]
+        time_points /= preamble["sampling_rate"]
+        time_points += -preamble["xdiv"] * self._grid_number / 2.
         return data_points, time_points, preamble
 
-    def download_waveform(self, source, requested_points=None, sparsing=None):
+    def download_waveform(self, source, requested_points=None, sparsing=None, retries=0,
+                          progress=None, should_stop=None):
         """Get data points from the specified source of the oscilloscope.
 
         The returned objects are two np.ndarray of data and time points and a dict with the
@@ -892,6 +855,11 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
         :param sparsing: interval between data points. For example if sparsing = 4, only one
                point every 4 points is read. If 0 or None the sparsing of the previous call is
                assumed, i.e. the value of the sparsing stored in the oscilloscope memory.
+        :param retries: how often a chunk of data is requested again if its transfer failed.
+        :param progress: optional callable receiving the progress of the transfer in percent,
+               e.g. :code:`lambda percent: procedure.emit("progress", percent)`.
+        :param should_stop: optional callable returning True to cancel the transfer, e.g.
+               :code:`procedure.should_stop`. The points transferred so far are returned.
         :return: data_ndarray, time_ndarray, waveform_preamble_dict: see waveform_preamble
                  property for dict format.
         """
@@ -902,7 +870,8 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
             requested_points = self.waveform_points
         self.waveform_source = sanitize_source(source)
         # Acquire the Y data and the preable
-        ydata, preamble = self._acquire_data(requested_points, sparsing)
+        ydata, preamble = self._acquire_data(requested_points, sparsing, retries=retries,
+                                             progress=progress, should_stop=should_stop)
         # Update the preamble with info about actually acquired data
         preamble["transmitted_points"] = len(ydata)
         preamble["requested_points"] = requested_points
@@ -0,0 +1,403 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Simulated instruments served over real connections.
+
+A :class:`SimulatedInstrument` is a scripted model of an instrument, which answers commands
+after a configurable latency and transfers its replies with a limited bandwidth. Served by a
+:class:`TCPServer` or a :class:`SerialServer`, it can be connected to with the regular adapters,
+such that adapters and drivers can be benchmarked and tested without hardware.
+A :class:`SimulatedPrologix` bridges several simulated instruments like a Prologix GPIB
+controller.
+
+.. code-block:: python
+
+    model = SimulatedInstrument(latency=0.002, jitter=0.0005, bandwidth=115200 / 10)
+    model.add_control("VOLT", 0)
+    model.add_waveform("WAV:DATA?", np.arange(10000), dtype="<i2")
+    with SerialServer(model) as server:
+        adapter = SerialAdapter(server.port, read_termination="\\n", write_termination="\\n")
+        adapter.write("VOLT 5")
+        assert adapter.ask("VOLT?") == "5"
+"""
+
+import logging
+import os
+import random
+import re
+import select
+import socket
+import threading
+import time
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+def ieee_block(data):
+    """Return the bytes `data` as an IEEE 488.2 definite length block (e.g. ``#15hello``)."""
+    length = str(len(data)).encode()
+    return b"#" + str(len(length)).encode() + length + bytes(data)
+
+
+class SimulatedInstrument:
+    """Scripted model of an instrument answering text commands.
+
+    The responses are registered for regular expressions, which have to match the whole
+    command (without termination). If several patterns match, the latest registered one is used.
+    Commands without a matching pattern are logged and not answered.
+
+    Processing each command takes `latency` (or the latency of its response) plus a normal
+    distributed random `jitter`. A server delays the next message by that time and sends
+    replies not faster than `bandwidth`.
+
+    :param latency: Default processing time of a command in s.
+    :param jitter: Standard deviation of the random addition to the latency in s.
+    :param bandwidth: Transfer rate of replies in bytes/s, None for unlimited.
+    :param termination: Termination of received commands and of sent replies.
+    :param idn: Reply to ``*IDN?``.
+    :param seed: Seed of the random number generator of the jitter.
+    """
+
+    def __init__(self, latency=0, jitter=0, bandwidth=None, termination="\n",
+                 idn="PyMeasure,SimulatedInstrument,0,0", seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.termination = termination
+        self.values = {}
+        self._responses = []
+        self._random = random.Random(seed)
+        self.add_response(r"\*IDN\?", idn)
+
+    def add_response(self, pattern, response, latency=None):
+        """Answer commands matching the regular expression `pattern` with `response`.
+
+        :param pattern: Regular expression (str) matching the whole command.
+        :param response: Reply as str or bytes, None for no reply, or a callable returning one
+            of those, which is called with the :class:`re.Match` of the command.
+        :param latency: Processing time of this command in s, None for the default `latency`.
+        """
+        self._responses.append((re.compile(pattern), response, latency))
+
+    def add_control(self, command, value, latency=None):
+        """Emulate a control, which stores the value of ``command value`` and returns it to
+        ``command?``.
+
+        :param command: Command header, e.g. ``"SOUR:VOLT"``.
+        :param value: Initial value, available in :attr:`values`.
+        :param latency: Processing time of the command in s, None for the default `latency`.
+        """
+        self.values[command] = value
+
+        def store(match):
+            self.values[command] = match["value"]
+
+        self.add_response(re.escape(command) + r"\?", lambda match: str(self.values[command]),
+                          latency)
+        self.add_response(re.escape(command) + r"\s+(?P<value>.+)", store, latency)
+
+    def add_buffer(self, command, values, separator=",", latency=None):
+        """Answer `command` with the numbers in `values` as separated text, like a reading
+        buffer or a trace.
+
+        :param command: Query, e.g. ``"TRAC:DATA?"``.
+        :param values: Iterable of numbers.
+        :param separator: Separator of the numbers.
+        :param latency: Processing time of the command in s, None for the default `latency`.
+        """
+        text = separator.join(f"{value:g}" for value in np.asarray(values).ravel())
+        self.add_response(re.escape(command), text, latency)
+
+    def add_waveform(self, command, values, dtype="<i1", latency=None):
+        """Answer `command` with `values` in binary format as an IEEE 488.2 block.
+
+        :param command: Query, e.g. ``"WAV:DATA?"``.
+        :param values: Iterable of numbers.
+        :param dtype: NumPy data type of the transferred values (including byte order).
+        :param latency: Processing time of the command in s, None for the default `latency`.
+        """
+        block = ieee_block(np.asarray(values, dtype=dtype).tobytes())
+        self.add_response(re.escape(command), block, latency)
+
+    def handle(self, command):
+        """Process a `command` (str without termination).
+
+        :returns: Tuple of the reply (bytes including termination, or None) and the
+            processing time in s.
+        """
+        for pattern, response, latency in reversed(self._responses):
+            match = pattern.fullmatch(command)
+            if match:
+                if callable(response):
+                    response = response(match)
+                break
+        else:
+            log.warning("%s received unknown command %r.", self.__class__.__name__, command)
+            response = latency = None
+        if latency is None:
+            latency = self.latency
+        if self.jitter:
+            latency = max(0, latency + self._random.gauss(0, self.jitter))
+        if response is None:
+            return None, latency
+        if isinstance(response, str):
+            response = response.encode()
+        return response + self.termination.encode(), latency
+
+    def transfer_time(self, size):
+        """Return the time in s to transfer `size` bytes."""
+        return 0 if self.bandwidth is None else size / self.bandwidth
+
+
+class SimulatedPrologix(SimulatedInstrument):
+    """Model of a Prologix GPIB controller with simulated instruments on its bus.
+
+    It understands the ``++`` commands used by the
+    :class:`~pymeasure.adapters.PrologixAdapter` and forwards all other commands to the
+    instrument at the selected address. Replies are returned on ``++read`` or immediately in
+    ``++auto 1`` mode. The transfer time of a reply over the GPIB bus (given by the bandwidth
+    of the instrument) is added to the processing time of ``++read``.
+
+    :param instruments: Dictionary of GPIB addresses and :class:`SimulatedInstrument` objects.
+    :param \\**kwargs: Keyword arguments of :class:`SimulatedInstrument` for the controller
+        itself, whose `bandwidth` is the one of the serial or network link.
+    """
+
+    def __init__(self, instruments, idn="Prologix GPIB-USB Controller version 6.0", **kwargs):
+        super().__init__(idn=idn, **kwargs)
+        self.instruments = instruments
+        self.values.update({"addr": None, "auto": 0, "eoi": 1, "eos": 0, "read_tmo_ms": 500})
+        self._replies = {}
+        self._read_time = 0
+        for setting in self.values:
+            self._add_setting(setting)
+        self.add_response(r"\+\+ver", idn)
+        self.add_response(r"\+\+read(\s+.*)?", lambda match: self._pop_reply())
+        self.add_response(r"\+\+(clr|rst|loc|ifc|trg)", None)
+        self.add_response(r"\+\+(srq|spoll)", "0")
+
+    def _add_setting(self, name):
+        def access(match):
+            if match["value"] is None:
+                return str(self.values[name])
+            self.values[name] = int(match["value"])
+
+        self.add_response(r"\+\+" + name + r"(\s+(?P<value>\d+))?", access)
+
+    def _pop_reply(self):
+        reply = self._replies.pop(self.values["addr"], None)
+        if reply is None:
+            return None
+        instrument = self.instruments[self.values["addr"]]
+        self._read_time = instrument.transfer_time(len(reply))
+        # Replace the termination of the instrument by the one of the controller
+        return reply[:len(reply) - len(instrument.termination.encode())]
+
+    def handle(self, command):
+        """Process a `command`, see :meth:`SimulatedInstrument.handle`."""
+        if command.startswith("++"):
+            self._read_time = 0
+            reply, latency = super().handle(command)
+            return reply, latency + self._read_time
+        try:
+            instrument = self.instruments[self.values["addr"]]
+        except KeyError:
+            log.warning("No simulated instrument at GPIB address %s.", self.values["addr"])
+            return None, self.latency
+        reply, latency = instrument.handle(command)
+        if reply is not None:
+            if self.values["auto"]:
+                return reply, latency + instrument.transfer_time(len(reply))
+            self._replies[self.values["addr"]] = reply
+        return None, latency
+
+
+class _SimulatorServer:
+    """Base class serving a model over a connection in a background thread."""
+
+    def __init__(self, model):
+        self.model = model
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._threads = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        """Open the connection and start serving, returns the server itself."""
+        self._stop_event.clear()
+        self._open()
+        self._start_thread(self._run)
+        return self
+
+    def stop(self):
+        """Stop serving and close the connection."""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        self._close()
+
+    def _start_thread(self, target, *args):
+        thread = threading.Thread(target=target, args=args, daemon=True,
+                                  name=self.__class__.__name__)
+        self._threads.append(thread)
+        thread.start()
+
+    def _serve(self, receive, send):
+        """Pass the messages received with `receive` to the model and `send` its replies.
+
+        :param receive: Callable returning received bytes, b"" if nothing arrived in a short
+            time, or None if the connection got closed.
+        :param send: Callable sending bytes.
+        """
+        termination = self.model.termination.encode()
+        buffer = b""
+        while not self._stop_event.is_set():
+            data = receive()
+            if data is None:
+                return
+            buffer += data
+            while termination in buffer:
+                message, buffer = buffer.split(termination, 1)
+                with self._lock:
+                    reply, latency = self.model.handle(message.decode("latin-1"))
+                    time.sleep(latency)
+                    if reply is not None:
+                        self._send(reply, send)
+
+    def _send(self, reply, send, chunk_size=4096):
+        """Send `reply` in chunks, pacing them according to the model's bandwidth."""
+        start = time.perf_counter()
+        for index in range(0, len(reply), chunk_size):
+            chunk = reply[index:index + chunk_size]
+            delay = start + self.model.transfer_time(index + len(chunk)) - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            send(chunk)
+
+
+class TCPServer(_SimulatorServer):
+    """Serve a simulated instrument over a TCP socket, like a LAN instrument.
+
+    Several clients may connect at once, their commands are processed one after another.
+
+    :param model: :class:`SimulatedInstrument` to serve.
+    :param host: Host name or IP address to listen at.
+    :param port: Port to listen at, 0 selects a free one.
+    """
+
+    def __init__(self, model, host="127.0.0.1", port=0):
+        super().__init__(model)
+        self.host = host
+        self.port = port
+        self._socket = None
+
+    @property
+    def resource_name(self):
+        """VISA resource name of the server."""
+        return f"TCPIP::{self.host}::{self.port}::SOCKET"
+
+    def _open(self):
+        self._socket = socket.create_server((self.host, self.port))
+        self._socket.settimeout(0.05)
+        self.port = self._socket.getsockname()[1]
+
+    def _close(self):
+        self._socket.close()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                connection, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            self._start_thread(self._handle_connection, connection)
+
+    def _handle_connection(self, connection):
+        connection.settimeout(0.05)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def receive():
+            try:
+                return connection.recv(65536) or None
+            except socket.timeout:
+                return b""
+
+        with connection:
+            try:
+                self._serve(receive, connection.sendall)
+            except OSError:  # The client closed the connection
+                pass
+
+
+class SerialServer(_SimulatorServer):
+    """Serve a simulated instrument over a pseudo terminal, like a serial instrument.
+
+    Pseudo terminals are only available on POSIX systems. Open :attr:`port` with e.g. the
+    :class:`~pymeasure.adapters.SerialAdapter`.
+
+    :param model: :class:`SimulatedInstrument` to serve.
+    """
+
+    def __init__(self, model):
+        super().__init__(model)
+        self.port = None
+        self._controller = self._device = None
+
+    @property
+    def resource_name(self):
+        """VISA resource name of the serial port."""
+        return f"ASRL{self.port}::INSTR"
+
+    def _open(self):
+        import pty
+        import tty
+
+        self._controller, self._device = pty.openpty()
+        # Transfer bytes unchanged instead of interpreting them as terminal input
+        tty.setraw(self._device)
+        self.port = os.ttyname(self._device)
+
+    def _close(self):
+        os.close(self._controller)
+        os.close(self._device)
+
+    def _run(self):
+        def receive():
+            ready, _, _ = select.select([self._controller], [], [], 0.05)
+            return os.read(self._controller, 65536) if ready else b""
+
+        def send(data):
+            while data:
+                data = data[os.write(self._controller, data):]
+
+        self._serve(receive, send)
@@ -22,6 +22,13 @@
 # THE SOFTWARE.
 #
 
-import pint
 
-ureg = pint.get_application_registry()
+def __getattr__(name):
+    # Importing pint takes a noticeable time, so the registry is created on first use.
+    if name == "ureg":
+        import pint
+
+        global ureg
+        ureg = pint.get_application_registry()
+        return ureg
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -22,12 +22,17 @@
 # THE SOFTWARE.
 #
 
+import asyncio
 import logging
+import threading
+import time
 from unittest import mock
 
+import numpy as np
 import pytest
 
 from pymeasure.adapters import Adapter, FakeAdapter, ProtocolAdapter
+from pymeasure.adapters.adapter import wait_until
 
 
 @pytest.fixture()
@@ -118,6 +123,63 @@ def test_read_binary_values():
     assert list(a.read_binary_values(dtype=int, sep=" ")) == pytest.approx([1, 2])
 
 
+def test_read_binary_values_binary():
+    a = ProtocolAdapter([(None, b"#12\x01\x02\n")])
+    assert list(a.read_binary_values(header_bytes=3, termination_bytes=-1,
+                                     dtype=np.uint8)) == [1, 2]
+
+
+def test_read_binary_values_writable():
+    a = ProtocolAdapter([(None, b"#12\x01\x02\n")])
+    values = a.read_binary_values(header_bytes=3, termination_bytes=-1, dtype=np.uint8)
+    values[0] = 5
+    assert list(values) == [5, 2]
+
+
+class TestReadBinaryBlock:
+    @pytest.mark.parametrize("message, kwargs, values", (
+        (b"#15hello\n", {}, list(b"hello")),
+        (b"#212" + np.arange(3, dtype="<i4").tobytes() + b"\n", {"dtype": np.int32}, [0, 1, 2]),
+        (b"#18" + np.arange(2, dtype=">i4").tobytes() + b"\n",
+         {"dtype": np.int32, "is_big_endian": True}, [0, 1]),
+        (b"DAT1,#14\x00\x00\x80?\n", {"dtype": np.float32}, [1]),
+        (b"#12\x01\x02", {"termination_bytes": 0}, [1, 2]),
+        (b"#0\x01\x02\x03\n", {}, [1, 2, 3]),
+    ))
+    def test_values(self, message, kwargs, values):
+        a = ProtocolAdapter([(None, message)])
+        assert list(a.read_binary_block(**kwargs)) == values
+        assert a._read_buffer is None  # message read completely
+
+    def test_reads_only_block(self):
+        a = ProtocolAdapter([(None, b"#13abc\nnext")])
+        assert a.read_binary_block().tobytes() == b"abc"
+        assert a.read_bytes(4) == b"next"
+
+    def test_out(self):
+        a = ProtocolAdapter([(None, b"#14\x01\x00\x02\x00\n"), (None, b"#0\x03\x00\n")])
+        out = np.zeros(3, dtype=np.uint16)
+        assert list(a.read_binary_block(dtype=np.uint16, out=out)) == [1, 2]
+        assert list(out) == [1, 2, 0]
+        assert list(a.read_binary_block(dtype=np.uint16, out=out)) == [3]
+        assert list(out) == [3, 2, 0]
+
+    @pytest.mark.parametrize("out", (np.zeros(1, dtype=np.uint16), np.zeros(2, dtype=np.int32)))
+    def test_out_invalid(self, out):
+        a = ProtocolAdapter([(None, b"#14\x01\x00\x02\x00\n")])
+        with pytest.raises(ValueError, match="`out`"):
+            a.read_binary_block(dtype=np.uint16, out=out)
+
+    def test_length_not_multiple_of_dtype(self):
+        a = ProtocolAdapter([(None, b"#13abc\n")])
+        with pytest.raises(ValueError, match="multiple"):
+            a.read_binary_block(dtype=np.uint16)
+
+    def test_timeout(self, fake):
+        with pytest.raises(TimeoutError):
+            fake.read_binary_block()
+
+
 def test_write_binary_values():
     """Test write_binary_values in the ieee header format."""
     a = ProtocolAdapter([(b'CMD#212\x00\x00\x80?\x00\x00\x00@\x00\x00@@\n', None)])
@@ -182,3 +244,59 @@ class TestLoggingForTestGenerator:
         record = caplog.records[0]
         assert record.msg == "READ:%s"
         assert record.args == (read,)
+
+
+class TestWaitUntil:
+    def test_condition_met(self):
+        condition = mock.Mock(side_effect=[False, False, True])
+        assert wait_until(condition, timeout=1) is True
+        assert condition.call_count == 3
+
+    def test_should_stop(self):
+        assert wait_until(lambda: False, timeout=1, should_stop=lambda: True) is False
+
+    def test_timeout(self):
+        with pytest.raises(TimeoutError, match="Custom message"):
+            wait_until(lambda: False, timeout=0.01, message="Custom message")
+
+    def test_backoff(self):
+        with mock.patch("pymeasure.adapters.adapter.time.sleep") as sleep:
+            wait_until(mock.Mock(side_effect=[False] * 10 + [True]), timeout=10, delay=0.1)
+        intervals = [c.args[0] for c in sleep.call_args_list]
+        assert intervals[:4] == pytest.approx([0.001, 0.002, 0.004, 0.008])
+        assert intervals[-1] == pytest.approx(0.1)
+
+
+def test_wait_for_srq_not_implemented(adapter):
+    with pytest.raises(NotImplementedError):
+        adapter.wait_for_srq()
+
+
+class TestAsync:
+    def test_read_write_async(self):
+        adapter = ProtocolAdapter([("W", "R")])
+
+        async def communicate():
+            await adapter.write_async("W")
+            return await adapter.read_async()
+
+        assert asyncio.run(communicate()) == "R"
+
+    def test_run_async_serializes_calls_of_an_adapter(self, adapter):
+        active = []
+
+        def work(i):
+            active.append(i)
+            assert len(active) == 1, "Calls of one adapter overlap"
+            time.sleep(0.01)
+            active.remove(i)
+            return threading.current_thread().name
+
+        async def run():
+            return await asyncio.gather(*(adapter.run_async(work, i) for i in range(5)))
+
+        names = asyncio.run(run())
+        assert set(names) == {names[0]}
+        assert names[0] != threading.current_thread().name
+        adapter.close()
+        assert adapter._executor is None
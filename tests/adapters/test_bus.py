@@ -0,0 +1,110 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+import threading
+import time
+
+import pytest
+
+from pymeasure.adapters.bus import Bus
+
+
+def test_reentrant():
+    bus = Bus()
+    with bus:
+        with bus:
+            assert bus.metrics["requests"] == 1
+    assert bus.metrics["requests"] == 1
+    with bus:
+        pass
+    assert bus.metrics["requests"] == 2
+
+
+def test_release_by_other_thread_fails():
+    bus = Bus()
+    bus.acquire()
+    errors = []
+
+    def release():
+        try:
+            bus.release()
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=release)
+    thread.start()
+    thread.join()
+    bus.release()
+    assert len(errors) == 1
+
+
+def test_excludes_other_threads():
+    bus = Bus()
+    log = []
+
+    def transaction(name):
+        with bus:
+            log.append(f"{name} start")
+            time.sleep(0.01)
+            log.append(f"{name} end")
+
+    threads = [threading.Thread(target=transaction, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for i in range(0, len(log), 2):
+        assert log[i].split()[0] == log[i + 1].split()[0]
+
+
+def test_first_in_first_out():
+    bus = Bus()
+    order = []
+    bus.acquire()
+    threads = []
+    for i in range(3):
+        thread = threading.Thread(target=lambda i=i: (bus.acquire(), order.append(i),
+                                                      bus.release()))
+        thread.start()
+        threads.append(thread)
+        while bus.queue_depth < i + 1:  # ensure the order of the requests
+            time.sleep(0.001)
+    assert bus.metrics["max_queue_depth"] == 3
+    bus.release()
+    for thread in threads:
+        thread.join()
+    assert order == [0, 1, 2]
+    assert bus.queue_depth == 0
+
+
+def test_metrics():
+    bus = Bus()
+    with bus:
+        time.sleep(0.02)
+    metrics = bus.metrics
+    assert metrics["busy_time"] == pytest.approx(0.02, abs=0.015)
+    assert 0 < metrics["utilisation"] <= 1
+    assert metrics["wait_time"] >= 0
+    bus.reset_metrics()
+    assert bus.metrics["requests"] == 0
+    assert bus.metrics["busy_time"] == 0
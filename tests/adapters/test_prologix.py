@@ -126,6 +126,76 @@ def test_wait_for_srq():
     with expected_protocol(
             PrologixAdapter,
             [("++auto 0", None), ("++eoi 1", None), ("++eos 2", None),
-             ("++srq", None), ("++read eoi", "0"), ("++srq", None), ("++read eoi", "1")]
+             ("++srq", "0"), ("++srq", "1")]
     ) as adapter:
-        adapter.wait_for_srq()
+        assert adapter.wait_for_srq() is True
+
+
+def test_wait_for_srq_should_stop():
+    with expected_protocol(
+            PrologixAdapter,
+            [("++auto 0", None), ("++eoi 1", None), ("++eos 2", None),
+             ("++srq", "0")]
+    ) as adapter:
+        assert adapter.wait_for_srq(should_stop=lambda: True) is False
+
+
+def test_wait_for_srq_ignores_other_devices():
+    # Another device asserts SRQ first, the serial poll of address 5 shows no request
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++srq", "1"), ("++spoll 5", "0"),
+                         ("++srq", "1"), ("++spoll 5", "80")],
+            address=5,
+    ) as adapter:
+        assert adapter.wait_for_srq() is True
+
+
+def test_wait_for_srq_timeout_with_other_device():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++srq", "1"), ("++spoll 5", "16")],
+            address=5,
+    ) as adapter:
+        with pytest.raises(TimeoutError):
+            adapter.wait_for_srq(timeout=0)
+
+
+def test_write_skips_unchanged_address():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("first", None), ("second", None),
+                         ("++read eoi", "response")],
+            address=5,
+    ) as adapter:
+        adapter.write("first")
+        adapter.write("second")
+        assert adapter.read() == "response"
+
+
+def test_sibling_adapters_switch_address():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("first", None),
+                         ("++addr 9", None), ("second", None), ("++read eoi", "9"),
+                         ("++addr 5", None), ("++read eoi", "5")],
+            address=5,
+    ) as adapter:
+        sibling = adapter.gpib(9)
+        assert sibling.bus is adapter.bus
+        adapter.write("first")
+        sibling.write("second")
+        assert sibling.read() == "9"
+        assert adapter.read() == "5"
+
+
+def test_manual_address_change_invalidates_address():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("first", None), ("++addr 7", None),
+                         ("++addr 5", None), ("second", None)],
+            address=5,
+    ) as adapter:
+        adapter.write("first")
+        adapter.write("++addr 7")
+        adapter.write("second")
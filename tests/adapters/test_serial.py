@@ -22,6 +22,9 @@
 # THE SOFTWARE.
 #
 
+import time
+
+import numpy as np
 import pytest
 import serial
 
@@ -79,6 +82,22 @@ def test_read_bytes_unlimited_long(adapter):
     assert adapter.read_bytes(-1) == b"abcde" * 50
 
 
+def test_read_bytes_unlimited_larger_than_chunk(adapter):
+    """Test whether the waiting bytes are read at once and the buffer grows as needed."""
+    adapter.write_bytes(bytes(range(256)) * 10)
+    assert adapter.read_bytes(-1) == bytes(range(256)) * 10
+
+
+def test_read_bytes_unlimited_idle_timeout(adapter):
+    """Test that the idle timeout applies after the first chunk and is restored afterwards."""
+    adapter.idle_timeout = 0.01
+    adapter.write_bytes(b"abcde" * 100)
+    start = time.perf_counter()
+    assert adapter.read_bytes(-1) == b"abcde" * 100
+    assert time.perf_counter() - start < 0.15
+    assert adapter.connection.timeout == 0.2
+
+
 @pytest.mark.parametrize("count", (-1, 8))
 def test_read_bytes_break_on_termchar(adapter, count):
     adapter.read_termination = "\n"
@@ -92,3 +111,19 @@ def test_adapter_write_binary_values(adapter, test_input, expected):
     adapter.write_binary_values("OUTP", test_input, datatype='B')
     # Add 10 bytes more, just to check that no extra bytes are present
     assert adapter.connection.read(len(expected) + 10) == expected
+
+
+def test_read_binary_block(adapter):
+    """Test that exactly the announced bytes are read, without waiting for a timeout."""
+    values = np.arange(1000, dtype="<u2")
+    adapter.write_bytes(b"#42000" + values.tobytes() + b"\nnext")
+    start = time.perf_counter()
+    assert np.array_equal(adapter.read_binary_block(dtype=np.uint16), values)
+    assert time.perf_counter() - start < 0.1
+    assert adapter.read_bytes(4) == b"next"
+
+
+def test_read_binary_block_timeout(adapter):
+    adapter.write_bytes(b"#210abc")
+    with pytest.raises(TimeoutError, match="3 of 10"):
+        adapter.read_binary_block()
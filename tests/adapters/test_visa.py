@@ -22,11 +22,13 @@
 # THE SOFTWARE.
 #
 import importlib.util
+from unittest import mock
 
 import pytest
 import pyvisa
 
 from pymeasure.adapters import VISAAdapter
+from pymeasure.instruments import Instrument
 from pymeasure.test import expected_protocol
 
 # This uses a pyvisa-sim default instrument, we could also define our own.
@@ -163,6 +165,31 @@ class TestReadBytes:
         assert adapter.read_bytes(-1) == b"SCPI,MOCK,VERSION_1.0\nSCPI,MOCK,VERSION_1.0\n"
 
 
+def test_read_all_bytes_idle_timeout(adapter):
+    adapter.idle_timeout = 0.005
+    adapter.write("*IDN?")
+    assert adapter.read_bytes(-1) == b"SCPI,MOCK,VERSION_1.0\n"
+    assert adapter.connection.timeout == 60
+
+
+def test_read_all_bytes_message_based_in_chunks():
+    # GPIB, TCPIP, and USB INSTR resources end each read at the end of a message
+    adapter = VISAAdapter("GPIB0::8::INSTR", visa_library='@sim', read_termination="\n",
+                          timeout=100)
+    try:
+        adapter.write("*IDN?")
+        adapter.write("*IDN?")
+        visalib = adapter.connection.visalib
+        with mock.patch.object(visalib, "read", wraps=visalib.read) as read:
+            data = adapter.read_bytes(-1)
+        assert data.count(b"\n") == 2
+        # one read per message and a final one timing out
+        assert read.call_count == 3
+        assert adapter.connection.timeout == 100
+    finally:
+        adapter.close()
+
+
 def test_visa_adapter(adapter):
     assert repr(adapter) == f"<VISAAdapter(resource='{SIM_RESOURCE}')>"
 
@@ -176,3 +203,58 @@ def test_visa_adapter(adapter):
 def test_visa_adapter_ask_values(adapter):
     with pytest.warns(FutureWarning):
         assert adapter.ask_values(":VOLT:IMM:AMPL?", separator=",") == [1.0]
+
+
+class TestWaitForSRQ:
+    @pytest.fixture
+    def adapter(self):
+        adapter = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        connection = adapter.connection
+        adapter.connection = mock.MagicMock()
+        adapter.connection.stb = 0
+        yield adapter
+        adapter.connection = connection
+        adapter.close()
+
+    def test_service_request(self, adapter):
+        adapter.connection.wait_on_event.side_effect = [mock.Mock(timed_out=True),
+                                                        mock.Mock(timed_out=False)]
+        type(adapter.connection).stb = mock.PropertyMock(side_effect=[0, 0x41])
+        assert adapter.wait_for_srq(timeout=1, delay=0.2) is True
+        assert adapter.connection.wait_on_event.call_args.args[1] == 200
+        adapter.connection.enable_event.assert_called_once()
+        adapter.connection.disable_event.assert_called_once()
+
+    def test_should_stop(self, adapter):
+        adapter.connection.wait_on_event.return_value = mock.Mock(timed_out=True)
+        assert adapter.wait_for_srq(timeout=10, should_stop=lambda: True) is False
+        adapter.connection.disable_event.assert_called_once()
+
+    def test_service_requested_before_call(self, adapter):
+        adapter.connection.stb = 0x40
+        assert adapter.wait_for_srq(timeout=1) is True
+        adapter.connection.enable_event.assert_not_called()
+
+    @pytest.mark.parametrize("method", ("enable_event", "wait_on_event"))
+    def test_not_supported(self, adapter, method):
+        getattr(adapter.connection, method).side_effect = pyvisa.errors.VisaIOError(
+            pyvisa.constants.StatusCode.error_nonsupported_operation)
+        with pytest.raises(NotImplementedError):
+            adapter.wait_for_srq(timeout=1)
+
+    def test_instrument_falls_back_to_polling(self, adapter):
+        # e.g. an ASRL resource, which does not support the service request event
+        adapter.connection.enable_event.side_effect = pyvisa.errors.VisaIOError(
+            pyvisa.constants.StatusCode.error_invalid_event)
+        adapter.connection.read.side_effect = ["0", "65"]
+        instr = Instrument(adapter, "Test", includeSCPI=False)
+        assert instr.wait_for_srq(timeout=1, delay=0.001) is True
+        assert adapter.connection.write.call_args_list == [mock.call("*STB?")] * 2
+
+    def test_timeout_ignores_other_devices(self, adapter):
+        # A service request of another device does not set this device's status bit
+        adapter.connection.wait_on_event.return_value = mock.Mock(timed_out=False)
+        adapter.connection.stb = 0
+        with pytest.raises(TimeoutError):
+            adapter.wait_for_srq(timeout=0.01, delay=0.001)
+        adapter.connection.disable_event.assert_called_once()
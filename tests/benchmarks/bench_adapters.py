@@ -0,0 +1,103 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Benchmark of adapters communicating with a simulated instrument.
+
+The instrument is served over a pseudo terminal (serial adapter, Prologix adapter) and over
+TCP (VISA adapter, requires pyvisa-py). The latency and bandwidth of the simulation are given
+on the command line, e.g.
+:code:`python tests/benchmarks/bench_adapters.py --latency 0.001 --bandwidth 11520`.
+"""
+
+import argparse
+import importlib.util
+import time
+
+import numpy as np
+
+from pymeasure.adapters import PrologixAdapter, SerialAdapter, VISAAdapter
+from pymeasure.instruments import Instrument
+from pymeasure.simulator import SerialServer, SimulatedInstrument, SimulatedPrologix, TCPServer
+
+WAVEFORM_POINTS = 100_000
+
+
+def create_model(latency, jitter, bandwidth):
+    model = SimulatedInstrument(latency=latency, jitter=jitter, bandwidth=bandwidth)
+    model.add_control("VOLT", 0)
+    model.add_buffer("TRAC:DATA?", np.linspace(0, 1, 1000))
+    model.add_waveform("WAV:DATA?", np.arange(WAVEFORM_POINTS) % 256 - 128)
+    return model
+
+
+def bench(function, number):
+    """Return the mean time per call of `function` in ms."""
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return (time.perf_counter() - start) / number * 1e3
+
+
+def run(name, instr, number):
+    waveform_size = WAVEFORM_POINTS + len(str(WAVEFORM_POINTS)) + 3
+
+    def read_waveform():
+        instr.write("WAV:DATA?")
+        instr.read_bytes(waveform_size)
+
+    print(f"{name:<24} {bench(lambda: instr.ask('VOLT?'), number):9.3f} ms "
+          f"{bench(lambda: instr.values('TRAC:DATA?'), number):9.3f} ms "
+          f"{bench(read_waveform, max(number // 10, 1)):9.3f} ms")
+    instr.adapter.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0, help="latency in s")
+    parser.add_argument("--jitter", type=float, default=0, help="jitter in s")
+    parser.add_argument("--bandwidth", type=float, default=None, help="bandwidth in bytes/s")
+    parser.add_argument("--number", type=int, default=100, help="repetitions")
+    args = parser.parse_args()
+    model = create_model(args.latency, args.jitter, args.bandwidth)
+    terminations = {"read_termination": "\n", "write_termination": "\n"}
+
+    print(f"{'adapter':<24} {'ask':>12} {'ASCII buffer':>12} {'waveform':>12}")
+    with SerialServer(model) as server:
+        run("SerialAdapter", Instrument(SerialAdapter(server.port, timeout=5, **terminations),
+                                        "Simulated", includeSCPI=False), args.number)
+    if importlib.util.find_spec("pyvisa_py") is None:
+        print("pyvisa-py is not installed, skipping VISA based adapters.")
+        return
+    with TCPServer(model) as server:
+        adapter = VISAAdapter(server.resource_name, visa_library="@py", **terminations)
+        run("VISAAdapter (TCP)", Instrument(adapter, "Simulated", includeSCPI=False),
+            args.number)
+    with SerialServer(SimulatedPrologix({5: model}, bandwidth=args.bandwidth)) as server:
+        adapter = PrologixAdapter(server.resource_name, address=5, visa_library="@py")
+        run("PrologixAdapter", Instrument(adapter, "Simulated", includeSCPI=False),
+            args.number)
+
+
+if __name__ == "__main__":
+    main()
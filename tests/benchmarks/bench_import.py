@@ -0,0 +1,86 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Benchmark of the startup time of scripts using pymeasure.
+
+Every scenario runs in a fresh interpreter, which reports the time spent in the scenario and
+which of the slow third-party libraries it loaded.
+Run it with :code:`python tests/benchmarks/bench_import.py`.
+"""
+
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ("pandas", "pint", "pyvisa", "serial", "zmq", "asyncio", "unittest")
+
+SCENARIOS = {
+    "import pymeasure": "import pymeasure",
+    "import pymeasure.adapters": "import pymeasure.adapters",
+    "import pymeasure.instruments": "import pymeasure.instruments",
+    "import pymeasure.experiment": "import pymeasure.experiment",
+    "define a procedure": """
+from pymeasure.experiment import Procedure, FloatParameter
+class Bench(Procedure):
+    voltage = FloatParameter("Voltage", units="V")
+    DATA_COLUMNS = ["Voltage (V)"]
+Bench()
+""",
+    "Keithley2400 and one read": """
+from pymeasure.adapters import FakeAdapter
+from pymeasure.instruments.keithley import Keithley2400
+Keithley2400(FakeAdapter()).ask("*IDN?")
+""",
+}
+
+RUNNER = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile({code!r}, "<scenario>", "exec"))
+duration = time.perf_counter() - start
+print(json.dumps([duration, [m for m in {heavy!r} if m in sys.modules]]))
+"""
+
+
+def bench(code, repeat=5):
+    """Return the shortest time in ms of `code` in a fresh interpreter and the slow modules it
+    loaded."""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", RUNNER.format(code=code, heavy=HEAVY_MODULES)],
+            capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(output.splitlines()[-1]))
+    duration, modules = min(runs)
+    return duration * 1e3, modules
+
+
+def main():
+    for name, code in SCENARIOS.items():
+        duration, modules = bench(code)
+        print(f"{name:<36} {duration:8.1f} ms   {', '.join(modules) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
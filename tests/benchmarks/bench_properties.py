@@ -0,0 +1,101 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Microbenchmark of the interpreter overhead of instrument construction and property access.
+
+The adapter answers immediately, such that the measured time is the time spent in pymeasure.
+Run it with :code:`python tests/benchmarks/bench_properties.py`.
+"""
+
+import timeit
+import warnings
+
+from pymeasure.adapters import Adapter
+from pymeasure.instruments import Instrument
+from pymeasure.instruments.advantest.advantestR624X import AdvantestR6245
+from pymeasure.instruments.agilent.agilentB1500 import AgilentB1500
+
+
+class ConstantAdapter(Adapter):
+    """Adapter which ignores writes and always replies the same message."""
+
+    def __init__(self, reply="1", **kwargs):
+        super().__init__(**kwargs)
+        self.reply = reply
+
+    def _write(self, command, **kwargs):
+        pass
+
+    def _read(self, **kwargs):
+        return self.reply
+
+
+class BenchInstrument(Instrument):
+    voltage = Instrument.control("VOLT?", "VOLT %g", "Plain float property.")
+    mode = Instrument.control(
+        "MODE?", "MODE %d", "Mapped property.",
+        values={"low": 0, "mid": 1, "high": 2}, map_values=True)
+    level = Instrument.control(
+        "LEV?", "LEV %g", "Dynamic property.", values=(0, 10), dynamic=True)
+    enabled = Instrument.measurement("ENAB?", "Boolean property.", cast=bool)
+
+    def __init__(self, adapter, **kwargs):
+        super().__init__(adapter, "Bench instrument", includeSCPI=False, **kwargs)
+
+
+def bench(statement, instrument, number=20000):
+    """Return the time per execution of `statement` (a string or a callable) in microseconds."""
+    timer = timeit.Timer(statement, globals={"inst": instrument})
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main():
+    # Some drivers warn about their unknown SCPI support at every construction
+    warnings.simplefilter("ignore", FutureWarning)
+    inst = BenchInstrument(ConstantAdapter("1"))
+    for cls in (BenchInstrument, AdvantestR6245, AgilentB1500):
+        duration = bench(lambda: cls(ConstantAdapter()), None, number=500)
+        print(f"{cls.__name__ + '(ConstantAdapter())':<36} {duration:8.2f} us")
+
+    inst = AdvantestR6245(ConstantAdapter("1"))
+    print(f"{'inst.ch_A.measurement_count':<36} "
+          f"{bench('inst.ch_A.measurement_count', inst):8.2f} us")
+
+    inst = BenchInstrument(ConstantAdapter("1"))
+    statements = [
+        "inst.name",
+        "inst.voltage",
+        "inst.voltage = 5",
+        "inst.mode",
+        "inst.mode = 'mid'",
+        "inst.level",
+        "inst.level = 5",
+        "inst.enabled",
+    ]
+    for statement in statements:
+        print(f"{statement:<36} {bench(statement, inst):8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
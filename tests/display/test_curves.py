@@ -0,0 +1,231 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyqtgraph as pg
+import pytest
+
+from pymeasure.display.curves import BufferCurve, MinMaxPyramid, ResultsCurve, ResultsImage
+from pymeasure.display.widgets.plot_widget import PlotWidget
+
+
+@pytest.fixture
+def results():
+    results = mock.MagicMock()
+    procedure = results.procedure
+    procedure.x_start, procedure.x_end, procedure.x_step = 0, 2, 1
+    procedure.y_start, procedure.y_end, procedure.y_step = 0, 1, 0.5
+    results.data = pd.DataFrame({'x': [], 'y': [], 'z': []})
+    return results
+
+
+class TestResultsImage:
+    def test_update_data(self, qtbot, results):
+        image = ResultsImage(results, 'x', 'y', 'z')
+        image.update_data()
+        assert np.isnan(image.img_data).all()
+
+        results.data = pd.DataFrame({'x': [0, 1.], 'y': [0, 0.5], 'z': [1., 3.]})
+        image.update_data()
+        assert image.img_data[0, 0] == 1
+        assert image.img_data[1, 1] == 3
+        assert np.isnan(image.img_data).sum() == 7
+        assert list(image.levels) == [1, 3]
+
+    def test_update_paints_only_new_rows(self, qtbot, results):
+        image = ResultsImage(results, 'x', 'y', 'z')
+        results.data = pd.DataFrame({'x': [0.], 'y': [0.], 'z': [1.]})
+        image.update_data()
+        image.img_data[0, 0] = 10  # a repaint would overwrite this value
+        results.data = pd.DataFrame({'x': [0., 2.4], 'y': [0., 0.74], 'z': [1., 5.]})
+        image.update_data()
+        assert image.img_data[0, 0] == 10
+        assert image.img_data[2, 1] == 5  # out of range x defaults to the final pixel
+        assert list(image.levels) == [1, 5]
+
+    def test_change_z_repaints(self, qtbot, results):
+        image = ResultsImage(results, 'x', 'y', 'z')
+        results.data = pd.DataFrame({'x': [0.], 'y': [0.], 'z': [1.], 'w': [7.]})
+        image.update_data()
+        image.z = 'w'
+        image.update_data()
+        assert image.img_data[0, 0] == 7
+
+    def test_find_img_index(self, qtbot, results):
+        image = ResultsImage(results, 'x', 'y', 'z')
+        xidx, yidx = image.find_img_index([0.4, 0.5, 1.6, 5], [0.3, 0.2, 1, -1])
+        assert xidx.tolist() == [0, 1, 2, 2]
+        assert yidx.tolist() == [1, 0, 2, 2]
+
+
+class TestMinMaxPyramid:
+    def test_small_data_is_not_decimated(self):
+        pyramid = MinMaxPyramid()
+        pyramid.update(np.arange(10), np.arange(10) ** 2)
+        x, y = pyramid.decimate(100)
+        assert x.tolist() == list(range(10))
+        assert y.tolist() == [i ** 2 for i in range(10)]
+
+    @pytest.mark.parametrize("length", (1000, 1001, 1023))
+    def test_decimate_keeps_envelope(self, length):
+        rng = np.random.default_rng(1)
+        y = rng.normal(size=length)
+        pyramid = MinMaxPyramid()
+        pyramid.update(np.arange(length), y)
+        x_dec, y_dec = pyramid.decimate(100)
+        assert len(x_dec) <= 110
+        assert y_dec.min() == y.min()
+        assert y_dec.max() == y.max()
+        assert x_dec[0] == 0 and x_dec[-1] == length - 1
+        assert (np.diff(x_dec) >= 0).all()
+
+    def test_incremental_update_equals_full_update(self):
+        y = np.random.default_rng(2).normal(size=5000)
+        x = np.arange(5000)
+        incremental = MinMaxPyramid()
+        for stop in (1, 3, 100, 2047, 5000):
+            incremental.update(x[:stop], y[:stop], appended=True)
+        full = MinMaxPyramid()
+        full.update(x, y)
+        for points in (50, 500, 4000):
+            for a, b in zip(incremental.decimate(points), full.decimate(points)):
+                np.testing.assert_array_equal(a, b)
+
+    def test_incremental_update_with_upcast(self):
+        # Live columns may start with integers and get upcast to floats by later rows
+        y = np.arange(1000) % 10 + 0.5
+        y[:10] = np.arange(10) % 2 * 9
+        x = np.arange(1000)
+        incremental = MinMaxPyramid()
+        incremental.update(x[:10], y[:10].astype(np.int64), appended=True)
+        incremental.update(x, y, appended=True)
+        full = MinMaxPyramid()
+        full.update(x, y)
+        for points in (50, 500):
+            for a, b in zip(incremental.decimate(points), full.decimate(points)):
+                np.testing.assert_array_equal(a, b)
+
+    def test_decimate_visible_range(self):
+        pyramid = MinMaxPyramid()
+        pyramid.update(np.arange(10000.), np.sin(np.arange(10000.)))
+        x, y = pyramid.decimate(100, x_range=(5000, 5020))
+        assert x.tolist() == list(range(4999, 5022))
+        x, y = pyramid.decimate(100, x_range=(2000, 6000))
+        assert 1999 <= x[0] and x[-1] <= 6001
+        assert len(x) <= 110
+
+    def test_unsorted_x_uses_all_points(self):
+        pyramid = MinMaxPyramid()
+        pyramid.update([3, 1, 2], [1, 2, 3])
+        assert pyramid.decimate(10, x_range=(0, 1.5))[0].tolist() == [3, 1, 2]
+
+    def test_nan_is_ignored(self):
+        y = np.arange(1000.)
+        y[::2] = np.nan
+        pyramid = MinMaxPyramid()
+        pyramid.update(np.arange(1000), y)
+        assert np.nanmax(pyramid.decimate(50)[1]) == 999
+
+
+class TestResultsCurve:
+    def test_decimated_update(self, qtbot, results):
+        curve = ResultsCurve(results, 'x', 'y', pen=pg.mkPen(), decimate=True)
+        results.data = pd.DataFrame({'x': np.arange(10000.), 'y': np.arange(10000.)})
+        curve.update_data()
+        x, y = curve.getData()
+        assert len(x) <= 2100
+        assert y.max() == 9999
+        results.data = pd.DataFrame({'x': np.arange(20000.), 'y': np.arange(20000.)})
+        curve.update_data()
+        assert curve.getData()[1].max() == 19999
+
+    def test_decimation_follows_view_range(self, qtbot, results):
+        widget = PlotWidget("Plot", ['x', 'y'], decimate=True)
+        qtbot.addWidget(widget)
+        results.data = pd.DataFrame({'x': np.arange(1e6), 'y': np.sin(np.arange(1e6))})
+        curve = widget.new_curve(results)
+        widget.load(curve)
+        assert len(curve.getData()[0]) < 1e4
+        widget.plot.setXRange(1000, 2000, padding=0)
+        x, y = curve.getData()
+        assert x[0] == 999 and x[-1] == 2001
+        widget.set_decimation(False)
+        assert len(curve.getData()[0]) == 1e6
+
+    def test_not_decimated_update(self, qtbot, results):
+        curve = ResultsCurve(results, 'x', 'y', pen=pg.mkPen())
+        results.data = pd.DataFrame({'x': np.arange(10000.), 'y': np.arange(10000.)})
+        curve.update_data()
+        assert len(curve.getData()[0]) == 10000
+
+
+class TestBufferCurve:
+    def test_append_includes_last_point(self, qtbot):
+        curve = BufferCurve()
+        curve.prepare(3)
+        curve.append(1, 2)
+        curve.append(2, 4)
+        curve.update_data()
+        x, y = curve.getData()
+        assert x.tolist() == [1, 2]
+        assert y.tolist() == [2, 4]
+
+    def test_overflow(self, qtbot):
+        curve = BufferCurve()
+        curve.prepare(3)
+        curve.append([1, 2], [1, 2])
+        with pytest.raises(Exception, match="overflow"):
+            curve.append([3, 4], [3, 4])
+
+    @pytest.mark.parametrize("blocks", ([1] * 7, [2, 3, 2], [7]))
+    def test_ring_wraps_around(self, qtbot, blocks):
+        curve = BufferCurve()
+        curve.prepare(3, ring=True)
+        start = 0
+        for count in blocks:
+            values = np.arange(start, start + count)
+            curve.append(values, 10 * values)
+            start += count
+        assert curve.points[:, 0].tolist() == [4, 5, 6]
+        assert curve.points[:, 1].tolist() == [40, 50, 60]
+
+    def test_decimate(self, qtbot):
+        curve = BufferCurve(decimate=True)
+        curve.prepare(100000)
+        curve.append(np.arange(50000), np.arange(50000))
+        curve.update_data()
+        x, y = curve.getData()
+        assert len(x) <= 2100
+        assert y.max() == 49999
+
+    def test_update_once_per_refresh(self, qtbot):
+        curve = BufferCurve(refresh_time=0.01)
+        curve.prepare(100)
+        with qtbot.waitSignal(curve.data_updated):
+            for i in range(10):
+                curve.append(i, i)
+        assert curve.getData()[0].tolist() == list(range(10))
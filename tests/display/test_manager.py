@@ -0,0 +1,226 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import tempfile
+import threading
+from time import sleep
+from types import SimpleNamespace
+
+import pytest
+
+from pymeasure.display.Qt import QtWidgets
+from pymeasure.display.browser import BaseBrowserItem
+from pymeasure.display.manager import BaseManager, Experiment
+from pymeasure.display.windows.managed_window import ManagedWindowBase
+from pymeasure.experiment import Procedure, ProcessWorker, Results
+
+release = threading.Event()
+
+
+class WaitingProcedure(Procedure):
+    """Runs until the module level `release` event is set or it is aborted."""
+
+    def execute(self):
+        while not (release.is_set() or self.should_stop()):
+            sleep(0.005)
+
+
+class QuickProcedure(Procedure):
+    DATA_COLUMNS = ['Value']
+
+    def execute(self):
+        for i in range(10):
+            self.emit('results', {'Value': i})
+            self.emit('progress', 10 * i)
+
+
+class StatusItem(BaseBrowserItem):
+
+    def __init__(self):
+        self.status = None
+        self.progress = None
+
+    def setStatus(self, status):
+        self.status = status
+
+    def setProgress(self, progress):
+        self.progress = progress
+
+
+def make_experiment(resources=None):
+    procedure = WaitingProcedure()
+    procedure.RESOURCES = resources
+    results = Results(procedure, tempfile.mktemp())
+    return Experiment(results, browser_item=StatusItem())
+
+
+@pytest.fixture
+def manager(qtbot):
+    release.clear()
+    manager = BaseManager(port=None, max_workers=2)
+    yield manager
+    release.set()
+    qtbot.waitUntil(lambda: not manager.is_running())
+
+
+def running(manager):
+    return [e for e in manager.running_experiments()
+            if e.procedure.status == Procedure.RUNNING]
+
+
+def test_disjoint_resources_run_concurrently(qtbot, manager):
+    experiments = [make_experiment({'gpib::1'}), make_experiment('gpib::2')]
+    for experiment in experiments:
+        manager.queue(experiment)
+    qtbot.waitUntil(lambda: len(running(manager)) == 2)
+    assert manager.running_experiments() == experiments
+
+    with qtbot.waitSignals([manager.finished, manager.finished]):
+        release.set()
+    assert not manager.is_running()
+    assert all(e.browser_item.progress == 100 for e in experiments)
+
+
+def test_conflicting_resources_run_sequentially(qtbot, manager):
+    first, second, third = (make_experiment({'gpib::1'}), make_experiment({'gpib::1', 'com1'}),
+                            make_experiment({'com1'}))
+    for experiment in (first, second, third):
+        manager.queue(experiment)
+    # The third experiment does not conflict with the first one and is started before the second
+    qtbot.waitUntil(lambda: len(running(manager)) == 2)
+    assert manager.running_experiments() == [first, third]
+    assert second.procedure.status == Procedure.QUEUED
+
+    with qtbot.waitSignals([manager.finished] * 3, timeout=10000):
+        release.set()
+    assert second.procedure.status == Procedure.FINISHED
+
+
+def test_exclusive_procedure_runs_alone(qtbot, manager):
+    exclusive, other = make_experiment(), make_experiment({'gpib::1'})
+    manager.queue(exclusive)
+    manager.queue(other)
+    qtbot.waitUntil(lambda: len(running(manager)) == 1)
+    assert manager.running_experiments() == [exclusive]
+
+
+def test_single_worker_by_default(qtbot):
+    release.clear()
+    manager = BaseManager(port=None)
+    first, second = make_experiment({'a'}), make_experiment({'b'})
+    manager.queue(first)
+    manager.queue(second)
+    qtbot.waitUntil(lambda: len(running(manager)) == 1)
+    assert manager.running_experiment() is first
+    with pytest.raises(Exception, match="already running"):
+        manager.next()
+    with qtbot.waitSignals([manager.finished] * 2, timeout=10000):
+        release.set()
+
+
+def test_abort_single_experiment(qtbot, manager):
+    first, second = make_experiment({'a'}), make_experiment({'b'})
+    manager.queue(first)
+    manager.queue(second)
+    qtbot.waitUntil(lambda: len(running(manager)) == 2)
+
+    with qtbot.waitSignal(manager.abort_returned) as blocker:
+        manager.abort(first)
+    assert blocker.args == [first]
+    assert first.procedure.status == Procedure.ABORTED
+    assert manager.running_experiments() == [second]
+
+
+def test_abort_all_pauses_queue(qtbot, manager):
+    experiments = [make_experiment({'a'}), make_experiment({'b'}), make_experiment({'c'})]
+    for experiment in experiments:
+        manager.queue(experiment)
+    qtbot.waitUntil(lambda: len(running(manager)) == 2)
+
+    with qtbot.waitSignals([manager.abort_returned] * 2):
+        manager.abort()
+    assert not manager.is_running()
+    assert experiments[2].procedure.status == Procedure.QUEUED
+
+    with qtbot.waitSignal(manager.running):
+        manager.resume()
+    assert manager.running_experiments() == [experiments[2]]
+
+
+class AbortWindow(QtWidgets.QWidget):
+    """The abort/resume handling of the ManagedWindow."""
+    abort = ManagedWindowBase.abort
+    resume = ManagedWindowBase.resume
+    abort_returned = ManagedWindowBase.abort_returned
+    finished = ManagedWindowBase.finished
+
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+        self.abort_button = QtWidgets.QPushButton("Abort", self)
+        self.abort_button.clicked.connect(self.abort)
+        self.browser_widget = SimpleNamespace(clear_button=QtWidgets.QPushButton(self))
+        manager.abort_returned.connect(self.abort_returned)
+        manager.finished.connect(self.finished)
+
+
+@pytest.fixture
+def single_manager(qtbot):
+    release.clear()
+    manager = BaseManager(port=None)
+    yield manager
+    release.set()
+    qtbot.waitUntil(lambda: not manager.is_running())
+
+
+def test_window_abort_single_experiment_keeps_abort_button(qtbot, single_manager):
+    manager = single_manager
+    window = AbortWindow(manager)
+    qtbot.addWidget(window)
+    first, second = make_experiment({'a'}), make_experiment({'b'})
+    manager.queue(first)
+    manager.queue(second)
+    qtbot.waitUntil(lambda: running(manager) == [first])
+
+    with qtbot.waitSignal(manager.running):
+        manager.abort(first)  # as from the context menu of the browser
+    assert window.abort_button.text() == "Abort"
+    assert window.abort_button.isEnabled()
+    assert manager.running_experiments() == [second]
+
+    with qtbot.waitSignal(manager.abort_returned):
+        window.abort_button.click()  # still aborts, i.e. pauses the queue
+    assert window.abort_button.text() == "Resume"
+    assert second.procedure.status == Procedure.ABORTED
+
+
+def test_process_worker(qtbot):
+    manager = BaseManager(port=None, worker_class=ProcessWorker)
+    experiment = Experiment(Results(QuickProcedure(), tempfile.mktemp()),
+                            browser_item=StatusItem())
+    with qtbot.waitSignal(manager.finished, timeout=10000):
+        manager.queue(experiment)
+    assert experiment.browser_item.status == Procedure.FINISHED
+    assert experiment.browser_item.progress == 100
+    assert experiment.results.data['Value'].tolist() == list(range(10))
@@ -0,0 +1,135 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+from pymeasure.display.Qt import QtCore, QtWidgets
+from pymeasure.display.browser import BaseBrowserItem
+from pymeasure.display.manager import BaseManager, Experiment
+from pymeasure.display.widgets.sequencer_widget import SequencerWidget
+from pymeasure.experiment import Procedure, IntegerParameter, Results
+
+
+class SweepProcedure(Procedure):
+    x = IntegerParameter("X", default=0)
+    y = IntegerParameter("Y", default=0)
+
+
+class FakeManager(QtCore.QObject):
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(object)
+    abort_returned = QtCore.Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.experiments = SimpleNamespace(queue=[])
+
+
+class FakeWindow(QtWidgets.QWidget):
+    procedure_class = SweepProcedure
+    displays = ("x", "y")
+
+    def __init__(self):
+        super().__init__()
+        self.manager = FakeManager()
+
+    def make_procedure(self):
+        return SweepProcedure()
+
+    def queue(self, procedure=None):
+        self.manager.experiments.queue.append(SimpleNamespace(procedure=procedure))
+
+    @property
+    def queued(self):
+        return [(e.procedure.x, e.procedure.y) for e in self.manager.experiments.queue]
+
+
+class StatusItem(BaseBrowserItem):
+
+    def setStatus(self, status):
+        pass
+
+    def setProgress(self, progress):
+        pass
+
+
+class ManagerWindow(FakeWindow):
+    """Window, which runs the queued procedures with a real manager."""
+
+    def __init__(self):
+        super().__init__()
+        self.manager = BaseManager(port=None)
+
+    def queue(self, procedure=None):
+        results = Results(procedure, tempfile.mktemp())
+        self.manager.queue(Experiment(results, browser_item=StatusItem()))
+
+
+@pytest.fixture
+def window(qtbot, tmp_path):
+    window = FakeWindow()
+    qtbot.addWidget(window)
+    sequence_file = tmp_path / "sequence.txt"
+    sequence_file.write_text('- "X", "[1, 2, 3]"\n-- "Y", "[4, 5]"\n')
+    window.sequence_file = str(sequence_file)
+    return window
+
+
+EXPECTED = [(1, 4), (1, 5), (2, 4), (2, 5), (3, 4), (3, 5)]
+
+
+def test_queue_sequence_all(window):
+    widget = SequencerWidget(sequence_file=window.sequence_file, parent=window)
+    widget.queue_sequence()
+    assert window.queued == EXPECTED
+
+
+def test_queue_sequence_on_demand(qtbot, window):
+    widget = SequencerWidget(sequence_file=window.sequence_file, parent=window, queue_ahead=2)
+    widget.queue_sequence()
+    assert window.queued == EXPECTED[:2]
+    experiments = window.manager.experiments.queue
+    for done in range(1, 6):
+        experiments[done - 1].procedure.status = Procedure.FINISHED
+        window.manager.finished.emit(experiments[done - 1])
+        # The sequence is refilled after the manager has handled the ended experiment
+        qtbot.waitUntil(lambda: window.queued == EXPECTED[:min(done + 2, 6)])
+    qtbot.waitUntil(lambda: widget._pending is None)
+    assert window.queued == EXPECTED
+
+
+def test_queue_sequence_on_demand_with_manager(qtbot, window):
+    manager_window = ManagerWindow()
+    qtbot.addWidget(manager_window)
+    manager = manager_window.manager
+    widget = SequencerWidget(sequence_file=window.sequence_file, parent=manager_window,
+                             queue_ahead=2)
+    with qtbot.waitSignals([manager.finished] * len(EXPECTED), timeout=10000):
+        widget.queue_sequence()
+    qtbot.waitUntil(lambda: widget._pending is None and not manager.is_running())
+    assert manager_window.queued == EXPECTED
+    assert all(e.procedure.status == Procedure.FINISHED for e in manager.experiments.queue)
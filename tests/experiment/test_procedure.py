@@ -124,3 +124,15 @@ def test_procedure_no_parsed_units(valid_header_no_unit):
 def test_procedure_invalid_parsed_unit(invalid_header_unit):
     with pytest.raises(ValueError):
         Procedure.parse_columns(invalid_header_unit)
+
+
+@pytest.mark.parametrize("resources, expected", (
+        (None, None),
+        ("GPIB::1", frozenset({"GPIB::1"})),
+        (["GPIB::1", "COM1"], frozenset({"GPIB::1", "COM1"})),
+))
+def test_procedure_resources(resources, expected):
+    class TestProcedure(Procedure):
+        RESOURCES = resources
+
+    assert TestProcedure().resources() == expected
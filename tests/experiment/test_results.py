@@ -25,16 +25,16 @@
 import os
 import pickle
 import tempfile
-from unittest import mock
 
 import pandas as pd
 import pytest
 import numpy as np
 
 from pymeasure.units import ureg
-from pymeasure.experiment.results import Results, CSVFormatter
+from pymeasure.experiment.results import (Results, CSVFormatter, DataBuffer, BinaryFormatter,
+                                          convert_data_file)
 from pymeasure.experiment.procedure import Procedure, Parameter
-from pymeasure.experiment import BooleanParameter
+from pymeasure.experiment import BooleanParameter, Metadata
 from data.procedure_for_testing import RandomProcedure
 
 
@@ -98,6 +98,105 @@ class Test_csv_formatter_format:
         assert formatter.format(data) == "nan,nan,nan"
 
 
+class TestFormatBlock:
+    def test_csv_dict_of_arrays(self):
+        formatter = CSVFormatter(columns=['t', 'x', 'V'])
+        block = {'t': np.array([1, 2]), 'x': np.array([0.5, 1.5]), 'V': 'abc'}
+        assert formatter.format(block) == '1,0.5,abc\n2,1.5,abc'
+
+    def test_csv_dataframe_equals_single_rows(self):
+        formatter = CSVFormatter(columns=['t', 'x'])
+        frame = pd.DataFrame({'t': [1, 2, 3], 'x': [0.1, np.nan, 3.]})
+        lines = [formatter.format(row.to_dict()) for _, row in frame.astype(object).iterrows()]
+        assert formatter.format(frame) == "\n".join(lines)
+
+    def test_csv_quantity_array(self):
+        formatter = CSVFormatter(columns=['length (m)', 'missing'])
+        block = {'length (m)': ureg.Quantity(np.array([10, 250]), ureg.cm)}
+        assert formatter.format(block) == '0.1,nan\n2.5,nan'
+
+    def test_binary(self):
+        formatter = BinaryFormatter(columns=['t', 'V', 'on'])
+        block = pd.DataFrame({'t': [1, 2], 'V': ['1.5', '3'], 'on': [True, False]})
+        values = np.frombuffer(formatter.format(block), dtype='<f8').reshape(2, 3)
+        assert values.tolist() == [[1, 1.5, 1], [2, 3, 0]]
+
+    def test_binary_refuses_strings(self):
+        formatter = BinaryFormatter(columns=['t', 'V'])
+        block = pd.DataFrame({'t': [1, 2], 'V': ['abc', '3']})
+        with pytest.raises(ValueError, match="Column 'V'"):
+            formatter.format(block)
+
+
+def test_binary_formatter_format():
+    formatter = BinaryFormatter(columns=['t', 'x (m)', 'V'])
+    data = {'t': 1, 'x (m)': "50 cm", 'V': None}
+    values = np.frombuffer(formatter.format(data), dtype='<f8')
+    assert values[:2].tolist() == [1., 0.5]
+    assert np.isnan(values[2])
+    with pytest.raises(ValueError, match="column 'V'"):
+        formatter.format({'t': 1, 'x (m)': 0.5, 'V': 'abc'})
+
+
+class TestDataBuffer:
+    def test_append_grows_capacity(self):
+        buffer = DataBuffer(capacity=2)
+        buffer.append(pd.DataFrame({'a': [1, 2, 3], 'b': [1., 2., 3.]}))
+        buffer.append(pd.DataFrame({'a': [4], 'b': [4.]}))
+        assert len(buffer) == 4
+        assert buffer.capacity >= 4
+        assert buffer.frame['a'].tolist() == [1, 2, 3, 4]
+        assert buffer.frame['a'].dtype == np.int64
+
+    def test_append_upcasts_column(self):
+        buffer = DataBuffer(columns=['a', 'b'])
+        buffer.append(pd.DataFrame({'a': [1], 'b': [1]}))
+        buffer.append(pd.DataFrame({'a': [1.5], 'b': ['x']}))
+        assert buffer.frame['a'].tolist() == [1, 1.5]
+        assert buffer.frame['b'].tolist() == [1, 'x']
+
+    def test_missing_column_is_nan(self):
+        buffer = DataBuffer(columns=['a', 'b'])
+        buffer.append(pd.DataFrame({'a': [1.]}))
+        assert np.isnan(buffer.frame['b'][0])
+
+    def test_append_dict_of_arrays(self):
+        buffer = DataBuffer(columns=['a'])
+        buffer.append({'a': np.arange(3)})
+        assert buffer.frame['a'].tolist() == [0, 1, 2]
+
+    def test_frame_is_cached(self):
+        buffer = DataBuffer()
+        buffer.append(pd.DataFrame({'a': [1.]}))
+        assert buffer.frame is buffer.frame
+
+    def test_append_row(self):
+        buffer = DataBuffer(columns=['a', 'b'], capacity=1)
+        buffer.append_row({'a': 1, 'b': 2.5})
+        buffer.append_row({'a': 3})
+        buffer.append_row({'a': 4, 'b': 'x'})
+        assert buffer.frame['a'].tolist() == [1, 3, 4]
+        assert buffer.frame['a'].dtype == np.int64
+        assert buffer.frame['b'].tolist()[::2] == [2.5, 'x']
+        assert np.isnan(buffer.frame['b'][1])
+
+    def test_append_row_keeps_dtypes(self):
+        buffer = DataBuffer(columns=['a', 'b', 'c', 'd'])
+        buffer.append_row({'a': 1, 'b': True, 'c': 'x', 'd': 0.5})
+        buffer.append_row({'a': 2, 'b': False, 'c': 'y', 'd': 1})
+        assert buffer.frame.dtypes.tolist() == [np.int64, bool, object, np.float64]
+
+    def test_append_row_upcasts_column(self):
+        buffer = DataBuffer(columns=['a', 'b'])
+        buffer.append_row({'a': True, 'b': 1})
+        buffer.append_row({'a': 2, 'b': 1.5})
+        buffer.append_row({'a': 3})
+        assert buffer.frame['a'].tolist() == [1, 2, 3]
+        assert buffer.frame['a'].dtype == np.int64
+        assert buffer.frame['b'].tolist()[:2] == [1, 1.5]
+        assert buffer.frame['b'].dtype == np.float64
+
+
 def test_procedure_filestorage():
     assert RandomProcedure.iterations.value == 100
     procedure = RandomProcedure()
@@ -114,30 +213,104 @@ def test_procedure_filestorage():
 class TestResults:
     # TODO: add a full set of Results tests
 
-    @mock.patch('pymeasure.experiment.results.open', mock.mock_open(), create=True)
-    @mock.patch('os.path.exists', return_value=True)
-    @mock.patch('pymeasure.experiment.results.pd.read_csv')
-    def test_regression_attr_data_when_up_to_date_should_retain_dtype(self,
-                                                                      read_csv_mock,
-                                                                      path_exists_mock):
-        procedure_mock = mock.MagicMock(spec=Procedure)
-        result = Results(procedure_mock, 'test.csv')
-
-        read_csv_mock.return_value = [pd.DataFrame(data={
-            'A': [1, 2, 3, 4, 5, 6, 7],
-            'B': [2, 3, 4, 5, 6, 7, 8]
-        })]
+    def test_regression_attr_data_when_up_to_date_should_retain_dtype(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['A', 'B']
+        filename = os.path.join(str(tmpdir), 'dtype_test.csv')
+        result = Results(DummyProcedure(), filename)
+        with open(filename, 'a') as f:
+            f.write("".join(f"{i},{i + 1}\n" for i in range(1, 8)))
         first_data = result.data
 
-        # if no updates, read_csv returns a zero-row dataframe
-        read_csv_mock.return_value = [pd.DataFrame(data={
-            'A': [], 'B': []
-        }, dtype=object)]
+        # no updates in the file
         second_data = result.data
 
         assert second_data.iloc[:, 0].dtype is not object
         assert first_data.iloc[:, 0].dtype is second_data.iloc[:, 0].dtype
 
+    def test_data_reads_only_appended_rows(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['A', 'B']
+        filename = os.path.join(str(tmpdir), 'incremental_test.csv')
+        result = Results(DummyProcedure(), filename)
+        assert result.data.empty
+        with open(filename, 'a') as f:
+            f.write("1,2\n3,4\n")
+        assert result.data.values.tolist() == [[1, 2], [3, 4]]
+        offset = result._offset
+        with open(filename, 'a') as f:
+            f.write("5,6.5\n7,")  # last line is not yet complete
+        data = result.data
+        assert data.values.tolist() == [[1, 2], [3, 4], [5, 6.5]]
+        assert data['B'].dtype == np.float64
+        assert result._offset == offset + len("5,6.5\n")
+        with open(filename, 'a') as f:
+            f.write("8\n")
+        assert result.data.values.tolist() == [[1, 2], [3, 4], [5, 6.5], [7, 8]]
+        result.reload()
+        assert len(result.data) == 4
+
+    def test_data_after_store_metadata(self, tmpdir):
+        class DummyProcedure(RandomProcedure):
+            meta = Metadata('Meta', default=5)
+        filename = os.path.join(str(tmpdir), 'metadata_test.csv')
+        procedure = DummyProcedure()
+        result = Results(procedure, filename)
+        assert result.data.empty
+        procedure.evaluate_metadata()
+        result.store_metadata()
+        with open(filename, 'a') as f:
+            f.write("1,2\n")
+        assert result.data.values.tolist() == [[1, 2]]
+
+    def test_live_data_is_served_from_memory(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['A', 'B (V)']
+        filename = os.path.join(str(tmpdir), 'live_test.csv')
+        result = Results(DummyProcedure(), filename)
+        result.start_live()
+        assert result.live
+        assert result.data.columns.tolist() == ['A', 'B (V)']
+        assert result.push({'A': 1, 'B (V)': ureg.Quantity(2, 'mV')}) == {'A': 1, 'B (V)': 0.002}
+        result.push({'A': np.arange(2, 4), 'B (V)': np.array([3., 4.])})
+        # Nothing has been written to the file
+        assert result.data.values.tolist() == [[1, 0.002], [2, 3], [3, 4]]
+        result.reload()
+        assert len(result.data) == 3
+
+        with open(filename, 'a') as f:
+            f.write("1,0.002\n2,3.0\n3,4.0\n")
+        result.stop_live()
+        assert not result.live
+        with open(filename, 'a') as f:
+            f.write("5,6\n")
+        assert result.data.values.tolist() == [[1, 0.002], [2, 3], [3, 4], [5, 6]]
+
+    def test_live_data_dtypes_match_file(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['Index', 'Flag', 'Name', 'Value']
+        filename = os.path.join(str(tmpdir), 'live_dtype_test.csv')
+        result = Results(DummyProcedure(), filename)
+        result.start_live()
+        rows = [{'Index': 1, 'Flag': True, 'Name': 'a', 'Value': 0.5},
+                {'Index': 2, 'Flag': False, 'Name': 'b', 'Value': 1.5}]
+        for row in rows:
+            result.push(row)
+        live_dtypes = result.data.dtypes.tolist()
+        with open(filename, 'a') as f:
+            f.write("".join(result.format(row) + "\n" for row in rows))
+        result.stop_live()
+        result.reload()
+        assert result.data.values.tolist() == [list(row.values()) for row in rows]
+        assert result.data.dtypes.tolist() == live_dtypes
+
+    def test_push_without_live_returns_record(self, tmpdir):
+        filename = os.path.join(str(tmpdir), 'not_live_test.csv')
+        result = Results(RandomProcedure(), filename)
+        record = {'Iteration': 1, 'Random Number': 0.5}
+        assert result.push(record) is record
+        assert result.data.empty
+
     def test_regression_param_str_should_not_include_newlines(self, tmpdir):
         class DummyProcedure(Procedure):
             par = Parameter('Generic Parameter with newline chars')
@@ -151,6 +324,71 @@ class TestResults:
         assert (result.parameters['par'].value == np.linspace(1, 100, 17)).all()
 
 
+class TestBinaryStorage:
+    @pytest.fixture
+    def results(self, tmpdir):
+        procedure = RandomProcedure()
+        procedure.iterations = 7
+        return Results(procedure, os.path.join(str(tmpdir), 'data.pmb'))
+
+    def test_data_reads_only_complete_records(self, results):
+        assert results.data.empty
+        values = np.array([[0, 0.5], [1, 0.25], [2, 0.125]], dtype='<f8')
+        with open(results.data_filename, 'ab') as f:
+            f.write(values[:2].tobytes())
+            f.write(values[2].tobytes()[:10])
+        assert results.data.values.tolist() == values[:2].tolist()
+        with open(results.data_filename, 'ab') as f:
+            f.write(values[2].tobytes()[10:])
+        assert results.data.values.tolist() == values.tolist()
+
+    def test_load(self, results):
+        with open(results.data_filename, 'ab') as f:
+            f.write(np.array([[0, 0.5]], dtype='<f8').tobytes())
+        loaded = Results.load(results.data_filename, procedure_class=RandomProcedure)
+        assert loaded.parameters['iterations'].value == 7
+        assert loaded.data.values.tolist() == [[0, 0.5]]
+
+    def test_convert_to_and_from_csv(self, results, tmpdir):
+        with open(results.data_filename, 'ab') as f:
+            f.write(np.array([[0, 0.5], [1, 0.25]], dtype='<f8').tobytes())
+        csv_filename = os.path.join(str(tmpdir), 'data.csv')
+        convert_data_file(results.data_filename, csv_filename)
+        csv_results = Results.load(csv_filename, procedure_class=RandomProcedure)
+        assert csv_results.parameters['iterations'].value == 7
+        assert csv_results.data.values.tolist() == [[0, 0.5], [1, 0.25]]
+
+        binary_filename = os.path.join(str(tmpdir), 'data2.pmb')
+        convert_data_file(csv_filename, binary_filename)
+        binary_results = Results.load(binary_filename, procedure_class=RandomProcedure)
+        assert binary_results.data.values.tolist() == [[0, 0.5], [1, 0.25]]
+
+    def test_push_refuses_strings(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['Index', 'Name']
+        results = Results(DummyProcedure(), os.path.join(str(tmpdir), 'strings.pmb'))
+        results.start_live()
+        results.push({'Index': 1, 'Name': 2.5})
+        with pytest.raises(ValueError, match="column 'Name'"):
+            results.push({'Index': 2, 'Name': 'b'})
+        with pytest.raises(ValueError, match="Column 'Name'"):
+            results.push({'Index': [3, 4], 'Name': ['c', 'd']})
+        assert results.data.values.tolist() == [[1, 2.5]]
+
+    def test_convert_string_column_from_csv(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['Index', 'Name']
+        csv_filename = os.path.join(str(tmpdir), 'strings.csv')
+        Results(DummyProcedure(), csv_filename)
+        with open(csv_filename, 'a') as f:
+            f.write("1,a\n2,b\n")
+        assert Results.load(csv_filename).data['Name'].tolist() == ['a', 'b']
+        binary_filename = os.path.join(str(tmpdir), 'strings.pmb')
+        with pytest.raises(ValueError, match="Column 'Name'"):
+            convert_data_file(csv_filename, binary_filename)
+        assert not os.path.exists(binary_filename)
+
+
 def test_parameter_reading():
     data_path = os.path.join(os.path.dirname(__file__), "data/results_for_testing_parameters.csv")
     test_string = "/test directory with space/test_filename.csv"
@@ -124,3 +124,50 @@ def test_sequencer_errors(seq_file_text_err):
     with pytest.raises(exception, match=exc_text):
         seq = SequenceHandler(file_obj=fd)
         seq.parameters_sequence()
+
+
+seq_file_text_4 = """
+- "P1", "[1,2]"
+-- "P2", "[3, 4]"
+-- "P3", "[5]"
+- "P4", "range(2)"
+"""
+
+
+def test_parameters_sequence():
+    seq = SequenceHandler(file_obj=StringIO(seq_file_text_4))
+    sequence = seq.parameters_sequence(names_map={"P1": "a", "P2": "b", "P3": "c", "P4": "d"})
+    expected = [
+        ({"a": 1}, {"b": 3}), ({"a": 1}, {"b": 4}), ({"a": 1}, {"c": 5}),
+        ({"a": 2}, {"b": 3}), ({"a": 2}, {"b": 4}), ({"a": 2}, {"c": 5}),
+        ({"d": 0},), ({"d": 1},),
+    ]
+    assert len(sequence) == len(expected)
+    assert list(sequence) == expected
+    assert [sequence[i] for i in range(len(expected))] == expected
+    assert sequence[-1] == expected[-1]
+    assert sequence[2:4] == expected[2:4]
+    with pytest.raises(IndexError):
+        sequence[len(expected)]
+
+
+def test_parameters_sequence_is_lazy():
+    text = "\n".join(f'{"-" * (level + 1)} "P{level}", "arange(50)"' for level in range(5))
+    sequence = SequenceHandler(file_obj=StringIO(text)).parameters_sequence()
+    assert len(sequence) == 50 ** 5
+    assert sequence[-1] == tuple({f"P{level}": 49} for level in range(5))
+    assert sequence[51] == ({"P0": 0}, {"P1": 0}, {"P2": 0}, {"P3": 1}, {"P4": 1})
+
+
+def test_expressions_evaluated_once(monkeypatch):
+    seq = SequenceHandler(file_obj=StringIO(seq_file_text_3))
+    calls = []
+    eval_string = SequenceHandler.eval_string
+    monkeypatch.setattr(SequenceHandler, "eval_string",
+                        lambda *args: calls.append(args) or eval_string(*args))
+    seq.parameters_sequence()
+    seq.parameters_sequence()
+    assert len(calls) == 3
+    seq._sequences[0].expression = "[7]"
+    assert len(seq.parameters_sequence()) == 9
+    assert len(calls) == 4
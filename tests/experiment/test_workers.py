@@ -24,13 +24,15 @@
 import importlib
 import logging
 
+import numpy as np
 import pytest
 import os
 import tempfile
+import threading
 from time import sleep
 
-from pymeasure.experiment import Listener, Procedure
-from pymeasure.experiment.workers import Worker
+from pymeasure.experiment import Listener, Metadata, Procedure
+from pymeasure.experiment.workers import ProcessWorker, Worker
 from pymeasure.experiment.results import Results
 from data.procedure_for_testing import RandomProcedure
 
@@ -65,6 +67,147 @@ def test_worker_finish():
     assert new_results.data.shape == (100, 2)
 
 
+def test_worker_finish_binary_storage():
+    procedure = RandomProcedure()
+    procedure.iterations = 100
+    procedure.delay = 0.001
+    file = tempfile.mktemp(suffix='.pmb')
+    results = Results(procedure, file)
+    worker = Worker(results)
+    worker.start()
+    worker.join(timeout=20.0)
+
+    new_results = Results.load(file, procedure_class=RandomProcedure)
+    assert new_results.parameters['iterations'].value == 100
+    assert new_results.data.shape == (100, 2)
+    assert new_results.data['Iteration'].tolist() == list(range(100))
+
+
+@pytest.mark.parametrize("suffix", ('.csv', '.pmb'))
+def test_worker_records_block(suffix):
+    class BlockProcedure(Procedure):
+        DATA_COLUMNS = ['Iteration', 'Value']
+
+        def execute(self):
+            self.emit('results', {'Iteration': np.arange(1000), 'Value': np.linspace(0, 1, 1000)})
+            self.emit('results', {'Iteration': 1000, 'Value': 2.})
+
+    file = tempfile.mktemp(suffix=suffix)
+    results = Results(BlockProcedure(), file)
+    worker = Worker(results)
+    worker.start()
+    worker.join(timeout=20.0)
+
+    assert results.data.shape == (1001, 2)
+    assert results.data['Iteration'].tolist() == list(range(1001))
+    assert results.data['Value'].iloc[-2:].tolist() == [1., 2.]
+
+
+def test_worker_pushes_live_data():
+    proceed = threading.Event()
+
+    class WaitingProcedure(Procedure):
+        DATA_COLUMNS = ['Iteration', 'Value']
+
+        def execute(self):
+            for i in range(10):
+                self.emit('results', {'Iteration': i, 'Value': i / 2})
+            proceed.wait(timeout=10)
+
+    file = tempfile.mktemp()
+    results = Results(WaitingProcedure(), file)
+    worker = Worker(results)
+    worker.start()
+    for _ in range(200):
+        if len(results.data) == 10:
+            break
+        sleep(0.01)
+    assert results.live
+    assert results.data['Value'].tolist() == [i / 2 for i in range(10)]
+    proceed.set()
+    worker.join(timeout=20.0)
+
+    assert not results.live
+    assert results.data['Iteration'].tolist() == list(range(10))
+    loaded = Results.load(file, procedure_class=WaitingProcedure)
+    assert loaded.data.values.tolist() == results.data.values.tolist()
+
+
+def test_process_worker_finish():
+    procedure = RandomProcedure()
+    procedure.iterations = 100
+    procedure.delay = 0.001
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = ProcessWorker(results)
+    worker.start()
+    worker.join(timeout=20.0)
+
+    assert not worker.is_alive()
+    assert procedure.status == Procedure.FINISHED
+    assert worker.monitor_queue.queue[-1] is None
+    new_results = Results.load(file, procedure_class=RandomProcedure)
+    assert new_results.data.shape == (100, 2)
+    assert results.data['Iteration'].tolist() == list(range(100))
+
+
+def test_process_worker_stores_metadata_and_forwards_logs(caplog):
+    class MetadataProcedure(Procedure):
+        DATA_COLUMNS = ['Value']
+        pid = Metadata('PID', fget=os.getpid)
+
+        def execute(self):
+            logging.getLogger(__name__).info("Executing in process %d", os.getpid())
+            self.emit('results', {'Value': 1.})
+
+    procedure = MetadataProcedure()
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = ProcessWorker(results)
+    with caplog.at_level(logging.INFO):
+        worker.start()
+        worker.join(timeout=20.0)
+
+    assert procedure.pid != os.getpid()
+    assert f"Executing in process {procedure.pid}" in caplog.text
+    loaded = Results.load(file, procedure_class=MetadataProcedure)
+    assert loaded.procedure.metadata_objects()['pid'].value == str(procedure.pid)
+    assert loaded.data['Value'].tolist() == [1.]
+
+
+def test_process_worker_abort():
+    procedure = RandomProcedure()
+    procedure.iterations = 100000
+    procedure.delay = 0.01
+    results = Results(procedure, tempfile.mktemp())
+    worker = ProcessWorker(results)
+    worker.start()
+    while len(results.data) == 0:
+        sleep(0.01)
+    worker.stop()
+    worker.join(timeout=20.0)
+
+    assert procedure.status == Procedure.ABORTED
+    assert 0 < len(results.data) < 100000
+
+
+@pytest.mark.parametrize("exit_process", (False, True))
+def test_process_worker_failure(exit_process):
+    class FailingProcedure(Procedure):
+        def execute(self):
+            if exit_process:
+                os._exit(1)
+            raise ValueError("Failing on purpose")
+
+    procedure = FailingProcedure()
+    worker = ProcessWorker(Results(procedure, tempfile.mktemp()))
+    worker.start()
+    worker._relay.join(timeout=20.0)
+
+    assert procedure.status == Procedure.FAILED
+    assert worker.monitor_queue.queue[-1] is None
+
+
 def test_worker_closes_file_after_finishing():
     procedure = RandomProcedure()
     procedure.iterations = 100
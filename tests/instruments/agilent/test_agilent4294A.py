@@ -53,3 +53,24 @@ def test_get_stop_freq(freq):
     """ Test Agilent 4294A stop frequency getter """
     with expected_protocol(Agilent4294A, [("STOP?", freq), ],) as inst:
         assert freq == inst.stop_frequency
+
+
+def test_get_data():
+    with expected_protocol(
+            Agilent4294A,
+            [("TRAC?", "A"), ("POIN?", 2), ("OUTPSWPRM?", "1E3,2E3"),
+             ("TRAC A", None), ("OUTPDTRC?", "1,2,3,4"),
+             ("TRAC B", None), ("OUTPDTRC?", "5,6,7,8"),
+             ("TRAC A", None)],
+    ) as inst:
+        df = inst.get_data()
+        assert df.values.tolist() == [[1e3, 1, 2, 5, 6], [2e3, 3, 4, 7, 8]]
+
+
+def test_get_data_non_numeric_reply():
+    with expected_protocol(
+            Agilent4294A,
+            [("TRAC?", "A"), ("POIN?", 2), ("OUTPSWPRM?", "1E3,error")],
+    ) as inst:
+        with pytest.raises(ValueError, match="non-numeric"):
+            inst.get_data()
@@ -0,0 +1,114 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+
+import pytest
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.agilent.agilentB1500 import AgilentB1500
+
+SMU_NAMES = {1: "SMU1", 2: "SMU2"}
+
+FMT1 = "NAV+1.00000E+00,NBI-2.50000E-03,NAV+2.00000E+00,CBI+1.00000E-01"
+FMT21 = ("000AV+1.000000E+00,000BI-2.500000E-03,"
+         "000AV+2.000000E+00,008BI+1.000000E-01")
+SAMPLING = "NAX+1.00000E+00,NAT+5.00000E-04,NAI+1.00000E-06"
+FORMATS = {"FMT1": AgilentB1500._data_formatting_FMT1,
+           "FMT21": AgilentB1500._data_formatting_FMT21}
+
+
+def set_format(instr, output_format):
+    instr._data_format = instr._data_formatting(output_format, SMU_NAMES)
+
+
+@pytest.mark.parametrize("output_format, data", [("FMT1", FMT1), ("FMT21", FMT21)])
+def test_format_columns_matches_format_single(output_format, data):
+    formatting = FORMATS[output_format](SMU_NAMES)
+    columns = formatting.format_columns(data, 2)
+    singles = [formatting.format_single(element) for element in data.split(',')]
+    for index, (channel, data_name, statuses, values) in enumerate(columns):
+        expected = singles[index::2]
+        assert statuses.tolist() == [s[0] for s in expected]
+        assert [channel, data_name] * 2 == [x for s in expected for x in s[1:3]]
+        assert values.tolist() == [s[3] for s in expected]
+
+
+def test_format_columns_wrong_size():
+    formatting = FORMATS["FMT1"](SMU_NAMES)
+    with pytest.raises(ValueError):
+        formatting.format_columns(FMT1, 3)
+
+
+def test_format_columns_logs_distinct_status_once(caplog):
+    formatting = FORMATS["FMT1"](SMU_NAMES)
+    data = ",".join(["CAI+1.00000E-01"] * 5)
+    with caplog.at_level(logging.INFO):
+        formatting.format_columns(data, 5)
+    assert len(caplog.records) == 1
+    assert "SMU1" in caplog.records[0].getMessage()
+
+
+def test_read_data():
+    with expected_protocol(AgilentB1500, [(None, FMT1)]) as instr:
+        set_format(instr, "FMT1")
+        data = instr.read_data(2)
+    assert data.columns.tolist() == ["SMU1 Voltage (V)", "SMU2 Current (A)"]
+    assert data["SMU1 Voltage (V)"].tolist() == [1, 2]
+    assert data["SMU2 Current (A)"].tolist() == [-2.5e-3, 0.1]
+
+
+def test_read_data_sampling_index_int():
+    with expected_protocol(AgilentB1500, [(None, SAMPLING)]) as instr:
+        set_format(instr, "FMT1")
+        data = instr.read_data(1)
+    assert data.columns.tolist() == ["SMU1 Sampling index", "SMU1 Time (s)",
+                                     "SMU1 Current (A)"]
+    assert data["SMU1 Sampling index"].dtype.kind == "i"
+
+
+def test_read_channels():
+    with expected_protocol(AgilentB1500, [(None, FMT1[:32])]) as instr:
+        set_format(instr, "FMT1")
+        assert instr.read_channels(2) == (("N", "SMU1", "Voltage (V)", 1.0),
+                                          ("N", "SMU2", "Current (A)", -2.5e-3))
+
+
+def test_iter_channels_until_last_point():
+    with expected_protocol(AgilentB1500, [(None, FMT21 + "\r")]) as instr:
+        set_format(instr, "FMT21")
+        points = list(instr.iter_channels(2))
+    assert points == [
+        (("000", "SMU1", "Voltage Measurement (V)", 1.0),
+         ("000", "SMU2", "Current Measurement (A)", -2.5e-3)),
+        (("000", "SMU1", "Voltage Measurement (V)", 2.0),
+         ("008", "SMU2", "Current Measurement (A)", 0.1)),
+    ]
+
+
+def test_iter_channels_number_of_points():
+    with expected_protocol(AgilentB1500, [(None, FMT21[:38])]) as instr:
+        set_format(instr, "FMT21")
+        points = list(instr.iter_channels(2, number_of_points=1))
+    assert len(points) == 1
@@ -22,6 +22,9 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
+import pytest
+
 from pymeasure.test import expected_protocol
 
 from pymeasure.instruments.keithley import Keithley2400
@@ -47,3 +50,61 @@ def test_enable_source():
                            [("OUTPUT ON", None)],
                            ) as inst:
         inst.enable_source()
+
+
+def test_wait_for_buffer():
+    with expected_protocol(Keithley2400,
+                           [("*STB?", "0"), ("*STB?", "0"), ("*STB?", "65"), ("*STB?", "65")],
+                           ) as inst:
+        inst.wait_for_buffer(timeout=1)
+
+
+def test_wait_for_buffer_should_stop():
+    with expected_protocol(Keithley2400,
+                           [("*STB?", "0"), ("*STB?", "0")],
+                           ) as inst:
+        inst.wait_for_buffer(should_stop=lambda: True)
+
+
+def test_wait_for_buffer_timeout():
+    with expected_protocol(Keithley2400,
+                           [("*STB?", "0")] * 2,
+                           ) as inst:
+        with pytest.raises(TimeoutError, match="Keithley buffer"):
+            inst.wait_for_buffer(timeout=0)
+
+
+BUFFER = [1.5, -2.25e-3, 3e6]
+
+
+def test_buffer_data_ascii():
+    with expected_protocol(Keithley2400,
+                           [(":FORM:DATA ASCII", None),
+                            (":TRAC:DATA?", "1.5,-2.25e-3,3e6")],
+                           ) as inst:
+        assert list(inst.buffer_data) == BUFFER
+
+
+@pytest.mark.parametrize("buffer_format, big_endian, dtype, block", (
+    ("SREAL", False, "<f4", b"#0" + np.array(BUFFER, "<f4").tobytes() + b"\n"),
+    ("REAL,64", True, ">f8", b"#224" + np.array(BUFFER, ">f8").tobytes() + b"\n"),
+))
+def test_buffer_data_binary(buffer_format, big_endian, dtype, block):
+    byte_order = "NORM" if big_endian else "SWAP"
+    with expected_protocol(Keithley2400,
+                           [(f":FORM:DATA {buffer_format};:FORM:BORD {byte_order}", None),
+                            (":TRAC:DATA?", block),
+                            (":FORM:DATA ASCII", None)],
+                           ) as inst:
+        inst.buffer_format = buffer_format
+        inst.buffer_big_endian = big_endian
+        data = inst.buffer_data
+        assert data.dtype == np.float64
+        assert list(data) == list(np.array(BUFFER, dtype).astype(np.float64))
+
+
+def test_buffer_data_invalid_format():
+    with expected_protocol(Keithley2400, []) as inst:
+        inst.buffer_format = "BINARY"
+        with pytest.raises(ValueError, match="BINARY"):
+            inst.buffer_data
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pymeasure.test import expected_protocol
@@ -859,3 +860,67 @@ def test_trigger_single_autozero():
              (b'AZER:ONCE', None)],
     ) as inst:
         assert inst.trigger_single_autozero() is None
+
+
+SCANS = [[1.5, 2.5], [-1e-3, -2e-3], [10.0, 20.0]]  # channel 1, 2, 3 of two scans
+
+
+def test_scanned_data_ascii():
+    with expected_protocol(
+            KeithleyDMM6500,
+            [(b'*LANG SCPI', None),
+             (b':FORM:DATA ASCII', None),
+             (b':TRAC:ACT:STAR?', b'1'),
+             (b':TRAC:ACT:END?', b'6'),
+             (b':TRAC:DATA? 1, 6', b'1.5,-1e-3,10,2.5,-2e-3,20'),
+             (b':ROUT:SCAN:CRE?', b'(@101:103)')],
+    ) as inst:
+        assert inst.scanned_data() == SCANS
+
+
+@pytest.mark.parametrize("big_endian", (False, True))
+def test_scanned_data_binary(big_endian):
+    dtype = ">f8" if big_endian else "<f8"
+    block = np.array(SCANS, dtype=dtype).T.tobytes()
+    with expected_protocol(
+            KeithleyDMM6500,
+            [(b'*LANG SCPI', None),
+             (b':TRAC:ACT:STAR?', b'1'),
+             (b':TRAC:ACT:END?', b'6'),
+             (f':FORM:DATA REAL;:FORM:BORD {"NORM" if big_endian else "SWAP"}'.encode(), None),
+             (b':TRAC:DATA? 1, 6', b'#248' + block + b'\n'),
+             (b':FORM:DATA ASCII', None),
+             (b':ROUT:SCAN:CRE?', b'(@101:103)')],
+    ) as inst:
+        data = inst.scanned_data(binary=True, big_endian=big_endian)
+        assert data.shape == (3, 2)
+        assert data.tolist() == SCANS
+
+
+def test_scanned_data_binary_incomplete_scan():
+    # The buffer holds the first two channels of the second scan only
+    block = np.array(SCANS, dtype="<f8").T.tobytes()[:-8]
+    with expected_protocol(
+            KeithleyDMM6500,
+            [(b'*LANG SCPI', None),
+             (b':TRAC:ACT:STAR?', b'1'),
+             (b':TRAC:ACT:END?', b'5'),
+             (b':FORM:DATA REAL;:FORM:BORD SWAP', None),
+             (b':TRAC:DATA? 1, 5', b'#240' + block + b'\n'),
+             (b':FORM:DATA ASCII', None),
+             (b':ROUT:SCAN:CRE?', b'(@101:103)')],
+    ) as inst:
+        data = inst.scanned_data(binary=True)
+        assert data.shape == (3, 1)
+        assert data.tolist() == [[row[0]] for row in SCANS]
+
+
+def test_scanned_data_binary_raw():
+    with expected_protocol(
+            KeithleyDMM6500,
+            [(b'*LANG SCPI', None),
+             (b':FORM:DATA REAL;:FORM:BORD SWAP', None),
+             (b':TRAC:DATA? 1, 2', b'#216' + np.array([1.5, 2.5], "<f8").tobytes() + b'\n'),
+             (b':FORM:DATA ASCII', None)],
+    ) as inst:
+        assert inst.scanned_data(1, 2, raw=True, binary=True).tolist() == [1.5, 2.5]
@@ -22,6 +22,9 @@
 # THE SOFTWARE.
 #
 
+from decimal import Decimal
+
+import numpy as np
 import pytest
 
 from pymeasure.instruments.teledyne.teledyne_oscilloscope import sanitize_source
@@ -341,6 +344,60 @@ def test_download_two_points():
         assert y[1] == y[0]
 
 
+def test_download_wrong_number_of_points():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"WFSU SP,1", None),
+             (b"WFSU NP,2", None),
+             (b"WFSU FP,0", None),
+             (b"SANU? C1", b"7.00E+06"),
+             (b"WFSU NP,2", None),
+             (b"WFSU FP,0", None),
+             (b"C1:WF? DAT2", b"DAT2,#9000000001" + b"\x01" + b"\n\n"),
+             ],
+            connection_attributes={'chunk_size': 0},
+    ) as instr:
+        with pytest.raises(ValueError, match="Number of requested points"):
+            instr.download_waveform(source="c1", requested_points=2, sparsing=1)
+
+
+def test_download_retry_and_progress():
+    progress = []
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"WFSU SP,1", None),
+             (b"WFSU NP,2", None),
+             (b"WFSU FP,0", None),
+             (b"SANU? C1", b"7.00E+06"),
+             (b"WFSU NP,2", None),
+             (b"WFSU FP,0", None),
+             (b"C1:WF? DAT2", b"DAT2,#9000000002" + b"\x01\x01" + b"\r\n"),
+             (b"WFSU NP,2", None),
+             (b"WFSU FP,0", None),
+             (b"C1:WF? DAT2", b"DAT2,#9000000002" + b"\x01\x02" + b"\n\n"),
+             (b"WFSU?", b"SP,1,NP,2,FP,0"),
+             (b"ACQW?", b"SAMPLING"),
+             (b"SARA?", b"1.00E+09"),
+             (b"SAST?", b"Stop"),
+             (b"MSIZ?", b"7M"),
+             (b"TDIV?", b"5.00E-04"),
+             (b"TRDL?", b"-0.00E+00"),
+             (b"SANU? C1", b"7.00E+06"),
+             (b"C1:VDIV?", b"5.00E-02"),
+             (b"C1:OFST?", b"-1.50E-01"),
+             (b"C1:UNIT?", b"V")
+             ],
+            connection_attributes={'chunk_size': 0},
+    ) as instr:
+        y, x, preamble = instr.download_waveform(source="c1", requested_points=2, sparsing=1,
+                                                 retries=1, progress=progress.append)
+        assert progress == [100]
+        assert preamble["transmitted_points"] == 2
+        assert y[1] == 2 * 0.05 / 25. + 0.150
+
+
 def test_trigger():
     with expected_protocol(
             LeCroyT3DSO1204,
@@ -469,3 +526,38 @@ def test_intensity():
 
 if __name__ == '__main__':
     pytest.main()
+
+
+def _process_data_elementwise(ydata, preamble, grid_number=14):
+    """Reference implementation scaling one point at a time."""
+    def _scale_data(y):
+        if preamble["source"] == "MATH":
+            value = int.from_bytes([y], byteorder='big', signed=False) * preamble["ydiv"] / 25.
+            value -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
+        else:
+            value = int.from_bytes([y], byteorder='big', signed=True) * preamble["ydiv"] / 25.
+            value -= preamble["yoffset"]
+        return value
+
+    def _scale_time(x):
+        return float(Decimal(-preamble["xdiv"] * grid_number / 2.) +
+                     Decimal(float(x * preamble["sparsing"])) /
+                     Decimal(preamble["sampling_rate"]))
+
+    return ([_scale_data(y) for y in ydata],
+            [_scale_time(x) for x in range(len(ydata))])
+
+
+@pytest.mark.parametrize("source", ["C1", "MATH"])
+@pytest.mark.parametrize("sparsing, sampling_rate", [(1, 1e9), (4, 2.5e8), (7, 1.234e6)])
+def test_process_data_matches_elementwise_scaling(source, sparsing, sampling_rate):
+    ydata = np.random.default_rng(0).integers(0, 256, 5000, dtype=np.uint8)
+    preamble = {"source": source, "ydiv": 0.05, "yoffset": -0.15, "xdiv": 5e-4,
+                "sparsing": sparsing, "sampling_rate": sampling_rate}
+    with expected_protocol(LeCroyT3DSO1204, [(b"CHDR OFF", None)]) as instr:
+        y, x, returned_preamble = instr._process_data(ydata, preamble)
+    y_expected, x_expected = _process_data_elementwise(ydata, preamble)
+    assert returned_preamble is preamble
+    assert y.tolist() == y_expected
+    # Equal up to the rounding of the time offset, which is a float in both implementations
+    np.testing.assert_allclose(x, x_expected, rtol=1e-15, atol=np.spacing(7 * preamble["xdiv"]))
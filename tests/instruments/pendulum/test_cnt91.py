@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pymeasure.instruments.pendulum import CNT91
@@ -227,3 +228,37 @@ def test_read_buffer(comm_pairs, args, kwargs, value):
         comm_pairs,
     ) as inst:
         assert inst.read_buffer(*args, **kwargs) == value
+
+
+def test_read_buffer_waits_for_completion():
+    with expected_protocol(
+        CNT91,
+        [(b"*OPC?", b"0\n"), (b"*OPC?", b"1\n"),
+         (b":FETC:ARR? 4", b"+1.0E+06,+2.0E+06,+3.0E+06,+4.0E+06\n")],
+    ) as inst:
+        assert inst.read_buffer(4) == [1e6, 2e6, 3e6, 4e6]
+
+
+def test_read_buffer_timeout():
+    with expected_protocol(
+        CNT91,
+        [(b"*OPC?", b"0\n")],
+    ) as inst:
+        with pytest.raises(TimeoutError):
+            inst.read_buffer(timeout=0)
+
+
+def test_read_buffer_binary_equals_ascii():
+    ascii_reply = b"+9.999992030E+06,+9.999992000E+06,+9.999992043E+06\n"
+    values = [9999992.03, 9999992.0, 9999992.043]
+    block = b"#224" + np.array(values, dtype=">f8").tobytes() + b"\n"
+    with expected_protocol(
+        CNT91,
+        [(b"*OPC?", b"1\n"), (b":FETC:ARR? MAX", ascii_reply),
+         (b"*OPC?", b"1\n"), (b"FORM REAL", None), (b":FETC:ARR? MAX", block),
+         (b"FORM ASC", None)],
+    ) as inst:
+        ascii_values = inst.read_buffer()
+        binary_values = inst.read_buffer(binary=True)
+        assert isinstance(binary_values, np.ndarray)
+        assert binary_values.tolist() == ascii_values == values
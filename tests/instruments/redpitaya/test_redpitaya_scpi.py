@@ -1,5 +1,6 @@
 import datetime
 
+import numpy as np
 import pytest
 
 from pymeasure.test import expected_protocol
@@ -389,3 +390,14 @@ def test_digital_reset():
             [(b'DIG:RST', None)],
     ) as inst:
         assert inst.digital_reset() is None
+
+
+def test_get_data_binary():
+    raw = np.array([0, 2**16 - 1, 2**15], dtype="<i8")
+    with expected_protocol(
+            RedPitayaScpi,
+            [(b'ACQ:SOUR1:DATA?', b'#224' + raw.tobytes() + b'\r\n'),
+             (b'ACQ:SOUR1:GAIN?', b'LV')],
+    ) as inst:
+        data = inst.ain1.get_data(format='BIN')
+        assert data == pytest.approx([-1, 1, 1 / (2**16 - 1)])
@@ -93,3 +93,33 @@ def test_output_conversion():
     ) as inst:
         conv = inst.output_conversion("X")
         assert conv(inst.x) == pytest.approx(-2.66e-7)
+
+
+def test_wait_for_buffer():
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "3"), ("SPTS?", "7"), ("SPTS?", "10"), ("PAUS", None)],
+    ) as inst:
+        assert inst.wait_for_buffer(10) is None
+
+
+def test_wait_for_buffer_aborted():
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "3")],
+    ) as inst:
+        assert inst.wait_for_buffer(10, has_aborted=lambda: True) is False
+
+
+def test_fill_buffer():
+    with expected_protocol(
+        SR830,
+        [("SPTS?", "0"), ("SPTS?", "0"), ("SPTS?", "2"),
+         ("TRCB?1,0,2", b"\x00\x00\x80\x3f\x00\x00\x00\x40"),
+         ("TRCB?2,0,2", b"\x00\x00\x40\x40\x00\x00\x80\x40"),
+         ("SPTS?", "3"), ("PAUS", None),
+         ("TRCB?1,2,1", b"\x00\x00\xa0\x40"), ("TRCB?2,2,1", b"\x00\x00\xc0\x40")],
+    ) as inst:
+        ch1, ch2 = inst.fill_buffer(3)
+        assert ch1.tolist() == [1, 2, 5]
+        assert ch2.tolist() == [3, 4, 6]
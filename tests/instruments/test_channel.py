@@ -116,6 +116,10 @@ class TestChannelCommunication:
         ch.read_binary_values()
         assert ch.parent.method_calls == [mock.call.read_binary_values()]
 
+    def test_read_binary_block(self, ch):
+        ch.read_binary_block(dtype=int)
+        assert ch.parent.method_calls == [mock.call.read_binary_block(dtype=int)]
+
     def test_check_errors(self, ch):
         ch.check_errors()
         assert ch.parent.method_calls == [mock.call.check_errors()]
@@ -23,7 +23,10 @@
 #
 
 import logging
+from inspect import getmembers
+from unittest import mock
 
+import numpy as np
 import pytest
 
 from pymeasure.units import ureg
@@ -396,6 +399,33 @@ class TestInheritanceWithChildren:
         assert parent.function.id == "overridden"
 
 
+class TestClassMetadata:
+    def test_computed_once_per_class(self):
+        class Parent(MultiChannelParent):
+            pass
+
+        Parent(ProtocolAdapter())
+        with mock.patch("pymeasure.instruments.common_base.getmembers",
+                        wraps=getmembers) as patched:
+            Parent(ProtocolAdapter())
+        patched.assert_not_called()
+
+    def test_subclasses_have_own_metadata(self):
+        class Parent(MultiChannelParent):
+            pass
+
+        class Subclass(Parent):
+            extra = CommonBase.ChannelCreator(GenericBase, "extra")
+
+        Parent(ProtocolAdapter())
+        assert isinstance(Subclass(ProtocolAdapter()).extra, GenericBase)
+        assert not hasattr(Parent(ProtocolAdapter()), "extra")
+
+    def test_special_names(self):
+        assert GenericBase._get_class_metadata(GenericBase)[0] >= {
+            "fake_ctrl_values", "fake_setting_validator", "fake_measurement_get_process"}
+
+
 # Test MultiChannelCreator
 @pytest.mark.parametrize("args, pairs, kwargs", (
         ((Child, ["A", "B"]), [(Child, "A"), (Child, "B")], {'prefix': "ch_"}),
@@ -445,6 +475,43 @@ def test_values(value, kwargs, result):
     assert cb.values(value, **kwargs) == result
 
 
+@pytest.mark.parametrize("value, kwargs, result",
+                         (("5,6,7", {}, [5, 6, 7]),
+                          ("5.6.7", {'separator': '.'}, [5, 6, 7]),
+                          (" 5e3, -6, nan", {}, [5e3, -6, np.nan]),
+                          ("0,5,7.1", {'cast': bool}, [False, True, True]),
+                          ("5,6,7", {'cast': int}, [5, 6, 7]),
+                          ("5,6,7", {'cast': np.float32}, [5, 6, 7]),
+                          ("x5x", {'preprocess_reply': lambda v: v.strip("x")}, [5]),
+                          ))
+def test_values_as_array(value, kwargs, result):
+    cb = CommonBaseTesting(FakeAdapter(), "test")
+    array = cb.values(value, as_array=True, **kwargs)
+    assert isinstance(array, np.ndarray)
+    assert array.dtype != object
+    np.testing.assert_array_equal(array, result)
+
+
+@pytest.mark.parametrize("value, kwargs, result",
+                         (("5,X,7", {}, [5, "X", 7]),
+                          ("5,6,", {}, [5, 6, ""]),
+                          ("5.5,6", {'cast': int}, ["5.5", 6]),
+                          ("X,Y,Z", {'maxsplit': 1}, ["X", "Y,Z"]),
+                          ))
+def test_values_as_array_fallback(value, kwargs, result):
+    cb = CommonBaseTesting(FakeAdapter(), "test")
+    array = cb.values(value, as_array=True, **kwargs)
+    assert array.dtype == object
+    assert array.tolist() == result
+
+
+def test_values_as_array_custom_cast():
+    cb = CommonBaseTesting(FakeAdapter(), "test")
+    array = cb.values("1,2", as_array=True, cast=lambda v: float(v) * 2)
+    np.testing.assert_array_equal(array, [2., 4.])
+    assert array.dtype == np.float64
+
+
 def test_global_preprocess_reply():
     with pytest.warns(FutureWarning, match="deprecated"):
         cb = CommonBaseTesting(FakeAdapter(), preprocess_reply=lambda v: v.strip("x"))
@@ -635,6 +702,34 @@ def test_control_dict_str_map(dynamic):
     assert fake.read() == '3'
 
 
+def test_control_dict_map_returns_first_key():
+    class Fake(FakeBase):
+        x = CommonBase.control(
+            "", "%d", "",
+            values={'A': 1, 'B': 1, 'C': 2},
+            map_values=True,
+        )
+
+    fake = Fake()
+    fake.x = 'B'
+    assert fake.x == 'A'
+
+
+def test_control_dict_map_dynamic_values_override():
+    class Fake(FakeBase):
+        x = CommonBase.control(
+            "", "%d", "",
+            values={'X': 1, 'Y': 2},
+            map_values=True,
+            dynamic=True,
+        )
+
+    fake = Fake()
+    fake.x_values = {'Q': 1, 'R': 2}
+    fake.x = 'R'
+    assert fake.x == 'R'
+
+
 def test_value_not_in_map(fake):
     fake.parent._buffer = "123"
     with pytest.raises(KeyError, match="not found in mapped values"):
@@ -23,14 +23,18 @@
 #
 
 
+import asyncio
+import threading
 import time
 from unittest import mock
 
+import numpy as np
 import pytest
 
 from pymeasure.test import expected_protocol
-from pymeasure.instruments import Instrument, Channel
+from pymeasure.instruments import Instrument, Channel, SCPIMixin
 from pymeasure.adapters import FakeAdapter, ProtocolAdapter
+from pymeasure.instruments.batch import _Recording
 from pymeasure.instruments.fakes import FakeInstrument
 from pymeasure.instruments.validators import truncated_range
 
@@ -190,6 +194,10 @@ class TestInstrumentCommunication:
         instr.write_binary_values("abc", [5, 6, 7])
         assert instr.adapter.method_calls == [mock.call.write_binary_values("abc", [5, 6, 7])]
 
+    def test_read_binary_block(self, instr):
+        instr.read_binary_block(dtype=np.int16)
+        assert instr.adapter.method_calls == [mock.call.read_binary_block(dtype=np.int16)]
+
 
 class TestWaiting:
     @pytest.fixture()
@@ -220,6 +228,11 @@ class TestWaiting:
         instr.binary_values("abc")
         assert instr.waited is None
 
+    def test_binary_block_calls_wait_with_delay(self, instr):
+        instr.adapter.comm_pairs = [("abc", b"#12\x01\x02\n")]
+        assert list(instr.binary_block("abc", query_delay=10)) == [1, 2]
+        assert instr.waited == 10
+
 
 @pytest.mark.parametrize("method, write, reply", (("id", "*IDN?", "xyz"),
                                                   ("complete", "*OPC?", "1"),
@@ -299,3 +312,195 @@ class TestMultiFunctionality:
                 [("X:Volt 123.456000", None)]
         ) as inst:
             inst.f_X.voltage = 123.456
+
+
+# Batch
+class BatchInstrument(SCPIMixin, Instrument):
+    voltage = Instrument.measurement("VOLT?", "Voltage.")
+    mode = Instrument.control(
+        "MODE?", "MODE %d", "Mapped mode.",
+        values={"low": 0, "high": 1}, map_values=True, get_process=lambda v: v - 1)
+    source = Instrument.control("SOUR?", "SOUR %g", "Source level.", check_set_errors=True)
+
+    def __init__(self, adapter, name="BatchInstrument", **kwargs):
+        super().__init__(adapter, name, **kwargs)
+        self.add_child(GenericChannel, "A")
+
+
+class TestBatch:
+    def test_compound_reads(self):
+        with expected_protocol(
+                BatchInstrument,
+                [(":VOLT?;:MODE?;:C1:measurement?", "1.5;2;3")],
+        ) as inst:
+            inst.ch_A.id = 1
+            with inst.batch() as batch:
+                voltage = batch.get("voltage")
+                mode = batch.get("mode")
+                measurement = batch.get("fake_measurement", obj=inst.ch_A)
+            assert voltage.value == 1.5
+            assert mode.value == "high"
+            assert measurement.value == "Z"
+
+    def test_state_is_thread_local(self):
+        with expected_protocol(BatchInstrument, [(":MODE 1", None)]) as inst:
+            inst._batch_state = _Recording()
+            try:
+                # Another thread communicates with the device instead of being recorded
+                thread = threading.Thread(target=inst.write, args=(":MODE 1",))
+                thread.start()
+                thread.join()
+                inst.write(":VOLT?")
+                assert inst._batch_state.commands == [":VOLT?"]
+            finally:
+                inst._batch_state = None
+
+    def test_compound_reads_and_writes(self):
+        with expected_protocol(
+                BatchInstrument,
+                [(":MODE 0;*OPC?;:VOLT?", "1;4")],
+        ) as inst:
+            with inst.batch() as batch:
+                batch.set("mode", "low")
+                complete = batch.get("complete")
+                voltage = batch.get("voltage")
+            assert complete.value == "1"
+            assert voltage.value == 4
+
+    def test_item_with_error_check_executed_sequentially(self):
+        with expected_protocol(
+                BatchInstrument,
+                [(":VOLT?;:MODE?", "1;2"),
+                 ("SOUR 5", None), ("SYST:ERR?", "0,no error"),
+                 ("VOLT?", "3")],
+        ) as inst:
+            with inst.batch() as batch:
+                first = batch.get("voltage")
+                batch.get("mode")
+                batch.set("source", 5)
+                last = batch.get("voltage")
+            assert first.value == 1
+            assert last.value == 3
+
+    def test_sequential_without_separator(self):
+        with expected_protocol(
+                ChannelInstrument,
+                [("C1:control?", "5"), ("C1:setting 3", None), ("C1:measurement?", "1")],
+        ) as inst:
+            inst.ch_A.id = 1
+            with inst.batch() as batch:
+                control = batch.get("fake_ctrl", obj=inst.ch_A)
+                batch.set("fake_setting", 3, obj=inst.ch_A)
+                measurement = batch.get("fake_measurement", obj=inst.ch_A)
+            assert control.value == 5
+            assert measurement.value == "X"
+
+    def test_wrong_reply_count(self):
+        with expected_protocol(
+                BatchInstrument,
+                [(":VOLT?;:MODE?", "1")],
+        ) as inst:
+            with pytest.raises(ValueError, match="replies"):
+                with inst.batch() as batch:
+                    batch.get("voltage")
+                    batch.get("mode")
+
+
+@pytest.mark.parametrize("should_stop, result", ((lambda: False, True), (lambda: True, False)))
+def test_wait_for_srq_polls_status_byte(should_stop, result):
+    replies = [("*STB?", "0")] + ([("*STB?", "65")] if result else [])
+    with expected_protocol(Instrument, replies, name="Test", includeSCPI=False) as instr:
+        assert instr.wait_for_srq(timeout=1, should_stop=should_stop) is result
+
+
+def test_wait_for_srq_uses_adapter():
+    adapter = ProtocolAdapter()
+    adapter.wait_for_srq = mock.Mock(return_value=True)
+    instr = Instrument(adapter, "Test", includeSCPI=False)
+    assert instr.wait_for_srq(timeout=3, should_stop=None) is True
+    adapter.wait_for_srq.assert_called_once_with(timeout=3, delay=0.1, should_stop=None)
+
+
+class TestReadChunked:
+    @staticmethod
+    def read_chunk(instr):
+        def read_chunk(first, values):
+            instr.write(f"CURV? {first},{len(values)}")
+            instr.read_binary_block(out=values)
+        return read_chunk
+
+    def test_chunks_into_one_array(self):
+        progress = []
+        with expected_protocol(
+                Instrument,
+                [("CURV? 0,2", b"#12ab\n"), ("CURV? 2,2", b"#12cd\n"), ("CURV? 4,1", b"#11e\n")],
+                name="Test", includeSCPI=False) as instr:
+            data = instr.read_chunked(self.read_chunk(instr), 5, 2, progress=progress.append)
+        assert data.tobytes() == b"abcde"
+        assert progress == [40, 80, 100]
+
+    def test_into_out(self):
+        out = np.zeros(4, dtype=np.uint8)
+        with expected_protocol(Instrument, [("CURV? 0,3", b"#13abc\n")],
+                               name="Test", includeSCPI=False) as instr:
+            data = instr.read_chunked(self.read_chunk(instr), 3, 5, out=out)
+        assert data.base is out
+        assert out.tobytes() == b"abc\x00"
+
+    def test_cancel_and_resume(self):
+        out = np.empty(4, dtype=np.uint8)
+        stop = mock.Mock(side_effect=[False, True])
+        with expected_protocol(Instrument, [("CURV? 0,2", b"#12ab\n")],
+                               name="Test", includeSCPI=False) as instr:
+            data = instr.read_chunked(self.read_chunk(instr), 4, 2, out=out, should_stop=stop)
+        assert data.tobytes() == b"ab"
+        with expected_protocol(Instrument, [("CURV? 2,2", b"#12cd\n")],
+                               name="Test", includeSCPI=False) as instr:
+            data = instr.read_chunked(self.read_chunk(instr), 4, 2, out=out, start=len(data))
+        assert data.tobytes() == b"abcd"
+
+    def test_retry_failed_chunk(self):
+        instr = Instrument(ProtocolAdapter(), "Test", includeSCPI=False)
+        read_chunk = mock.Mock(side_effect=[None, TimeoutError, None])
+        with mock.patch.object(instr.adapter, "flush_read_buffer") as flush:
+            data = instr.read_chunked(read_chunk, 4, 2, retries=1)
+        assert len(data) == 4
+        assert [c.args[0] for c in read_chunk.call_args_list] == [0, 2, 2]
+        flush.assert_called_once_with()
+
+    def test_retries_exhausted(self):
+        instr = Instrument(ProtocolAdapter(), "Test", includeSCPI=False)
+        read_chunk = mock.Mock(side_effect=TimeoutError)
+        with mock.patch.object(instr.adapter, "flush_read_buffer"):
+            with pytest.raises(TimeoutError):
+                instr.read_chunked(read_chunk, 4, 2, retries=2)
+        assert read_chunk.call_count == 3
+
+
+class TestAsync:
+    def test_ask_async(self):
+        with expected_protocol(Instrument, [("*IDN?", "Test instrument")],
+                               name="Test", includeSCPI=False) as instr:
+            assert asyncio.run(instr.ask_async("*IDN?")) == "Test instrument"
+
+    def test_property_access_of_channel(self):
+        with expected_protocol(ChannelInstrument, [("CA:control 5", None), ("CA:control?", "7")],
+                               includeSCPI=False) as instr:
+
+            async def access():
+                await instr.ch_A.set_async("fake_ctrl", 5)
+                return await instr.ch_A.get_async("fake_ctrl")
+
+            assert asyncio.run(access()) == 7
+
+    def test_instruments_communicate_concurrently(self):
+        instruments = [Instrument(ProtocolAdapter([("Q", "A")]), "Test", includeSCPI=False)
+                       for _ in range(4)]
+
+        async def poll():
+            return await asyncio.gather(*(i.ask_async("Q", query_delay=0.2)
+                                          for i in instruments))
+
+        start = time.perf_counter()
+        assert asyncio.run(poll()) == ["A"] * 4
+        assert time.perf_counter() - start < 0.6
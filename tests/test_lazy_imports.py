@@ -0,0 +1,71 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import subprocess
+import sys
+
+import pytest
+
+import pymeasure.adapters
+import pymeasure.experiment
+
+
+def loaded_modules(code):
+    """Run `code` in a fresh interpreter and return the names of all loaded modules."""
+    output = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize("code, unwanted", (
+    ("import pymeasure", {"importlib.metadata"}),
+    ("import pymeasure.experiment", {"pandas", "pint", "zmq"}),
+    ("from pymeasure.experiment import Procedure, FloatParameter", {"pandas", "pint", "zmq"}),
+    ("from pymeasure.instruments.keithley import Keithley2400", {"pyvisa", "serial", "pint"}),
+))
+def test_import_does_not_load(code, unwanted):
+    assert not unwanted & loaded_modules(code)
+
+
+@pytest.mark.parametrize("module, name", (
+    (pymeasure.adapters, "VISAAdapter"),
+    (pymeasure.adapters, "PrologixAdapter"),
+    (pymeasure.experiment, "Results"),
+    (pymeasure.experiment, "Worker"),
+))
+def test_lazy_names(module, name):
+    assert name in dir(module)
+    assert getattr(module, name).__name__ == name
+
+
+@pytest.mark.parametrize("module", (pymeasure.adapters, pymeasure.experiment))
+def test_unknown_name(module):
+    with pytest.raises(AttributeError):
+        module.NonExistent
+
+
+def test_version():
+    assert isinstance(pymeasure.__version__, str)
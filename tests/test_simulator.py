@@ -0,0 +1,193 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import socket
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from pymeasure.adapters import SerialAdapter
+from pymeasure.instruments import Instrument
+from pymeasure.simulator import (SimulatedInstrument, SimulatedPrologix, SerialServer,
+                                 TCPServer, ieee_block)
+
+posix_only = pytest.mark.skipif(sys.platform == "win32",
+                                reason="Pseudo terminals are only available on POSIX.")
+
+
+@pytest.fixture
+def model():
+    model = SimulatedInstrument(seed=1)
+    model.add_control("VOLT", 0)
+    model.add_buffer("TRAC:DATA?", [1, 2.5, -3])
+    model.add_waveform("WAV:DATA?", [-1, 0, 1], dtype="<i2")
+    return model
+
+
+def test_ieee_block():
+    assert ieee_block(b"hello") == b"#15hello"
+    assert ieee_block(bytes(12)) == b"#212" + bytes(12)
+
+
+class TestSimulatedInstrument:
+    def test_idn(self, model):
+        assert model.handle("*IDN?") == (b"PyMeasure,SimulatedInstrument,0,0\n", 0)
+
+    def test_control(self, model):
+        assert model.handle("VOLT 5") == (None, 0)
+        assert model.values["VOLT"] == "5"
+        assert model.handle("VOLT?")[0] == b"5\n"
+
+    def test_buffer(self, model):
+        assert model.handle("TRAC:DATA?")[0] == b"1,2.5,-3\n"
+
+    def test_waveform(self, model):
+        assert model.handle("WAV:DATA?")[0] == b"#16\xff\xff\x00\x00\x01\x00\n"
+
+    def test_latest_response_wins(self, model):
+        model.add_response(r"VOLT\?", "7", latency=0.5)
+        assert model.handle("VOLT?") == (b"7\n", 0.5)
+
+    def test_callable_response(self, model):
+        model.add_response(r"ECHO (\w+)", lambda match: match[1].upper())
+        assert model.handle("ECHO abc")[0] == b"ABC\n"
+
+    def test_unknown_command(self, model, caplog):
+        assert model.handle("UNKNOWN") == (None, 0)
+        assert "UNKNOWN" in caplog.text
+
+    def test_jitter(self):
+        model = SimulatedInstrument(latency=0.01, jitter=0.001, seed=5)
+        latencies = [model.handle("*IDN?")[1] for _ in range(200)]
+        assert min(latencies) >= 0
+        assert np.mean(latencies) == pytest.approx(0.01, abs=0.0005)
+        assert np.std(latencies) == pytest.approx(0.001, rel=0.3)
+
+    def test_transfer_time(self, model):
+        assert model.transfer_time(1000) == 0
+        model.bandwidth = 100
+        assert model.transfer_time(1000) == 10
+
+
+class TestSimulatedPrologix:
+    @pytest.fixture
+    def prologix(self, model):
+        return SimulatedPrologix({5: model, 7: SimulatedInstrument(idn="other")})
+
+    def test_read(self, prologix):
+        prologix.handle("++addr 5")
+        assert prologix.handle("VOLT?") == (None, 0)
+        assert prologix.handle("++read eoi")[0] == b"0\n"
+        assert prologix.handle("++read eoi")[0] is None
+
+    def test_address_selection(self, prologix):
+        prologix.handle("++addr 7")
+        prologix.handle("*IDN?")
+        assert prologix.handle("++read eoi")[0] == b"other\n"
+        assert prologix.handle("++addr")[0] == b"7\n"
+
+    def test_auto(self, prologix):
+        prologix.handle("++addr 5")
+        prologix.handle("++auto 1")
+        assert prologix.handle("VOLT?")[0] == b"0\n"
+
+    def test_gpib_transfer_time(self, prologix, model):
+        model.bandwidth = 10
+        prologix.handle("++addr 5")
+        prologix.handle("TRAC:DATA?")
+        assert prologix.handle("++read eoi") == (b"1,2.5,-3\n", 0.9)
+
+    def test_unknown_address(self, prologix, caplog):
+        prologix.handle("++addr 9")
+        assert prologix.handle("*IDN?") == (None, 0)
+        assert "address 9" in caplog.text
+
+
+class TestTCPServer:
+    def test_query(self, model):
+        with TCPServer(model) as server:
+            assert server.resource_name == f"TCPIP::127.0.0.1::{server.port}::SOCKET"
+            with socket.create_connection((server.host, server.port), timeout=1) as client:
+                client.sendall(b"VOLT 3\nVOLT?\n")
+                assert client.recv(100) == b"3\n"
+
+    def test_latency(self, model):
+        model.latency = 0.05
+        with TCPServer(model) as server:
+            with socket.create_connection((server.host, server.port), timeout=1) as client:
+                start = time.perf_counter()
+                client.sendall(b"*IDN?\n")
+                client.recv(100)
+                assert time.perf_counter() - start >= 0.05
+
+    def test_visa_adapter(self, model):
+        pytest.importorskip("pyvisa_py")
+        from pymeasure.adapters import VISAAdapter
+        with TCPServer(model) as server:
+            instr = Instrument(VISAAdapter(server.resource_name, visa_library="@py",
+                                           read_termination="\n", write_termination="\n"),
+                               "Simulated", includeSCPI=False)
+            assert instr.ask("VOLT?") == "0"
+            instr.adapter.close()
+
+
+@posix_only
+class TestSerialServer:
+    @pytest.fixture
+    def instr(self, model):
+        with SerialServer(model) as server:
+            adapter = SerialAdapter(server.port, timeout=1, read_termination="\n",
+                                    write_termination="\n")
+            yield Instrument(adapter, "Simulated", includeSCPI=False)
+            adapter.close()
+
+    def test_control(self, instr):
+        instr.write("VOLT 5")
+        assert instr.ask("VOLT?") == "5"
+
+    def test_buffer(self, instr):
+        assert instr.values("TRAC:DATA?") == [1, 2.5, -3]
+
+    def test_waveform(self, instr):
+        instr.write("WAV:DATA?")
+        assert instr.read_bytes(11) == b"#16\xff\xff\x00\x00\x01\x00\n"
+
+    def test_bandwidth(self, instr, model):
+        model.bandwidth = 1000
+        start = time.perf_counter()
+        instr.values("TRAC:DATA?")
+        assert time.perf_counter() - start >= 0.009
+
+    def test_prologix(self, model):
+        prologix = SimulatedPrologix({5: model})
+        with SerialServer(prologix) as server:
+            adapter = SerialAdapter(server.port, timeout=1, read_termination="\n",
+                                    write_termination="\n")
+            adapter.write("++addr 5")
+            adapter.write("VOLT?")
+            adapter.write("++read eoi")
+            assert adapter.read() == "0"
+            adapter.close()